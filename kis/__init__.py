@@ -1,5 +1,6 @@
 from kis.core.domestic import DomesticClient
 from kis.core.overseas import OverseasClient
+from kis.core.pool import ClientPool
 from kis.utils.logger import configure_logger
 
 configure_logger()
@@ -7,4 +8,5 @@ configure_logger()
 __all__ = [
     "DomesticClient",
     "OverseasClient",
+    "ClientPool",
 ]
@@ -8,6 +8,9 @@ LIB_PATH = os.path.realpath(os.path.dirname(__file__))
 KIS_APP_KEY = os.getenv("KIS_APP_KEY", "")
 KIS_APP_SECRET = os.getenv("KIS_APP_SECRET", "")
 KIS_ACCOUNT = os.getenv("KIS_ACCOUNT", "")
+KIS_MASTER_BASE_URL = os.getenv(
+    "KIS_MASTER_BASE_URL", "https://new.real.download.dws.co.kr/common/master/"
+)
 
 CONFIG_DIR = os.path.expanduser(os.path.join("~", ".kis"))
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.ini")
@@ -1,9 +1,11 @@
 from .domestic import DomesticClient
-from .overseas import OverseasClient
 from .master import MasterBook
+from .overseas import OverseasClient
+from .pool import ClientPool
 
 __all__ = [
     "DomesticClient",
     "OverseasClient",
     "MasterBook",
+    "ClientPool",
 ]
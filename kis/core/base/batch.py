@@ -0,0 +1,207 @@
+"""
+# 동시 주문 전송
+
+여러 건의 주문(매수/매도, 정정/취소)을 thread pool에서 동시에 전송합니다.
+전송 간격은 `KisSession.throttle`이 유지하므로 요청 수는 늘지 않고, 서버 응답을 기다리는 시간만 겹칩니다.
+주문마다 결과 또는 오류를 따로 기록하기 때문에 일부 주문이 실패해도 나머지 주문은 계속 전송됩니다.
+"""
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic import BaseModel, StrictInt
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class BasketOrder(BaseModel):
+    """바스켓 주문 1건"""
+
+    order_type: Literal["buy", "sell"]
+    symbol: str
+    quantity: int
+    price: Union[StrictInt, float, None] = None
+    order_division: Optional[str] = None
+    as_market_price: bool = False
+    exchange: Optional[str] = None
+
+
+class OpenOrder(NamedTuple):
+    """정정/취소 가능한 미체결 주문(국내/해외 공통)"""
+
+    order_no: str
+    org_no: str
+    symbol: str
+    order_type: Literal["buy", "sell"]
+    quantity: int  # 미체결 수량
+    price: float
+    exchange: Optional[str] = None
+    raw: Any = None  # 국내/해외 UnExecutedOrder
+
+
+class BatchResult(NamedTuple):
+    """주문 1건의 전송 결과"""
+
+    index: int
+    item: Any
+    data: Any = None
+    error: Optional[Exception] = None
+    started_at: float = 0.0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class LatencySummary(NamedTuple):
+    """주문별 응답 시간(초) 요약"""
+
+    count: int
+    mean: float
+    min: float
+    p50: float
+    p95: float
+    max: float
+
+    @classmethod
+    def from_latencies(cls, latencies: Sequence[float]) -> "LatencySummary":
+        if not latencies:
+            return cls(count=0, mean=0.0, min=0.0, p50=0.0, p95=0.0, max=0.0)
+        values = sorted(latencies)
+
+        def percentile(q: float) -> float:
+            return values[max(math.ceil(q * len(values)) - 1, 0)]
+
+        return cls(
+            count=len(values),
+            mean=sum(values) / len(values),
+            min=values[0],
+            p50=percentile(0.5),
+            p95=percentile(0.95),
+            max=values[-1],
+        )
+
+
+class BatchReport:
+    """
+    동시 주문 전송 결과
+
+    `results`는 입력 순서와 같고, 각 결과의 `started_at`은 전체 전송 시작 시점으로부터의 경과 시간입니다.
+    """
+
+    def __init__(self, results: List[BatchResult], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (
+            f"BatchReport(total={len(self.results)}, "
+            f"succeeded={len(self.succeeded)}, "
+            f"failed={len(self.failed)}, "
+            f"elapsed={self.elapsed:.3f})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> BatchResult:
+        return self.results[index]
+
+    @property
+    def succeeded(self) -> List[BatchResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[BatchResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def latency(self) -> LatencySummary:
+        return LatencySummary.from_latencies(
+            [result.latency for result in self.results]
+        )
+
+    @property
+    def data(self) -> List[Any]:
+        """성공한 주문의 응답 데이터(입력 순서)"""
+        return [result.data for result in self.succeeded]
+
+
+def run_batch(
+    items: Iterable[Any],
+    send: Callable[[Any], Any],
+    priority: Optional[Callable[[Any], Any]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    sequential: bool = False,
+) -> BatchReport:
+    """
+    여러 건의 주문을 동시에 전송합니다.
+
+    :param items: 주문 목록
+    :param send: 주문 1건을 전송하는 함수
+    :param priority: 전송 순서를 정하는 key 함수(작은 값 먼저). None이면 입력 순서
+    :param max_workers: 동시에 전송할 최대 주문 수
+    :param sequential: True인 경우 priority가 같은 주문을 모두 처리한 뒤 다음 priority 주문을 전송
+    """
+    items = list(items)
+    indexes = list(range(len(items)))
+    if priority is not None:
+        indexes.sort(key=lambda i: priority(items[i]))
+
+    results: List[Optional[BatchResult]] = [None] * len(items)
+    started = time.monotonic()
+
+    def run(index: int):
+        item = items[index]
+        start = time.monotonic()
+        try:
+            data, error = send(item), None
+        except Exception as e:
+            data, error = None, e
+        results[index] = BatchResult(
+            index=index,
+            item=item,
+            data=data,
+            error=error,
+            started_at=start - started,
+            latency=time.monotonic() - start,
+        )
+
+    if sequential and priority is not None:
+        groups = [
+            list(group)
+            for _, group in groupby(indexes, key=lambda i: priority(items[i]))
+        ]
+    else:
+        groups = [indexes]
+
+    if items:
+        with ThreadPoolExecutor(
+            max_workers=max(min(max_workers, len(items)), 1),
+            thread_name_prefix="kis-order",
+        ) as executor:
+            # executor는 submit한 순서대로 작업을 꺼내므로 priority 순서로 전송 시작
+            for group in groups:
+                futures = [executor.submit(run, index) for index in group]
+                if sequential:
+                    for future in futures:
+                        future.result()
+
+    return BatchReport(results=results, elapsed=time.monotonic() - started)
@@ -0,0 +1,321 @@
+"""
+# 계좌 조회 cache
+
+매수가능금액, 잔고처럼 주문/체결이 없으면 바뀌지 않는 계좌 조회 결과를 짧은 시간(ttl) 동안 재사용합니다.
+
+cache는 계좌번호별로 묶여 있고, 같은 계좌로 주문을 전송하면(`KisClientBase.send_order`) 국내/해외 client와
+관계없이 그 계좌의 cache를 모두 비웁니다.
+
+잔고는 `BalanceCache`가 보유종목(position)을 따로 관리하며, 체결통보를 받으면 조회 없이 보유수량을 갱신합니다.
+"""
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from kis.core.enum import Exchange
+
+if TYPE_CHECKING:
+    from kis.core.realtime import ExecutionNotice
+
+    from .client import KisClientBase
+
+_MISSING = object()
+
+
+class TTLCache:
+    """key별 값을 ttl(초) 동안 보관하는 thread-safe cache"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._items: Dict[Hashable, Tuple[float, Any]] = {}
+        # 조회 중인 key별 [lock, 사용 중인 thread 수, invalidate 횟수]. 조회가 끝나면 삭제
+        self._locks: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+        # invalidate 이전에 시작한 조회 결과는 저장하지 않기 위해 사용(key별 횟수는 _locks)
+        self._generation = 0
+
+    def __repr__(self):
+        return f"TTLCache(ttl={self.ttl}, items={len(self._items)})"
+
+    def __len__(self) -> int:
+        now = time.monotonic()
+        return sum(
+            1 for expires_at, _ in list(self._items.values()) if expires_at > now
+        )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._items.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return default
+        return item[1]
+
+    def set(self, key: Hashable, value: Any):
+        self._items[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        cache된 값을 반환하고, 없거나 만료된 경우 loader로 조회해 저장합니다.
+        같은 key를 여러 thread에서 동시에 조회해도 loader는 한 번만 호출합니다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = [threading.Lock(), 0, 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                with self._lock:
+                    generation = (self._generation, entry[2])
+                value = loader()
+                with self._lock:
+                    if generation == (self._generation, entry[2]):
+                        self.set(key, value)
+            return value
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._locks[key]
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """cache를 비웁니다. key가 None이면 전체 삭제"""
+        with self._lock:
+            if key is None:
+                self._items.clear()
+                self._generation += 1
+            else:
+                self._items.pop(key, None)
+                entry = self._locks.get(key)
+                if entry is not None:
+                    entry[2] += 1
+
+
+class AccountCaches:
+    """계좌별 cache 모음"""
+
+    _instances: Dict[str, "AccountCaches"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, account: str):
+        self.account = account
+        self._caches: Dict[str, TTLCache] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"AccountCaches(account='{self.account}', caches={list(self._caches)})"
+
+    @classmethod
+    def get(cls, account: str) -> "AccountCaches":
+        """계좌번호별로 프로세스 전체에서 공유하는 cache 모음을 반환합니다."""
+        caches = cls._instances.get(account)
+        if caches is None:
+            with cls._instances_lock:
+                caches = cls._instances.get(account)
+                if caches is None:
+                    caches = cls._instances[account] = cls(account)
+        return caches
+
+    def cache(self, name: str, ttl: float) -> TTLCache:
+        """
+        이름별 cache를 반환합니다. 처음 요청할 때 생성하며, 이후에는 ttl을 갱신합니다.
+
+        :param name: cache 이름(available_amount, balance 등)
+        :param ttl: cache 유지 시간(초)
+        """
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = self._caches[name] = TTLCache(ttl)
+            cache.ttl = ttl
+        return cache
+
+    def invalidate(self):
+        """계좌의 cache를 모두 비웁니다."""
+        with self._lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.invalidate()
+
+
+class Position(NamedTuple):
+    """보유종목(국내/해외 공통)"""
+
+    symbol: str
+    quantity: int  # 보유수량
+    average_price: float  # 매입평균가격
+    exchange: Optional[str] = None  # 해외거래소코드(국내: None)
+
+
+class BalanceCache:
+    """
+    잔고 cache
+
+    - `fetch()`: 잔고 조회 결과를 ttl 동안 재사용합니다. 같은 계좌로 주문을 전송하거나 체결되면 다시 조회합니다.
+    - `positions`: 종목별 보유수량/매입평균가격. 체결통보(`apply_notice`)로 바로 갱신하므로 주문을 전송해도
+      다시 조회하지 않고, 마지막 조회 후 ttl이 지난 경우에만 조회합니다.
+
+    :example:
+    >>> cache = client.balance_cache
+    >>> client.realtime.on_execution(cache.apply_notice)
+    >>> cache.positions["005930"].quantity
+    10
+    """
+
+    def __init__(self, client: "KisClientBase", ttl: float = 10.0):
+        """
+        :param client: KisClient
+        :param ttl: 잔고 조회 결과를 재사용하는 시간(초)
+        """
+        self.client = client
+        self.ttl = ttl
+        self._positions: Optional[Dict[str, Position]] = None
+        self._positions_at = 0.0
+        # 체결/invalidate 횟수. 조회 중에 바뀌면 조회 결과로 보유종목을 덮어쓰지 않음
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"BalanceCache(ttl={self.ttl}, positions={len(self._positions or {})})"
+
+    @property
+    def cache(self) -> TTLCache:
+        return self.client.account_caches.cache(
+            f"{self.client.NAME}:balance", ttl=self.ttl
+        )
+
+    def fetch(self, refresh: bool = False) -> Any:
+        """
+        잔고 조회(`client.balance.fetch()`와 같은 형식)
+
+        :param refresh: True인 경우 cache를 무시하고 다시 조회
+        """
+        if refresh:
+            self.cache.invalidate("snapshot")
+        return self.cache.get_or_load("snapshot", self._load)
+
+    def _load(self) -> Any:
+        with self._lock:
+            version = self._version
+        snapshot = self.client.balance.fetch()
+        positions = {
+            position.symbol: position
+            for position in self.client.balance.to_positions(snapshot)
+        }
+        with self._lock:
+            # 조회 중에 반영한 체결이 조회 결과에 없을 수 있으므로 저장하지 않음
+            if version == self._version:
+                self._positions = positions
+                self._positions_at = time.monotonic()
+        return snapshot
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """종목별 보유종목"""
+        with self._lock:
+            if (
+                self._positions is not None
+                and time.monotonic() - self._positions_at < self.ttl
+            ):
+                return dict(self._positions)
+        while True:
+            started_at = time.monotonic()
+            self.fetch(refresh=True)
+            with self._lock:
+                # 조회 중에 체결되었거나 다른 thread에서 invalidate()한 경우 다시 조회
+                if self._positions is not None and self._positions_at >= started_at:
+                    return dict(self._positions)
+
+    def invalidate(self):
+        """잔고 조회 결과와 보유종목을 모두 비웁니다."""
+        with self._lock:
+            self._positions = None
+            self._version += 1
+        self.cache.invalidate("snapshot")
+
+    def apply_fill(
+        self,
+        symbol: str,
+        order_type: Literal["buy", "sell"],
+        quantity: int,
+        price: float,
+        exchange: Optional[str] = None,
+    ):
+        """
+        체결 내역을 보유종목에 반영합니다. 잔고 조회 결과(예수금 등)는 다음 조회 때 새로 조회합니다.
+
+        :param symbol: 종목코드
+        :param order_type: 매수/매도 (buy, sell)
+        :param quantity: 체결수량
+        :param price: 체결단가
+        :param exchange: 해외거래소코드
+        """
+        with self._lock:
+            self._version += 1
+            if self._positions is not None:
+                position = self._positions.get(symbol) or Position(
+                    symbol=symbol, quantity=0, average_price=0.0, exchange=exchange
+                )
+                if order_type == "buy":
+                    total = position.quantity + quantity
+                    average_price = (
+                        position.quantity * position.average_price + quantity * price
+                    ) / total
+                else:
+                    total = max(position.quantity - quantity, 0)
+                    average_price = position.average_price
+                if total:
+                    self._positions[symbol] = position._replace(
+                        quantity=total, average_price=average_price
+                    )
+                else:
+                    self._positions.pop(symbol, None)
+        self.cache.invalidate("snapshot")
+
+    def apply_notice(self, notice: "ExecutionNotice"):
+        """실시간 체결통보를 반영합니다. `client.realtime.on_execution`의 callback으로 사용합니다."""
+        if not notice.is_executed or notice.is_rejected:
+            return
+        if notice.is_overseas != (self.client.NAME == "OVERSEAS"):
+            return
+        self.apply_fill(
+            notice.symbol,
+            order_type=notice.order_type,
+            quantity=notice.quantity,
+            price=notice.price,
+            exchange=self._exchange_of(notice.symbol) if notice.is_overseas else None,
+        )
+
+    def _exchange_of(self, symbol: str) -> Optional[str]:
+        """
+        해외 종목의 거래소코드(NASD 등)
+
+        체결통보에는 거래소가 없으므로 보유종목에 있으면 그 거래소를, 없으면 주문과 같은 방식으로
+        strict mode이면 client.exchange, 아니면 종목 마스터에서 찾은 거래소를 사용합니다.
+        """
+        with self._lock:
+            position = (self._positions or {}).get(symbol)
+        if position is not None and position.exchange:
+            return position.exchange
+        if self.client.strict:
+            exchange = Exchange.from_value(self.client.exchange)
+        else:
+            exchange = Exchange.find_symbol(symbol)
+        return exchange.code if exchange else None
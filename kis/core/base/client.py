@@ -1,9 +1,10 @@
 import configparser
 import logging
 import os
-from functools import cached_property
+import threading
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Literal,
     Optional,
@@ -22,12 +23,17 @@ from kis.exceptions import (
     KISSecretNotFound,
     handle_error,
 )
+from kis.utils.tool import locked_cached_property
 
+from .cache import AccountCaches, BalanceCache
 from .schema import ResponseData, ResponseDataDetail
 from .session import KisSession
 
 if TYPE_CHECKING:
+    from kis.core.base.reference import PriceCheck, ReferenceCache
     from kis.core.base.resources import Balance, Order, Quote
+    from kis.core.base.tracker import OrderTracker
+    from kis.core.realtime import RealtimeClient
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +48,70 @@ def get_base_url(is_dev: bool) -> str:
     return "https://openapi.koreainvestment.com:9443"
 
 
+def get_websocket_url(is_dev: bool) -> str:
+    if is_dev:
+        return "ws://ops.koreainvestment.com:31000"
+    return "ws://ops.koreainvestment.com:21000"
+
+
+# config.ini 경로 -> (수정시각, profile별 설정)
+_profiles: Dict[str, Tuple[float, Dict[str, Dict[str, str]]]] = {}
+_profiles_lock = threading.Lock()
+
+
+def read_profiles(config_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """
+    `kis config init`으로 등록한 profile 목록을 읽습니다.
+
+    파일이 수정되지 않았다면 다시 읽지 않고 이전에 읽은 결과를 반환합니다.
+
+    :param config_path: config.ini 경로. 입력하지 않으면 `~/.kis/config.ini`
+    :return: profile_name -> 설정(account, app_key, app_secret, is_dev)
+    """
+    config_path = config_path or CONFIG_PATH
+    if not os.path.exists(config_path):
+        raise KISBadArguments(f"Config file not found: '{config_path}'")
+
+    modified_at = os.path.getmtime(config_path)
+    with _profiles_lock:
+        cached = _profiles.get(config_path)
+        if cached is None or cached[0] != modified_at:
+            config = configparser.ConfigParser()
+            config.read(config_path)
+            profiles = {name: dict(config[name]) for name in config.sections()}
+            cached = _profiles[config_path] = (modified_at, profiles)
+    return cached[1]
+
+
+def read_profile(
+    profile_name: str, config_path: Optional[str] = None
+) -> Dict[str, str]:
+    """profile 1개의 설정을 읽습니다."""
+    config_path = config_path or CONFIG_PATH
+    profiles = read_profiles(config_path)
+    if profile_name not in profiles:
+        raise KISBadArguments(
+            f"Profile '{profile_name}' not found in config file: '{config_path}'"
+        )
+    return profiles[profile_name]
+
+
+def parse_bool(value) -> bool:
+    """config.ini에 문자열로 저장된 bool 값(True, False, y, n 등)을 변환합니다."""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text not in configparser.ConfigParser.BOOLEAN_STATES:
+        raise KISBadArguments(f"Not a boolean: '{value}'")
+    return configparser.ConfigParser.BOOLEAN_STATES[text]
+
+
 class KisClientBase:
     NAME = "ABSTRACT"
 
+    # 주문 전 호가단위/가격제한폭 검증(None: 검증하지 않음, reject: 오류, round: 호가단위에 맞춤)
+    price_check: Optional["PriceCheck"] = None
+
     @overload
     def __init__(
         self,
@@ -90,6 +157,9 @@ class KisClientBase:
         requests 라이브러리의 get/post/put/delete/patch 메서드를 사용할 수 있으므로 KIS OpenAPI에서
         필요한 기능을 커스텀할 수 있습니다.
 
+        client는 여러 thread에서 동시에 사용할 수 있습니다. session 등 하위 객체는 처음 접근할 때
+        한 번만 생성하며(`locked_cached_property`), 요청 간격과 token 갱신은 session에서 관리합니다.
+
         :param is_dev: 모의투자 여부
         :param app_key: KIS OpenAPI app_key
         :param app_secret: KIS OpenAPI app_secret
@@ -106,10 +176,12 @@ class KisClientBase:
         """
         if (
             not strict
-            and not app_key
-            and not app_secret
-            or not account
-            or not profile_name
+            and not profile_name
+            and not (
+                (app_key or KIS_APP_KEY)
+                and (app_secret or KIS_APP_SECRET)
+                and (account or KIS_ACCOUNT)
+            )
         ):
             logger.warning(
                 "strict mode is False. profile_name will be set to 'default'"
@@ -118,24 +190,17 @@ class KisClientBase:
 
         self.profile_name = profile_name
         if profile_name:
-            if not os.path.exists(CONFIG_PATH):
-                raise KISBadArguments(f"Config file not found: '{CONFIG_PATH}'")
-            config = configparser.ConfigParser()
-            config.read(CONFIG_PATH)
-            if profile_name not in config.sections():
-                raise KISBadArguments(
-                    f"Profile '{profile_name}' not found in config file: '{CONFIG_PATH}'"
-                )
+            profile = read_profile(profile_name)
             if is_dev or app_key or app_secret or account:
                 logger.warning(
                     "`profile_name` is given. "
                     "`is_dev`, `app_key`, `app_secret`, `account` will be ignored."
                 )
 
-            self.is_dev = config[profile_name]["is_dev"]
-            app_key = config[profile_name]["app_key"]
-            app_secret = config[profile_name]["app_secret"]
-            account = config[profile_name]["account"]
+            self.is_dev = parse_bool(profile["is_dev"])
+            app_key = profile["app_key"]
+            app_secret = profile["app_secret"]
+            account = profile["account"]
 
         else:
             self.is_dev = is_dev
@@ -182,11 +247,50 @@ class KisClientBase:
             options.append("account='Not Set'")
         return f"{name or self.__class__.__name__}({' '.join(options)})"
 
+    def init_kwargs(self) -> Dict[str, Any]:
+        """
+        같은 client를 다시 생성하기 위한 인자
+
+        profile_name으로 생성한 client는 profile_name만, 그렇지 않은 경우 credential을 포함합니다.
+        """
+        kwargs = {
+            "load_token": self.load_token,
+            "token_path": self.token_path,
+            "strict": self.strict,
+        }
+        if self.profile_name:
+            kwargs["profile_name"] = self.profile_name
+        else:
+            kwargs.update(
+                is_dev=self.is_dev,
+                app_key=self.app_key.get_secret_value(),
+                app_secret=self.app_secret.get_secret_value(),
+                account=self.account,
+            )
+        return kwargs
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        pickle시 session, tracker 등 하위 객체는 제외하고 client 생성 인자만 저장합니다.
+
+        ProcessPoolExecutor 등 다른 process에서는 처음 사용할 때 session을 다시 생성하며,
+        token은 token_path에 저장된 token을 재사용합니다.
+        """
+        return {
+            "kwargs": self.init_kwargs(),
+            "price_check": self.__dict__.get("price_check"),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state["kwargs"])
+        if state.get("price_check"):
+            self.price_check = state["price_check"]
+
     def get_account(self) -> Tuple[str, str]:
         prefix, suffix = self.account.split("-")
         return prefix, suffix
 
-    @cached_property
+    @locked_cached_property
     def session(self) -> KisSession:
         """
         KisSession 객체를 로드합니다.
@@ -204,27 +308,58 @@ class KisClientBase:
             base_url=get_base_url(is_dev=self.is_dev),
         )
 
-    @cached_property
+    @locked_cached_property
     def quote(self) -> "Quote":
         """주식 시세 조회를 위한 subclass"""
         from kis.core.base.resources import Quote
 
         return Quote(client=self)
 
-    @cached_property
+    @locked_cached_property
     def order(self) -> "Order":
         """주식 주문을 위한 subclass"""
         from kis.core.base.resources import Order
 
         return Order(client=self)
 
-    @cached_property
+    @locked_cached_property
     def balance(self) -> "Balance":
         """주식 잔고 조회를 위한 subclass"""
         from kis.core.base.resources import Balance
 
         return Balance(client=self)
 
+    @locked_cached_property
+    def realtime(self) -> "RealtimeClient":
+        """실시간(WebSocket) 시세 구독을 위한 subclass"""
+        from kis.core.realtime import RealtimeClient
+
+        return RealtimeClient(client=self)
+
+    @property
+    def account_caches(self) -> AccountCaches:
+        """계좌 조회 결과 cache. 같은 계좌를 사용하는 client끼리 공유합니다."""
+        return AccountCaches.get(self.account)
+
+    @locked_cached_property
+    def balance_cache(self) -> BalanceCache:
+        """잔고 조회 cache"""
+        return BalanceCache(client=self)
+
+    @locked_cached_property
+    def references(self) -> "ReferenceCache":
+        """주문 검증용 종목 기준정보 캐시"""
+        from kis.core.base.reference import ReferenceCache
+
+        return ReferenceCache(loader=self.quote.fetch_reference)
+
+    @locked_cached_property
+    def tracker(self) -> "OrderTracker":
+        """주문 상태 추적을 위한 subclass"""
+        from kis.core.base.tracker import OrderTracker
+
+        return OrderTracker(client=self)
+
     @overload
     def fetch_data(
         self,
@@ -335,6 +470,9 @@ class KisClientBase:
         res = self.session.post(url, headers=headers, json=body)
         data = res.json()
 
+        # 주문가능금액, 잔고 등 같은 계좌의 조회 결과가 바뀌었을 수 있음
+        self.account_caches.invalidate()
+
         # handle error
         handle_error(data)
 
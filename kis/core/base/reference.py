@@ -0,0 +1,219 @@
+"""
+# 주문 전 가격/수량 검증
+
+종목별 호가단위, 상한가/하한가, 매매단위를 거래일 단위로 캐싱하고 주문 전송 전에 검증합니다.
+호가단위에 맞지 않거나 가격제한폭을 벗어난 주문은 서버에서 거부되더라도 hashkey 발급과 주문 요청을
+모두 소모하므로, 캐싱된 기준정보로 먼저 거르면 요청 한도를 아낄 수 있습니다.
+
+기준정보는 종목별로 거래일마다 한 번만 조회합니다.
+"""
+import logging
+import threading
+from datetime import date
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, Callable, Dict, Literal, NamedTuple, Optional, Tuple
+
+from kis.exceptions import KISBadArguments, KISDevModeError
+
+logger = logging.getLogger(__name__)
+
+# 국내 주식 호가단위(KOSPI/KOSDAQ 공통, 2023.01.25~): (가격 미만, 호가단위)
+KRX_TICK_SIZES: Tuple[Tuple[int, int], ...] = (
+    (2000, 1),
+    (5000, 5),
+    (20000, 10),
+    (50000, 50),
+    (200000, 100),
+    (500000, 500),
+)
+KRX_MAX_TICK_SIZE = 1000
+
+
+def krx_tick_size(price: float) -> int:
+    """국내 주식 가격대별 호가단위"""
+    for bound, tick_size in KRX_TICK_SIZES:
+        if price < bound:
+            return tick_size
+    return KRX_MAX_TICK_SIZE
+
+
+PriceCheck = Literal["reject", "round"]
+
+
+class ReferenceData(NamedTuple):
+    """주문 검증에 사용하는 종목 기준정보"""
+
+    symbol: str
+    tick_size: float  # 호가단위
+    upper_bound: float  # 상한가(0이면 검증하지 않음)
+    lower_bound: float  # 하한가(0이면 검증하지 않음)
+    lot_size: int = 1  # 매매단위
+    tradable: bool = True  # 거래가능여부(거래정지 등)
+    krx_ticks: bool = False  # 가격대별 국내 주식 호가단위 사용 여부
+    session: Optional[date] = None  # 조회한 거래일
+
+    def tick_at(self, price: float) -> float:
+        """주문가격에 해당하는 호가단위"""
+        if self.krx_ticks:
+            return krx_tick_size(price)
+        return self.tick_size
+
+    def check_order(
+        self,
+        order_type: Literal["buy", "sell"],
+        price: Optional[float],
+        quantity: int,
+        rounding: bool = False,
+    ) -> Optional[float]:
+        """
+        주문가격/수량을 검증합니다.
+
+        :param order_type: 주문구분 (buy, sell)
+        :param price: 주문단가. None 또는 0이면 시장가로 보고 가격은 검증하지 않음
+        :param quantity: 주문수량
+        :param rounding: True인 경우 호가단위에 맞지 않는 가격을 불리하지 않은 방향(매수: 내림, 매도: 올림)으로 맞춤
+        :return: 검증된 주문단가
+        """
+        if not self.tradable:
+            raise KISBadArguments(f"'{self.symbol}' is not tradable now")
+        if quantity and self.lot_size > 1 and quantity % self.lot_size:
+            raise KISBadArguments(
+                f"quantity {quantity} of '{self.symbol}' is not a multiple of lot size {self.lot_size}"
+            )
+        if not price:
+            return price
+
+        tick_size = self.tick_at(price)
+        if tick_size:
+            tick = Decimal(str(tick_size))
+            value = Decimal(str(price))
+            ticks = value / tick
+            if ticks != ticks.to_integral_value():
+                if not rounding:
+                    raise KISBadArguments(
+                        f"price {price} of '{self.symbol}' does not match tick size {tick_size}"
+                    )
+                ticks = ticks.to_integral_value(
+                    ROUND_FLOOR if order_type == "buy" else ROUND_CEILING
+                )
+                rounded = ticks * tick
+                price = (
+                    int(rounded)
+                    if rounded == rounded.to_integral_value()
+                    else float(rounded)
+                )
+
+        if self.upper_bound and price > self.upper_bound:
+            raise KISBadArguments(
+                f"price {price} of '{self.symbol}' is above upper bound {self.upper_bound}"
+            )
+        if self.lower_bound and price < self.lower_bound:
+            raise KISBadArguments(
+                f"price {price} of '{self.symbol}' is below lower bound {self.lower_bound}"
+            )
+        return price
+
+
+class ReferenceCache:
+    """
+    종목별 기준정보 캐시
+
+    거래일이 바뀌면 다시 조회하며, 여러 thread에서 같은 종목을 동시에 주문해도 한 번만 조회합니다.
+
+    :example:
+    >>> client.price_check = "round"
+    >>> client.references.load(["005930", "000660"])  # 장 시작 전 미리 조회
+    >>> client.order.buy("005930", quantity=1, price=70010)  # 70000으로 주문
+    """
+
+    def __init__(
+        self,
+        loader: Callable[..., ReferenceData],
+        session: Callable[[], date] = date.today,
+    ):
+        """
+        :param loader: 종목 기준정보를 조회하는 함수(`Quote.fetch_reference`)
+        :param session: 현재 거래일을 반환하는 함수
+        """
+        self.loader = loader
+        self.session = session
+        self._items: Dict[Tuple[str, Any], Optional[ReferenceData]] = {}
+        self._locks: Dict[Tuple[str, Any], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ReferenceCache(symbols={len(self._items)})"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def peek(self, symbol: str, exchange: Any = None) -> Optional[ReferenceData]:
+        """조회 없이 캐싱된 기준정보만 반환합니다."""
+        item = self._items.get((symbol, exchange))
+        if item is not None and item.session != self.session():
+            return None
+        return item
+
+    def get(self, symbol: str, exchange: Any = None) -> Optional[ReferenceData]:
+        """
+        종목 기준정보를 반환합니다. 캐싱되지 않았거나 거래일이 지난 경우 조회합니다.
+
+        모의투자 등 기준정보를 조회할 수 없는 경우 None을 반환합니다.
+        """
+        key = (symbol, exchange)
+        session = self.session()
+        item = self._items.get(key, False)
+        if item is None or (item and item.session == session):
+            return item
+
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            item = self._items.get(key, False)
+            if item is None or (item and item.session == session):
+                return item
+            kwargs = {} if exchange is None else {"exchange": exchange}
+            try:
+                item = self.loader(symbol, **kwargs)._replace(session=session)
+            except KISDevModeError:
+                logger.warning(
+                    "Reference data of '%s' is not available in dev mode", symbol
+                )
+                item = None
+            self._items[key] = item
+        return item
+
+    def load(self, symbols, exchange: Any = None):
+        """여러 종목의 기준정보를 미리 조회합니다."""
+        for symbol in symbols:
+            self.get(symbol, exchange=exchange)
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """캐싱된 기준정보를 삭제합니다. symbol이 None이면 전체 삭제"""
+        with self._lock:
+            if symbol is None:
+                self._items.clear()
+            else:
+                for key in [key for key in self._items if key[0] == symbol]:
+                    del self._items[key]
+
+    def check(
+        self,
+        symbol: str,
+        order_type: Literal["buy", "sell"],
+        price: Optional[float],
+        quantity: int,
+        mode: PriceCheck = "reject",
+        exchange: Any = None,
+    ) -> Optional[float]:
+        """
+        기준정보로 주문을 검증하고 주문단가를 반환합니다.
+
+        :param mode: reject(호가단위가 맞지 않으면 오류), round(호가단위에 맞춤)
+        """
+        item = self.get(symbol, exchange=exchange)
+        if item is None:
+            return price
+        return item.check_order(
+            order_type, price=price, quantity=quantity, rounding=mode == "round"
+        )
@@ -1,5 +1,32 @@
 """국내/해외 주식 관련 API 리소스 모델을 추상화합니다."""
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+from kis.exceptions import KISBadArguments
+
+from .batch import DEFAULT_MAX_WORKERS, BasketOrder, BatchReport, OpenOrder, run_batch
+from .cache import Position
 from .client import KisClientBase
+from .reference import ReferenceData
+from .tracker import OrderFill
+
+# BasketOrder, OpenOrder 공통 전송 순서(작은 값 먼저)
+ORDER_PRIORITIES: Dict[str, Callable[[Union[BasketOrder, OpenOrder]], Any]] = {
+    "sell_first": lambda order: order.order_type != "sell",
+    "buy_first": lambda order: order.order_type != "buy",
+    "amount": lambda order: -order.quantity * (order.price or 0),
+}
+
+Priority = Union[
+    Literal["sell_first", "buy_first", "amount"], Callable[[Any], Any], None
+]
+
+
+def get_priority(priority: Priority) -> Optional[Callable[[Any], Any]]:
+    if isinstance(priority, str):
+        if priority not in ORDER_PRIORITIES:
+            raise KISBadArguments(f"No such priority: '{priority}'")
+        return ORDER_PRIORITIES[priority]
+    return priority
 
 
 class Resource:
@@ -18,6 +45,10 @@ class Quote(Resource):
         """기간별 시세 조회"""
         raise NotImplementedError("fetch_all_ohlcv not implemented")
 
+    def fetch_reference(self, symbol: str, **kwargs) -> ReferenceData:
+        """주문 검증용 종목 기준정보(호가단위, 상한가/하한가, 매매단위) 조회"""
+        raise NotImplementedError("fetch_reference not implemented")
+
 
 class Order(Resource):
     """주문관련 API"""
@@ -34,6 +65,50 @@ class Order(Resource):
         """주식 매도"""
         raise NotImplementedError("sell not implemented")
 
+    def submit_basket(
+        self,
+        orders: Iterable[Union[BasketOrder, Dict[str, Any]]],
+        priority: Priority = "sell_first",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sequential: bool = False,
+    ) -> BatchReport:
+        """
+        여러 종목의 주문을 동시에 전송합니다.
+
+        주문마다 hashkey 요청과 주문 요청을 보내는데, 전송 간격은 session에서 유지하면서
+        응답을 기다리는 시간만 겹치도록 thread pool에서 전송합니다.
+        일부 주문이 실패해도 나머지 주문은 계속 전송하고, 주문별 결과/오류는 반환값에서 확인합니다.
+
+        :example:
+        >>> report = client.order.submit_basket([
+        ...     {"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000},
+        ...     {"order_type": "sell", "symbol": "000660", "quantity": 5, "as_market_price": True},
+        ... ])
+        >>> report.failed  # 실패한 주문(error 포함)
+        >>> report.latency  # LatencySummary(count=2, mean=..., p95=...)
+
+        :param orders: 주문 목록(BasketOrder 또는 같은 key를 가진 dict)
+        :param priority: 전송 순서
+            'sell_first': 매도 주문 먼저(기본값), 'buy_first': 매수 주문 먼저,
+            'amount': 주문 금액이 큰 주문 먼저, None: 입력 순서,
+            함수: BasketOrder를 받아 정렬 key를 반환(작은 값 먼저)
+        :param max_workers: 동시에 전송할 최대 주문 수
+        :param sequential: True인 경우 priority가 같은 주문을 모두 처리한 뒤 다음 주문을 전송
+            (예: 매도 주문이 모두 접수된 뒤 매수 주문 전송)
+        :return: 입력 순서와 같은 주문별 결과(BatchResult)와 응답 시간 요약
+        """
+        orders = [
+            order if isinstance(order, BasketOrder) else BasketOrder(**order)
+            for order in orders
+        ]
+        return run_batch(
+            orders,
+            send=lambda order: self._order(**order.dict()),
+            priority=get_priority(priority),
+            max_workers=max_workers,
+            sequential=sequential,
+        )
+
     def _modify(self, *args, **kwargs):
         """주문 수정/취소"""
         raise NotImplementedError("modify not implemented")
@@ -46,10 +121,162 @@ class Order(Resource):
         """주식 취소"""
         raise NotImplementedError("cancel not implemented")
 
+    def fetch_open_orders(self, **kwargs) -> List[OpenOrder]:
+        """정정/취소 가능한 미체결 주문 조회(국내/해외 공통 형식)"""
+        raise NotImplementedError("fetch_open_orders not implemented")
+
+    def fetch_order_fills(self, **kwargs) -> List[OrderFill]:
+        """당일 주문별 체결 현황 조회(국내/해외 공통 형식)"""
+        raise NotImplementedError("fetch_order_fills not implemented")
+
+    def _cancel_open_order(self, order: OpenOrder):
+        """미체결 주문 1건 전량 취소"""
+        raise NotImplementedError("_cancel_open_order not implemented")
+
+    def _modify_open_order(
+        self,
+        order: OpenOrder,
+        price: Optional[float] = None,
+        quantity: Optional[int] = None,
+        as_market_price: bool = False,
+    ):
+        """미체결 주문 1건 정정"""
+        raise NotImplementedError("_modify_open_order not implemented")
+
+    def cancel_all(
+        self,
+        filter: Optional[Callable[[OpenOrder], bool]] = None,
+        priority: Priority = "amount",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ) -> BatchReport:
+        """
+        미체결 주문을 한 번 조회한 뒤 조건에 맞는 주문을 동시에 전량 취소합니다.
+        일부 취소가 실패해도(이미 체결된 주문 등) 나머지 주문은 계속 취소합니다.
+
+        :example:
+        >>> report = client.order.cancel_all()  # 전체 취소
+        >>> report = client.order.cancel_all(lambda order: order.order_type == "buy")
+        >>> [(result.item.order_no, result.error) for result in report.failed]
+
+        :param filter: OpenOrder를 받아 취소할지 여부를 반환하는 함수. None이면 전체 취소
+        :param priority: 취소 순서. 'amount': 미체결 금액이 큰 주문 먼저(기본값),
+            'sell_first', 'buy_first', None: 조회 순서, 함수: OpenOrder를 받아 정렬 key를 반환
+        :param max_workers: 동시에 전송할 최대 주문 수
+        :param kwargs: 미체결 주문 조회 옵션(해외: exchange)
+        :return: 취소한 OpenOrder별 결과(BatchResult)와 응답 시간 요약
+        """
+        orders = self.fetch_open_orders(**kwargs)
+        if filter is not None:
+            orders = [order for order in orders if filter(order)]
+        return run_batch(
+            orders,
+            send=self._cancel_open_order,
+            priority=get_priority(priority),
+            max_workers=max_workers,
+        )
+
+    def modify_many(
+        self,
+        changes: Union[
+            Dict[str, Dict[str, Any]], Callable[[OpenOrder], Optional[Dict[str, Any]]]
+        ],
+        priority: Priority = "amount",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ) -> BatchReport:
+        """
+        미체결 주문을 한 번 조회한 뒤 여러 주문을 동시에 정정합니다.
+        일부 정정이 실패해도 나머지 주문은 계속 정정합니다.
+
+        :example:
+        >>> # 주문번호별 정정 내용
+        >>> client.order.modify_many({"0000012345": {"price": 70100}})
+        >>> # 모든 매수 주문을 시장가로 정정
+        >>> client.order.modify_many(
+        ...     lambda order: {"as_market_price": True} if order.order_type == "buy" else None
+        ... )
+
+        :param changes: 주문번호별 정정 내용(price, quantity, as_market_price) dict,
+            또는 OpenOrder를 받아 정정 내용을 반환하는 함수(None이면 정정하지 않음).
+            quantity를 입력하지 않으면 잔량 전부를 정정합니다.
+            dict에 있는 주문번호가 미체결 주문에 없으면 해당 주문만 실패로 기록합니다.
+        :param priority: 정정 순서(cancel_all과 동일)
+        :param max_workers: 동시에 전송할 최대 주문 수
+        :param kwargs: 미체결 주문 조회 옵션(해외: exchange)
+        :return: (OpenOrder, 정정 내용)별 결과(BatchResult)와 응답 시간 요약
+        """
+        orders = self.fetch_open_orders(**kwargs)
+
+        items = []
+        if callable(changes):
+            for order in orders:
+                change = changes(order)
+                if change is not None:
+                    items.append((order, change))
+        else:
+            open_orders = {order.order_no: order for order in orders}
+            for order_no, change in changes.items():
+                items.append((open_orders.get(order_no, order_no), change))
+
+        def send(item):
+            order, change = item
+            if not isinstance(order, OpenOrder):
+                raise KISBadArguments(f"No such open order: '{order}'")
+            return self._modify_open_order(order, **change)
+
+        order_priority = get_priority(priority)
+
+        def item_priority(item):
+            # 미체결 주문에 없는 주문번호는 요청 없이 실패하므로 마지막에 처리
+            order, _ = item
+            if not isinstance(order, OpenOrder):
+                return True, 0
+            return False, order_priority(order)
+
+        return run_batch(
+            items,
+            send=send,
+            priority=item_priority if order_priority else None,
+            max_workers=max_workers,
+        )
+
     def get_available_amount(self, *args, **kwargs):
         """주식 주문가능금액 조회"""
         raise NotImplementedError("check_available_amount not implemented")
 
+    # get_available_amounts 조회 결과를 재사용하는 시간(초)
+    AVAILABLE_AMOUNT_TTL = 5.0
+
+    def get_available_amounts(
+        self,
+        items: Iterable[Union[Tuple[str, Optional[float]], Dict[str, Any]]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> BatchReport:
+        """
+        여러 종목의 주문가능금액을 동시에 조회합니다.
+
+        조회 결과는 (종목코드, 주문가격, 주문구분)별로 `AVAILABLE_AMOUNT_TTL`초 동안 재사용하며,
+        같은 계좌로 주문을 전송하면 즉시 비웁니다.
+
+        :param items: (종목코드, 주문가격) 또는 `get_available_amount` 인자 dict 목록
+        :param max_workers: 동시에 조회할 최대 요청 수
+        :return: 입력 순서대로 결과/오류를 담은 BatchReport
+        """
+        items = [
+            item if isinstance(item, dict) else dict(zip(("symbol", "price"), item))
+            for item in items
+        ]
+        cache = self.client.account_caches.cache(
+            f"{self.client.NAME}:available_amount", ttl=self.AVAILABLE_AMOUNT_TTL
+        )
+
+        def send(item: Dict[str, Any]):
+            key = tuple(sorted((name, str(value)) for name, value in item.items()))
+            return cache.get_or_load(key, lambda: self.get_available_amount(**item))
+
+        return run_batch(items, send=send, max_workers=max_workers)
+
     def fetch_unexecuted_orders(self, **kwargs):
         """미체결내역 조회"""
         raise NotImplementedError("fetch_unfilled_orders not implemented")
@@ -65,3 +292,7 @@ class Balance(Resource):
     def fetch(self):
         """주식 잔고 조회"""
         raise NotImplementedError("fetch not implemented")
+
+    def to_positions(self, snapshot: Any) -> List[Position]:
+        """`fetch()` 결과를 보유종목 목록으로 변환"""
+        raise NotImplementedError("to_positions not implemented")
@@ -0,0 +1,173 @@
+"""
+# 요청 scheduler
+
+app_key 하나로 보내는 모든 REST 요청의 전송 순서와 간격을 정합니다.
+
+- 요청은 우선순위(`RequestPriority`)별로 줄을 서고, 가중치에 비례해 전송 순서를 나눠 받습니다(weighted fair queuing).
+  가중치가 큰 정정/취소 요청은 대기중인 시세 조회가 많아도 다음 전송 순서를 받습니다.
+- 대량 조회(bulk)는 다른 요청이 하나라도 기다리고 있으면 전송하지 않으므로, 연속조회 중간에 주문이 끼어들 수 있습니다.
+- 전송 간격은 우선순위와 무관하게 REQUEST_MIN_INTERVAL 이상 유지합니다.
+
+같은 app_key를 쓰는 client는 scheduler를 공유하므로, 대량 시세 조회와 실거래 주문을 같은 app_key로 동시에 실행할 수 있습니다.
+"""
+import heapq
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from kis.core.enum import RequestPriority
+
+REQUEST_MIN_INTERVAL = 0.1
+
+DEFAULT_WEIGHTS: Dict[RequestPriority, float] = {
+    RequestPriority.CANCEL: 16,
+    RequestPriority.ORDER: 8,
+    RequestPriority.BALANCE: 4,
+    RequestPriority.QUOTE: 2,
+    RequestPriority.BULK: 1,
+}
+
+# 기간별 시세(연속조회) url
+BULK_PATHS = ("dailyprice", "itemchartprice")
+
+
+def classify_request(method: str, url: str) -> RequestPriority:
+    """url로 요청 우선순위를 정합니다."""
+    path = urlparse(url).path
+    if path.startswith("/oauth2") or path.endswith("order-rvsecncl"):
+        return RequestPriority.CANCEL
+    if "/trading/order" in path and method.upper() == "POST":
+        return RequestPriority.ORDER
+    if "/trading/" in path:
+        return RequestPriority.BALANCE
+    if path.endswith(BULK_PATHS):
+        return RequestPriority.BULK
+    return RequestPriority.QUOTE
+
+
+class RequestScheduler:
+    """
+    우선순위별 요청 전송 scheduler
+
+    :example:
+    >>> scheduler = client.session.scheduler
+    >>> with scheduler.priority("bulk"):
+    ...     client.quote.fetch_histories("005930", start_date="2020-01-01")
+    >>> scheduler.stats
+    Counter({<RequestPriority.BULK: 'bulk'>: 12, ...})
+    """
+
+    _instances: Dict[str, "RequestScheduler"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        interval: float = REQUEST_MIN_INTERVAL,
+        weights: Optional[Dict[Union[str, RequestPriority], float]] = None,
+    ):
+        """
+        :param interval: 최소 전송 간격(초)
+        :param weights: 우선순위별 가중치
+        """
+        self.interval = interval
+        self.weights = dict(DEFAULT_WEIGHTS)
+        for priority, weight in (weights or {}).items():
+            self.weights[RequestPriority.from_value(priority)] = weight
+
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[bool, float, int, int, float]] = []
+        self._seq = count()
+        self._virtual_time = 0.0
+        self._finish: Dict[RequestPriority, float] = {}
+        self._last_sent = 0.0
+        self._local = threading.local()
+        self.stats: Counter = Counter()
+
+    def __repr__(self):
+        return f"RequestScheduler(interval={self.interval}, waiting={len(self._queue)})"
+
+    @classmethod
+    def get(cls, key: str) -> "RequestScheduler":
+        """app_key별로 프로세스 전체에서 공유하는 scheduler를 반환합니다."""
+        scheduler = cls._instances.get(key)
+        if scheduler is None:
+            with cls._instances_lock:
+                scheduler = cls._instances.get(key)
+                if scheduler is None:
+                    scheduler = cls._instances[key] = cls()
+        return scheduler
+
+    @property
+    def waiting(self) -> int:
+        """전송 순서를 기다리는 요청 수"""
+        return len(self._queue)
+
+    @contextmanager
+    def priority(self, priority: Union[str, RequestPriority]) -> Iterator[None]:
+        """현재 thread에서 보내는 요청의 우선순위를 지정합니다."""
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(RequestPriority.from_value(priority))
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def resolve(self, priority: Union[str, RequestPriority, None]) -> RequestPriority:
+        """`priority()`로 지정한 우선순위가 있으면 우선 사용합니다."""
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            return stack[-1]
+        if priority is None:
+            return RequestPriority.QUOTE
+        return RequestPriority.from_value(priority)
+
+    def acquire(self, priority: Union[str, RequestPriority, None] = None) -> float:
+        """
+        전송 순서가 올 때까지 기다립니다.
+
+        :param priority: 요청 우선순위
+        :return: 기다린 시간(초)
+        """
+        priority = self.resolve(priority)
+        started = time.monotonic()
+        with self._cond:
+            start = max(self._virtual_time, self._finish.get(priority, 0.0))
+            finish = start + 1 / self.weights[priority]
+            self._finish[priority] = finish
+            # 같은 순서라면 우선순위가 높은 요청 먼저
+            entry = (
+                priority.is_preemptible,
+                finish,
+                priority.rank,
+                next(self._seq),
+                start,
+            )
+            heapq.heappush(self._queue, entry)
+
+            try:
+                while True:
+                    if self._queue[0] is entry:
+                        now = time.monotonic()
+                        remaining = self._last_sent + self.interval - now
+                        if remaining <= 0:
+                            heapq.heappop(self._queue)
+                            self._virtual_time = max(self._virtual_time, start)
+                            self._last_sent = now
+                            self.stats[priority] += 1
+                            self._cond.notify_all()
+                            return now - started
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+            except BaseException:
+                # 기다리던 thread가 중단(KeyboardInterrupt 등)되면 순서를 반납해
+                # 뒤에 있는 요청이 계속 기다리지 않도록 함
+                if entry in self._queue:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    self._cond.notify_all()
+                raise
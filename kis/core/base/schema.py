@@ -48,6 +48,12 @@ class GetHashKeyRespData(BaseModel):
     hash: str = Field(alias="HASH")
 
 
+class ApprovalKeyRespData(BaseModel):
+    """실시간(WebSocket) 접속키"""
+
+    approval_key: str
+
+
 # About Response
 Data = TypeVar("Data")
 
@@ -1,31 +1,32 @@
 import logging
 import os
-import time
+import threading
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.sessions import merge_setting
 from requests.structures import CaseInsensitiveDict
 
 from kis.constants import CONFIG_DIR
+from kis.core.enum import RequestPriority
 from kis.exceptions import (
     KISBadArguments,
     KISRecursionError,
     KISServerHTTPError,
     KISServerInternalError,
 )
-from kis.utils.tool import load_yaml, save_yaml
+from kis.utils.tool import file_lock, load_yaml, save_yaml
 
-from .schema import DestroyTokenRespData, GetHashKeyRespData, Token
+from .scheduler import REQUEST_MIN_INTERVAL, RequestScheduler, classify_request
+from .schema import ApprovalKeyRespData, DestroyTokenRespData, GetHashKeyRespData, Token
 
 if TYPE_CHECKING:
     from kis.core.base.client import KisClientBase
 
 logger = logging.getLogger(__name__)
 
-REQUEST_MIN_INTERVAL = 0.1
-
 
 class KisSession(requests.Session):
     """
@@ -38,8 +39,14 @@ class KisSession(requests.Session):
 
     token은 client에서 입력받은 `token_path`, 혹은 `~/.kis/{account}/token.yaml`,
     혹은 $KIS_TOKEN_PATH 경로에 저장됩니다.
+
+    하나의 session을 여러 thread에서 동시에 사용할 수 있습니다. 요청 간격은 scheduler가 유지하고,
+    token 갱신은 여러 thread가 동시에 필요로 해도 한 번만 실행합니다.
     """
 
+    # 동시에 사용할 수 있는 connection 수(host별)
+    POOL_MAXSIZE = 32
+
     def __init__(
         self,
         client: "KisClientBase",
@@ -54,24 +61,27 @@ class KisSession(requests.Session):
         # default header
         self.set_default_headers({"content-type": "application/json; charset=UTF-8"})
 
-        # request interval을 유지하기 위해 사용
-        self._last_request_time = time.time()
+        # 여러 thread에서 요청해도 connection을 버리지 않도록 pool 크기를 늘림
+        adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        # 같은 app_key를 사용하는 session끼리 전송 순서와 간격을 공유
+        self.scheduler = RequestScheduler.get(credentials["appkey"])
+        self._token_lock = threading.Lock()
 
         # init token
         self._token = None
-        if self.client.load_token and (token_path := self.token_path):
-            if os.path.exists(token_path):
-                try:
-                    self.token = Token(**load_yaml(token_path))
-                    logger.info(f"Token file is loaded: {token_path}")
-                except Exception:
-                    logger.info(
-                        "Something is wrong in token. Need to create new token."
-                    )
+        if self.client.load_token:
+            token = self.load_saved_token()
+            if token is not None:
+                self.token = token
+                logger.info(f"Token file is loaded: {self.token_path}")
 
     def set_default_headers(self, headers: dict):
+        # 새로 입력받은 header가 기존 header보다 우선(token 갱신시 Authorization 교체)
         self.headers = merge_setting(
-            self.headers or {}, headers, dict_class=CaseInsensitiveDict
+            headers, self.headers or {}, dict_class=CaseInsensitiveDict
         )
         return self
 
@@ -84,6 +94,17 @@ class KisSession(requests.Session):
             or os.getenv("KIS_TOKEN_PATH")
         )
 
+    def load_saved_token(self) -> Optional[Token]:
+        """token_path에 저장된 token을 읽습니다. 없거나 읽을 수 없으면 None"""
+        token_path = self.token_path
+        if not token_path or not os.path.exists(token_path):
+            return None
+        try:
+            return Token(**load_yaml(token_path))
+        except Exception:
+            logger.info("Something is wrong in token. Need to create new token.")
+            return None
+
     @property
     def token(self) -> Token:
         return self._token
@@ -106,28 +127,79 @@ class KisSession(requests.Session):
             return False
         return True
 
+    def renew_token(self, stale: Optional[Token] = None) -> Token:
+        """
+        token을 갱신합니다.
+
+        여러 thread가 같은 token으로 갱신을 요청해도 처음 한 번만 새 token을 발급받고,
+        나머지 thread는 발급받은 token을 그대로 사용합니다.
+        같은 token_path를 사용하는 다른 process(ProcessPoolExecutor worker 등)가 먼저 발급받아 저장한
+        token이 있으면 새로 발급받지 않고 재사용합니다.
+
+        :param stale: 만료되었거나 서버에서 거부된 token. 현재 token이 이미 다르면 갱신하지 않음
+        """
+        with self._token_lock:
+            if self._token is not stale:
+                return self._token
+            with file_lock(self.token_path):
+                saved = self.load_saved_token() if self.client.load_token else None
+                if (
+                    saved is not None
+                    and not saved.is_expired
+                    and (stale is None or saved.access_token != stale.access_token)
+                ):
+                    logger.info(f"Token file is loaded: {self.token_path}")
+                    self.token = saved
+                else:
+                    self.create_token()
+            return self._token
+
+    def ensure_token(self) -> Token:
+        """유효한 token을 반환합니다. 없거나 만료된 경우 발급받아 token_path에 저장합니다."""
+        token = self.token
+        if not self.is_token_valid:
+            token = self.renew_token(stale=token)
+        return token
+
+    def throttle(self, priority: Union[str, RequestPriority, None] = None):
+        """
+        Too many request 방지
+
+        scheduler에서 전송 순서를 받을 때까지 기다립니다. 직전 요청으로부터 REQUEST_MIN_INTERVAL
+        이후에 우선순위가 높은 요청부터 전송하고, 응답을 기다리는 요청끼리는 동시에 진행됩니다.
+
+        :param priority: 요청 우선순위(`RequestPriority`)
+        """
+        self.scheduler.acquire(priority)
+
     def request(
-        self, method: str, url: str, need_token: bool = False, **kwargs
+        self,
+        method: str,
+        url: str,
+        need_token: bool = False,
+        _retry: bool = False,
+        **kwargs,
     ) -> requests.Response:
-        """get/post/put/patch/delete 등 요청을 보내는 base method"""
+        """
+        get/post/put/patch/delete 등 요청을 보내는 base method
+
+        :param need_token: True인 경우 token을 새로 발급받은 뒤 요청
+        """
         # renew token
-        if not self.is_token_valid or need_token:
-            self.create_token()
+        token = self.token
+        if need_token or not self.is_token_valid:
+            # 기다리는 동안 다른 thread가 token을 갱신한 경우 재사용
+            token = self.renew_token(stale=token)
 
         if not url.startswith(self.base_url):
             if not url.startswith("/"):
                 url = f"/{url}"
             url = f"{self.base_url}{url}"
 
-        # 간격 사이에 request가 발생하면 time.sleep
-        # Too many request 방지
-        diff = time.time() - self._last_request_time
-        if diff < REQUEST_MIN_INTERVAL:
-            sleep = REQUEST_MIN_INTERVAL - diff
-            time.sleep(sleep)
+        # 간격 사이에 request가 발생하면 우선순위에 따라 대기
+        self.throttle(classify_request(method, url))
 
         logger.debug("- %s, %s", method, url)
-        self._last_request_time = time.time()
         res = super().request(method=method, url=url, **kwargs)
 
         try:
@@ -140,19 +212,18 @@ class KisSession(requests.Session):
             if data["rt_cd"] == "1":
 
                 if msg_code == "EGW00123":
-                    if need_token:
+                    if need_token or _retry:
                         raise KISServerInternalError(
                             f"{msg_code}: {data['msg1']}"
                         ) from err
 
                     # 서버로부터 토큰 만료 응답 받음
-                    # -> token 재생성 후 need_token=True로 다시 요청
+                    # -> 요청에 사용한 token을 갱신(다른 thread가 갱신했다면 재사용) 후 다시 요청
                     logger.warning(
                         f"Token is wrong. Create new token: [{msg_code}] {data['msg1']}"
                     )
-                    return self.request(
-                        method=method, url=url, need_token=True, **kwargs
-                    )
+                    self.renew_token(stale=token)
+                    return self.request(method=method, url=url, _retry=True, **kwargs)
                 elif msg_code == "90070000":
                     # 모의투자 처리계좌의 ID와 사용자정보가 상이하여 처리 불가능 합니다
                     raise KISBadArguments(f"{msg_code}: {data['msg1']}") from err
@@ -169,7 +240,7 @@ class KisSession(requests.Session):
         """Create new token and save it as yaml file"""
         data = {"grant_type": "client_credentials", **self.credentials}
 
-        self._last_request_time = time.time()
+        self.throttle(RequestPriority.CANCEL)
         try:
             res = requests.post(
                 f"{self.base_url}/oauth2/tokenP",
@@ -209,7 +280,7 @@ class KisSession(requests.Session):
         """Destroy token in KIS server and remove token file"""
         data = {"token": self.token, **self.credentials}
 
-        self._last_request_time = time.time()
+        self.throttle(RequestPriority.CANCEL)
         res = requests.post(
             f"{self.base_url}/oauth2/tokenP",
             json=data,
@@ -221,10 +292,24 @@ class KisSession(requests.Session):
         logger.info(f"Token is removed successfully in '{self.token_path}'")
         return DestroyTokenRespData(**res.json())
 
-    def get_hash_key(self, body: Dict[str, str]) -> GetHashKeyRespData:
-        """Get hash key from KIS server"""
+    def get_hash_key(
+        self,
+        body: Dict[str, str],
+        priority: Optional[Union[str, RequestPriority]] = None,
+    ) -> GetHashKeyRespData:
+        """
+        Get hash key from KIS server
+
+        :param body: 주문 body
+        :param priority: 요청 우선순위. None이면 정정/취소 주문은 cancel, 나머지는 order
+        """
+        if priority is None:
+            if "RVSE_CNCL_DVSN_CD" in body:
+                priority = RequestPriority.CANCEL
+            else:
+                priority = RequestPriority.ORDER
         try:
-            self._last_request_time = time.time()
+            self.throttle(priority)
             res = requests.post(
                 f"{self.base_url}/uapi/hashkey",
                 json=body,
@@ -243,3 +328,25 @@ class KisSession(requests.Session):
 
         logger.info("Hash key is generated successfully")
         return GetHashKeyRespData(**res.json())
+
+    def get_approval_key(self) -> ApprovalKeyRespData:
+        """Get websocket approval key from KIS server"""
+        try:
+            self.throttle(RequestPriority.CANCEL)
+            res = requests.post(
+                f"{self.base_url}/oauth2/Approval",
+                json={
+                    "grant_type": "client_credentials",
+                    "appkey": self.credentials["appkey"],
+                    "secretkey": self.credentials["appsecret"],
+                },
+                headers={"content-type": "application/json; charset=UTF-8"},
+            )
+            res.raise_for_status()
+        except requests.exceptions.HTTPError as err:
+            raise KISBadArguments("Invalid credentials") from err
+        except requests.exceptions.ConnectionError as err:
+            raise KISServerInternalError("KIS Server Internal Error") from err
+
+        logger.info("Approval key is generated successfully")
+        return ApprovalKeyRespData(**res.json())
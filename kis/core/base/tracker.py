@@ -0,0 +1,498 @@
+"""
+# 주문 상태 추적
+
+주문번호별 주문 상태(접수, 일부 체결, 전량 체결, 취소, 거부)를 메모리에 보관하고,
+미체결 내역/당일 체결 내역 조회 결과(polling)와 실시간 체결통보(ExecutionNotice)로 갱신합니다.
+
+- 미체결 주문이 없으면 조회하지 않고, 장 운영시간이 아니면 조회 간격을 늘립니다.
+- 미체결 주문 수가 많아 한 번 조회에 연속조회가 필요하면 그만큼 간격을 늘려 요청 한도를 나눠 씁니다.
+- 상태 변화가 없으면 조회 간격을 점점 늘리고(backoff), 변화가 생기면 다시 줄입니다.
+- 당일 체결 내역은 미체결 내역에서 사라진 주문이 있을 때만 조회합니다.
+
+주문 1건의 완료를 기다리는 것은 `threading.Event` 대기이므로 조회 요청을 추가로 만들지 않습니다.
+"""
+import logging
+import math
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from kis.core.enum import OrderStatus
+from kis.exceptions import KISBadArguments, KISDevModeError
+
+from .scheduler import REQUEST_MIN_INTERVAL
+
+if TYPE_CHECKING:
+    from kis.core.realtime import ExecutionNotice
+
+    from .batch import BasketOrder, BatchReport, OpenOrder
+    from .client import KisClientBase
+
+logger = logging.getLogger(__name__)
+
+# 미체결 내역 조회 1회(page)에 받는 최대 주문 수
+ORDERS_PER_PAGE = 50
+
+
+class OrderFill(NamedTuple):
+    """당일 주문별 체결 현황(국내/해외 공통)"""
+
+    order_no: str
+    origin_order_no: str  # 정정/취소 주문인 경우 원주문번호
+    symbol: str
+    order_type: Literal["buy", "sell"]
+    quantity: int  # 주문수량
+    filled_quantity: int  # 체결수량
+    price: float  # 체결평균가
+    modify_type: Literal["new", "update", "cancel"]
+    is_rejected: bool = False
+
+
+class TrackedOrder:
+    """추적중인 주문 1건"""
+
+    def __init__(
+        self,
+        order_no: str,
+        symbol: str,
+        order_type: Literal["buy", "sell"],
+        quantity: int,
+        price: Optional[float] = None,
+    ):
+        self.order_no = order_no
+        self.symbol = symbol
+        self.order_type = order_type
+        self.quantity = quantity
+        self.price = price
+        self.status = OrderStatus.ACCEPTED
+        self.average_price: Optional[float] = None
+        # 정정으로 새로 생긴 주문번호
+        self.replaced_by: Optional[str] = None
+        self.updated_at = time.time()
+
+        # 체결통보 누적 체결수량과 조회한 체결수량은 각각 늦게 반영될 수 있으므로 큰 값을 사용
+        self._notice_filled = 0
+        self._notice_amount = 0.0
+        self._polled_filled = 0
+        self._done = threading.Event()
+
+    def __repr__(self):
+        return (
+            f"TrackedOrder(order_no='{self.order_no}', symbol='{self.symbol}', "
+            f"order_type='{self.order_type}', status='{self.status.value}', "
+            f"filled={self.filled_quantity}/{self.quantity})"
+        )
+
+    @property
+    def filled_quantity(self) -> int:
+        return max(self._notice_filled, self._polled_filled)
+
+    @property
+    def remaining_quantity(self) -> int:
+        return max(self.quantity - self.filled_quantity, 0)
+
+    @property
+    def is_done(self) -> bool:
+        return self.status.is_done
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        주문이 완료(전량 체결/취소/거부)될 때까지 기다립니다.
+
+        :param timeout: 최대 대기 시간(초). None이면 완료될 때까지 대기
+        :return: 완료 여부
+        """
+        return self._done.wait(timeout)
+
+    def _set_status(self, status: OrderStatus) -> bool:
+        if self.status == status or self.status.is_done:
+            return False
+        self.status = status
+        self.updated_at = time.time()
+        if status.is_done:
+            self._done.set()
+        return True
+
+    def _update_filled(self) -> bool:
+        if self.filled_quantity >= self.quantity:
+            return self._set_status(OrderStatus.FILLED)
+        if self.filled_quantity > 0:
+            return self._set_status(OrderStatus.PARTIALLY_FILLED)
+        return False
+
+
+class OrderTracker:
+    """
+    주문 상태 추적
+
+    :example:
+    >>> tracker = client.tracker
+    >>> order = tracker.submit({"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000})
+    >>> order.wait(timeout=60)  # 전량 체결/취소/거부될 때까지 대기
+    >>> order.status
+    <OrderStatus.FILLED: 'filled'>
+
+    실시간 체결통보를 함께 사용하면 polling보다 먼저 상태가 갱신됩니다.
+
+    >>> client.realtime.on_execution(tracker.apply_notice)
+    """
+
+    def __init__(
+        self,
+        client: "KisClientBase",
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        closed_interval: float = 300.0,
+        backoff: float = 1.5,
+        request_share: float = 0.2,
+        market_open: Optional[Callable[[], bool]] = None,
+        **fetch_options,
+    ):
+        """
+        :param client: KisClient
+        :param min_interval: 최소 조회 간격(초)
+        :param max_interval: 장 운영시간 중 최대 조회 간격(초)
+        :param closed_interval: 장 운영시간이 아닐 때 조회 간격(초)
+        :param backoff: 상태 변화가 없을 때마다 조회 간격을 늘리는 비율
+        :param request_share: polling에 사용할 최대 요청 비율(REQUEST_MIN_INTERVAL 기준)
+        :param market_open: 장 운영시간 여부를 반환하는 함수(기본값: client 종류에 맞는 장 운영시간)
+        :param fetch_options: 미체결/체결 내역 조회 옵션(해외: exchange)
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.closed_interval = closed_interval
+        self.backoff = backoff
+        self.request_share = request_share
+        self.market_open = market_open or self._default_market_open
+        self.fetch_options = fetch_options
+
+        self._orders: Dict[str, TrackedOrder] = {}
+        self._lock = threading.RLock()
+        self._idle_polls = 0
+        self._last_poll = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self):
+        return (
+            f"OrderTracker(orders={len(self._orders)}, "
+            f"open={len(self.open_orders())}, running={self.is_running})"
+        )
+
+    def __enter__(self) -> "OrderTracker":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _default_market_open(self) -> bool:
+        from kis.utils.tool import is_korea_market_open, is_us_market_hours
+
+        if self.client.NAME == "OVERSEAS":
+            return is_us_market_hours()
+        return is_korea_market_open()
+
+    def __getitem__(self, order_no: str) -> TrackedOrder:
+        try:
+            return self._orders[order_no]
+        except KeyError as err:
+            raise KISBadArguments(f"Order '{order_no}' is not tracked") from err
+
+    def __contains__(self, order_no: str) -> bool:
+        return order_no in self._orders
+
+    def orders(self, status: Optional[OrderStatus] = None) -> List[TrackedOrder]:
+        """추적중인 주문 목록"""
+        with self._lock:
+            return [
+                order
+                for order in self._orders.values()
+                if status is None or order.status == status
+            ]
+
+    def open_orders(self) -> List[TrackedOrder]:
+        """완료되지 않은 주문 목록"""
+        with self._lock:
+            return [order for order in self._orders.values() if not order.is_done]
+
+    def track(
+        self,
+        order_no: str,
+        symbol: str,
+        order_type: Literal["buy", "sell"],
+        quantity: int,
+        price: Optional[float] = None,
+    ) -> TrackedOrder:
+        """
+        주문을 추적 목록에 추가합니다. 이미 추적중인 주문은 그대로 반환합니다.
+
+        :param order_no: 주문번호
+        :param symbol: 종목코드
+        :param order_type: 주문구분 (buy, sell)
+        :param quantity: 주문수량
+        :param price: 주문단가
+        """
+        with self._lock:
+            order = self._orders.get(order_no)
+            if order is None:
+                order = self._orders[order_no] = TrackedOrder(
+                    order_no=order_no,
+                    symbol=symbol,
+                    order_type=order_type,
+                    quantity=quantity,
+                    price=price,
+                )
+                self._idle_polls = 0
+        self._wake.set()
+        return order
+
+    def submit(self, order: Union["BasketOrder", Dict[str, Any]]) -> TrackedOrder:
+        """
+        주문을 전송하고 추적합니다.
+
+        :param order: BasketOrder 또는 같은 key를 가진 dict
+        """
+        from .batch import BasketOrder
+
+        if not isinstance(order, BasketOrder):
+            order = BasketOrder(**order)
+        data = self.client.order._order(**order.dict())
+        return self.track(
+            order_no=data.order_no,
+            symbol=order.symbol,
+            order_type=order.order_type,
+            quantity=order.quantity,
+            price=order.price,
+        )
+
+    def track_basket(self, report: "BatchReport") -> List[TrackedOrder]:
+        """`submit_basket` 결과 중 접수된 주문을 추적합니다."""
+        return [
+            self.track(
+                order_no=result.data.order_no,
+                symbol=result.item.symbol,
+                order_type=result.item.order_type,
+                quantity=result.item.quantity,
+                price=result.item.price,
+            )
+            for result in report.succeeded
+        ]
+
+    def wait(self, order_no: str, timeout: Optional[float] = None) -> bool:
+        """주문 1건이 완료될 때까지 기다립니다."""
+        return self[order_no].wait(timeout)
+
+    def wait_all(
+        self, order_nos: Optional[Iterable[str]] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        여러 주문이 모두 완료될 때까지 기다립니다.
+
+        :param order_nos: 주문번호 목록. None이면 추적중인 전체 주문
+        :param timeout: 최대 대기 시간(초)
+        :return: 모두 완료되었는지 여부
+        """
+        orders = self.orders() if order_nos is None else [self[no] for no in order_nos]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for order in orders:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if not order.wait(remaining):
+                return False
+        return True
+
+    def apply_notice(self, notice: "ExecutionNotice") -> Optional[TrackedOrder]:
+        """
+        실시간 체결통보를 반영합니다. `client.realtime.on_execution`의 callback으로 사용합니다.
+
+        :return: 갱신된 주문(추적중이 아닌 정정/취소 통보는 None)
+        """
+        with self._lock:
+            if notice.is_rejected:
+                order = self._orders.get(notice.order_no)
+                if order is not None:
+                    order._set_status(OrderStatus.REJECTED)
+                return order
+
+            if notice.modify_type != "new" and not notice.is_executed:
+                # 정정/취소 접수 통보: 원주문 종료, 정정이면 새 주문번호 추적
+                origin = self._orders.get(notice.original_order_no)
+                if origin is None:
+                    return None
+                if notice.modify_type == "update":
+                    origin.replaced_by = notice.order_no
+                    self.track(
+                        order_no=notice.order_no,
+                        symbol=origin.symbol,
+                        order_type=origin.order_type,
+                        quantity=notice.order_quantity or origin.remaining_quantity,
+                        price=notice.price or origin.price,
+                    )
+                origin._set_status(OrderStatus.CANCELLED)
+                self._idle_polls = 0
+                return origin
+
+            order = self.track(
+                order_no=notice.order_no,
+                symbol=notice.symbol,
+                order_type=notice.order_type,
+                quantity=notice.order_quantity or notice.quantity,
+                price=None if notice.is_executed else notice.price,
+            )
+            if notice.is_executed:
+                order._notice_filled += notice.quantity
+                order._notice_amount += notice.quantity * notice.price
+                if order._notice_filled >= order._polled_filled:
+                    order.average_price = order._notice_amount / order._notice_filled
+                if order._update_filled():
+                    self._idle_polls = 0
+            return order
+
+    def next_interval(self) -> Optional[float]:
+        """다음 조회까지의 간격(초). 미체결 주문이 없으면 None"""
+        open_count = len(self.open_orders())
+        if not open_count:
+            return None
+        if not self.market_open():
+            return self.closed_interval
+        # 한 번 조회하는 데 필요한 요청 수만큼 간격을 늘려 요청 한도의 일부만 사용
+        pages = math.ceil(open_count / ORDERS_PER_PAGE)
+        interval = max(
+            self.min_interval, pages * REQUEST_MIN_INTERVAL / self.request_share
+        )
+        return min(interval * self.backoff**self._idle_polls, self.max_interval)
+
+    def poll(self) -> bool:
+        """
+        미체결 내역(필요한 경우 당일 체결 내역)을 조회해 주문 상태를 갱신합니다.
+
+        :return: 상태가 바뀐 주문이 있는지 여부
+        """
+        self._last_poll = time.monotonic()
+        if not self.open_orders():
+            return False
+
+        order = self.client.order
+        try:
+            open_orders: Optional[Dict[str, "OpenOrder"]] = {
+                item.order_no: item
+                for item in order.fetch_open_orders(**self.fetch_options)
+            }
+        except KISDevModeError:
+            # 모의투자에서 미체결 내역을 조회할 수 없는 경우 체결 내역만 사용
+            open_orders = None
+
+        changed = False
+        missing = []
+        with self._lock:
+            for tracked in self.open_orders():
+                item = (
+                    None if open_orders is None else open_orders.get(tracked.order_no)
+                )
+                if item is None:
+                    missing.append(tracked)
+                    continue
+                tracked._polled_filled = max(
+                    tracked._polled_filled, tracked.quantity - item.quantity
+                )
+                changed |= tracked._update_filled()
+
+        if missing:
+            fills = order.fetch_order_fills(**self.fetch_options)
+            with self._lock:
+                changed |= self._apply_fills(missing, fills)
+
+        self._idle_polls = 0 if changed else self._idle_polls + 1
+        return changed
+
+    def _apply_fills(self, orders: List[TrackedOrder], fills: List[OrderFill]) -> bool:
+        by_order_no = {fill.order_no: fill for fill in fills}
+        children = {
+            fill.origin_order_no: fill
+            for fill in fills
+            if fill.origin_order_no and fill.modify_type != "new"
+        }
+
+        changed = False
+        for tracked in orders:
+            fill = by_order_no.get(tracked.order_no)
+            child = children.get(tracked.order_no)
+            if fill is not None:
+                if fill.filled_quantity > tracked._polled_filled:
+                    tracked._polled_filled = fill.filled_quantity
+                    if fill.price:
+                        tracked.average_price = fill.price
+                if fill.is_rejected:
+                    changed |= tracked._set_status(OrderStatus.REJECTED)
+                    continue
+                changed |= tracked._update_filled()
+            if child is not None and not tracked.is_done:
+                if child.modify_type == "update":
+                    tracked.replaced_by = child.order_no
+                    self.track(
+                        order_no=child.order_no,
+                        symbol=tracked.symbol,
+                        order_type=tracked.order_type,
+                        quantity=child.quantity,
+                        price=tracked.price,
+                    )
+                changed |= tracked._set_status(OrderStatus.CANCELLED)
+        return changed
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "OrderTracker":
+        """background thread에서 polling을 시작합니다."""
+        if not self.is_running:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="kis-order-tracker", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """polling을 종료합니다."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            interval = self.next_interval()
+            if interval is None:
+                # 미체결 주문이 생길 때까지 대기
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            remaining = self._last_poll + interval - time.monotonic()
+            if remaining > 0:
+                # 새 주문이 추가되면 간격을 다시 계산
+                self._wake.wait(remaining)
+                self._wake.clear()
+                continue
+
+            try:
+                self.poll()
+            except Exception as e:
+                self._idle_polls += 1
+                logger.warning("Failed to poll orders: %s", e)
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Literal, Tuple, overload
 
+from kis.core.base.cache import Position
 from kis.core.base.resources import Balance
 
 from .client import DomesticResource
@@ -76,3 +77,18 @@ class DomesticBalance(DomesticResource, Balance):
             deposits.extend([Deposit(**row) for row in result.detail])
 
         return portfolio, deposits
+
+    def to_positions(
+        self, snapshot: Tuple[List[Stock], List[Deposit]]
+    ) -> List[Position]:
+        """잔고 조회 결과를 보유종목 목록으로 변환"""
+        portfolio, _ = snapshot
+        return [
+            Position(
+                symbol=stock.pdno,
+                quantity=stock.hldg_qty,
+                average_price=stock.pchs_avg_pric,
+            )
+            for stock in portfolio
+            if stock.hldg_qty > 0
+        ]
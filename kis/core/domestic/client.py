@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
-from functools import cached_property
 
 from kis.core.base import KisClientBase
+from kis.utils.tool import locked_cached_property
 
 if TYPE_CHECKING:
     from .quote import DomesticQuote
@@ -13,17 +13,17 @@ class DomesticClient(KisClientBase):
     """국내 주식 전용 Client"""
     NAME = "DOMESTIC"
 
-    @cached_property
+    @locked_cached_property
     def quote(self) -> "DomesticQuote":
         from .quote import DomesticQuote
         return DomesticQuote(client=self)
 
-    @cached_property
+    @locked_cached_property
     def order(self) -> "DomesticOrder":
         from .order import DomesticOrder
         return DomesticOrder(client=self)
 
-    @cached_property
+    @locked_cached_property
     def balance(self) -> "DomesticBalance":
         from .balance import DomesticBalance
         return DomesticBalance(client=self)
@@ -1,8 +1,10 @@
 from datetime import datetime, date
 from typing import Optional, Literal, List, Any, Dict, Union, overload, Tuple
 
+from kis.core.base.batch import OpenOrder
 from kis.core.base.resources import Order
-from kis.exceptions import KISBadArguments, KISDevModeError
+from kis.core.base.tracker import OrderFill
+from kis.exceptions import KISBadArguments, KISDevModeError, KISNoData
 from kis.utils.tool import as_datetime
 from .client import DomesticResource
 from .schema import (
@@ -87,6 +89,15 @@ class DomesticOrder(DomesticResource, Order):
                     raise KISBadArguments("price is required")
                 order_division = "00"
 
+        if self.client.price_check:
+            price = self.client.references.check(
+                symbol,
+                order_type=order_type,
+                price=price,
+                quantity=quantity,
+                mode=self.client.price_check,
+            )
+
         headers = {"tr_id": tr_id, "custtype": "P"}
         data = {
             "CANO": account_prefix,
@@ -112,13 +123,22 @@ class DomesticOrder(DomesticResource, Order):
             as_market_price: bool = False,
             **kwargs
     ) -> OrderData:
-        return super().buy(
+        """
+        주식 매수
+
+        :param symbol: 종목코드
+        :param quantity: 주문수량
+        :param price: 주문단가 (as_market_price=True일 경우 무시)
+        :param order_division: 주문구분 (00: 지정가, 01: 시장가, etc)
+        :param as_market_price: 시장가 주문 여부
+        """
+        return self._order(
+            order_type="buy",
             symbol=symbol,
             quantity=quantity,
             price=price,
             order_division=order_division,
             as_market_price=as_market_price,
-            exchange=None,
         )
 
     def sell(
@@ -130,13 +150,22 @@ class DomesticOrder(DomesticResource, Order):
             as_market_price: bool = False,
             **kwargs
     ) -> OrderData:
-        return super().sell(
+        """
+        주식 매도
+
+        :param symbol: 종목코드
+        :param quantity: 주문수량
+        :param price: 주문단가 (as_market_price=True일 경우 무시)
+        :param order_division: 주문구분 (00: 지정가, 01: 시장가, etc)
+        :param as_market_price: 시장가 주문 여부
+        """
+        return self._order(
+            order_type="sell",
             symbol=symbol,
             quantity=quantity,
             price=price,
             order_division=order_division,
             as_market_price=as_market_price,
-            exchange=None,
         )
 
     def _modify(
@@ -180,6 +209,10 @@ class DomesticOrder(DomesticResource, Order):
             if as_market_price:
                 price = 0
                 order_division = "01"
+            elif modify_type == "cancel":
+                # 취소 주문은 주문단가를 사용하지 않음
+                price = price or 0
+                order_division = "00"
             else:
                 if not price:
                     raise KISBadArguments("price is required")
@@ -196,7 +229,6 @@ class DomesticOrder(DomesticResource, Order):
             is_total = "N"
 
         if modify_type == "cancel":
-            quantity = 0
             cancel_or_update_cd = "02"
         else:
             cancel_or_update_cd = "01"
@@ -269,6 +301,97 @@ class DomesticOrder(DomesticResource, Order):
             total=total,
         )
 
+    def fetch_open_orders(
+            self,
+            order_type: Literal["all", "buy", "sell"] = "all",
+    ) -> List[OpenOrder]:
+        """
+        정정/취소 가능한 미체결 주문 조회
+
+        :param order_type: 주문구분 (all, buy, sell)
+        """
+        return [
+            OpenOrder(
+                order_no=order.odno,
+                org_no=order.ord_gno_brno,
+                symbol=order.pdno,
+                order_type="sell" if order.sll_buy_dvsn_cd == "01" else "buy",
+                quantity=order.psbl_qty,
+                price=order.ord_unpr,
+                raw=order,
+            )
+            for order in self.fetch_unexecuted_orders(order_type=order_type)
+            if order.psbl_qty > 0
+        ]
+
+    def fetch_order_fills(
+            self,
+            order_type: Literal["all", "buy", "sell"] = "all",
+    ) -> List[OrderFill]:
+        """
+        당일 주문별 체결 현황 조회
+
+        정정/취소 주문은 별도 주문번호로 조회되며, origin_order_no에 원주문번호가 들어갑니다.
+
+        :param order_type: 주문구분 (all, buy, sell)
+        """
+        today = datetime.now()
+        try:
+            items, _ = self.fetch_executed_orders(
+                start_date=today, end_date=today, order_type=order_type
+            )
+        except KISNoData:
+            return []
+
+        fills = []
+        for item in items:
+            if item.cncl_yn == "Y":
+                modify_type = "cancel"
+            elif item.orgn_odno.strip("0"):
+                modify_type = "update"
+            else:
+                modify_type = "new"
+            fills.append(
+                OrderFill(
+                    order_no=item.odno,
+                    origin_order_no=item.orgn_odno,
+                    symbol=item.pdno,
+                    order_type="sell" if item.sll_buy_dvsn_cd == "01" else "buy",
+                    quantity=item.ord_qty,
+                    filled_quantity=item.tot_ccld_qty,
+                    price=item.avg_prvs,
+                    modify_type=modify_type,
+                    is_rejected=item.rjct_qty > 0,
+                )
+            )
+        return fills
+
+    def _cancel_open_order(self, order: OpenOrder) -> OrderData:
+        return self._modify(
+            modify_type="cancel",
+            org_no=order.org_no,
+            order_no=order.order_no,
+            total=True,
+            order_division=order.raw.ord_dvsn_cd if order.raw else None,
+        )
+
+    def _modify_open_order(
+            self,
+            order: OpenOrder,
+            price: Optional[int] = None,
+            quantity: Optional[int] = None,
+            as_market_price: bool = False,
+    ) -> OrderData:
+        return self._modify(
+            modify_type="update",
+            org_no=order.org_no,
+            order_no=order.order_no,
+            quantity=quantity,
+            total=quantity is None,
+            price=price if price is not None else int(order.price),
+            as_market_price=as_market_price,
+        )
+
     @overload
     def get_available_amount(
             self,
@@ -548,6 +671,5 @@ class DomesticOrder(DomesticResource, Order):
                 nk100=result.nk100,
             )
             summary_items.extend([ExecutedOrderSummary(**row) for row in result.summary])
-            print(result.detail)
 
         return summary_items, result.detail
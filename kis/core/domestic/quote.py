@@ -2,6 +2,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union, overload
 
+from kis.core.base.reference import ReferenceData
 from kis.core.base.resources import Quote
 from kis.core.domestic.schema import (
     FetchOHLCVHistory,
@@ -18,6 +19,9 @@ from .client import DomesticResource
 
 logger = logging.getLogger(__name__)
 
+# 가격대별 주식 호가단위를 사용하는 대표시장(rprs_mrkt_kor_name). ETF/ETN/ELW 등은 포함하지 않음
+KRX_STOCK_MARKETS = ("KOSPI", "KOSDAQ", "KSQ", "KONEX")
+
 
 class DomesticQuote(DomesticResource, Quote):
     def fetch_current_price(
@@ -46,6 +50,26 @@ class DomesticQuote(DomesticResource, Quote):
 
         return res.data
 
+    def fetch_reference(self, symbol: str) -> ReferenceData:
+        """
+        주문 검증용 종목 기준정보 조회
+
+        대표시장이 주식시장(KOSPI, KOSDAQ 등)이면 주문가격에 따라 호가단위를 정하고,
+        ETF/ETN 등이거나 대표시장을 알 수 없으면 조회한 호가단위를 그대로 사용합니다.
+
+        :param symbol: 종목코드
+        """
+        price = self.fetch_current_price(symbol)
+        return ReferenceData(
+            symbol=symbol,
+            tick_size=price.aspr_unit,
+            upper_bound=price.stck_mxpr,
+            lower_bound=price.stck_llam,
+            lot_size=price.hts_deal_qty_unit_val or 1,
+            tradable=price.temp_stop_yn != "Y",
+            krx_ticks=price.rprs_mrkt_kor_name.strip().startswith(KRX_STOCK_MARKETS),
+        )
+
     def _fetch_prices_by_minutes(self, symbol: str, to: Union[str, datetime, date]):
         """
         주식 당일 분봉 조회
@@ -51,14 +51,9 @@ class Exchange(str, Enum):
     @classmethod
     def find_symbol(cls, symbol: str) -> Optional["Exchange"]:
         """입력받은 symbol의 거래소를 찾아서 반환합니다. 없으면 None을 반환합니다."""
-        from kis.core.master import MasterBook
+        from kis.core.master.index import SymbolIndex
 
-        df = MasterBook.get("USA")
-        df = df.loc[df["symbol"] == symbol]
-        if len(df) == 0:
-            return None
-        value = df["exchange"].values[0]
-        return cls.from_value(value)
+        return SymbolIndex.get("USA").exchange_of(symbol)
 
     @property
     def master_file_name(self):
@@ -149,3 +144,84 @@ class OverseasOrderPrice(str, Enum):
         if self.name == "LOC":
             return "34"
         return "00"
+
+
+class RealtimeChannel(str, Enum):
+    """실시간(WebSocket) 시세 tr_id"""
+
+    DOMESTIC_TRADE = "H0STCNT0"  # 국내주식 실시간체결가
+    DOMESTIC_ORDERBOOK = "H0STASP0"  # 국내주식 실시간호가
+    OVERSEAS_TRADE = "HDFSCNT0"  # 해외주식 실시간지연체결가
+    OVERSEAS_ORDERBOOK = "HDFSASP0"  # 해외주식 실시간지연호가(미국)
+    DOMESTIC_NOTICE = "H0STCNI0"  # 국내주식 실시간체결통보
+    DOMESTIC_NOTICE_DEV = "H0STCNI9"  # 국내주식 실시간체결통보(모의투자)
+    OVERSEAS_NOTICE = "H0GSCNI0"  # 해외주식 실시간체결통보
+    OVERSEAS_NOTICE_DEV = "H0GSCNI9"  # 해외주식 실시간체결통보(모의투자)
+
+    @classmethod
+    def from_value(cls, value: str) -> "RealtimeChannel":
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value.upper())
+        except (ValueError, AttributeError) as err:
+            raise KISBadArguments(f"No such realtime channel: {value}") from err
+
+    @property
+    def is_overseas(self) -> bool:
+        return self.value.startswith(("HDFS", "H0GS"))
+
+    @property
+    def is_notice(self) -> bool:
+        """체결통보 여부. 체결통보는 종목코드 대신 HTS ID로 구독합니다."""
+        return self.value[4:7] == "CNI"
+
+    @classmethod
+    def notice(cls, is_overseas: bool, is_dev: bool) -> "RealtimeChannel":
+        """국내/해외, 모의투자 여부에 맞는 체결통보 tr_id"""
+        if is_overseas:
+            return cls.OVERSEAS_NOTICE_DEV if is_dev else cls.OVERSEAS_NOTICE
+        return cls.DOMESTIC_NOTICE_DEV if is_dev else cls.DOMESTIC_NOTICE
+
+
+class OrderStatus(str, Enum):
+    """주문 상태"""
+
+    ACCEPTED = "accepted"  # 접수
+    PARTIALLY_FILLED = "partially_filled"  # 일부 체결
+    FILLED = "filled"  # 전량 체결
+    CANCELLED = "cancelled"  # 취소(정정으로 새 주문번호가 생긴 원주문 포함)
+    REJECTED = "rejected"  # 거부
+
+    @property
+    def is_done(self) -> bool:
+        """더 이상 상태가 바뀌지 않는 주문인지 여부"""
+        return self in (self.FILLED, self.CANCELLED, self.REJECTED)
+
+
+class RequestPriority(str, Enum):
+    """REST 요청 우선순위(위에 있을수록 먼저 전송)"""
+
+    CANCEL = "cancel"  # 정정/취소, token 발급
+    ORDER = "order"  # 신규 주문
+    BALANCE = "balance"  # 잔고/주문가능금액/체결내역 조회
+    QUOTE = "quote"  # 현재가 조회
+    BULK = "bulk"  # 기간별 시세 등 대량 조회
+
+    @classmethod
+    def from_value(cls, value: str) -> "RequestPriority":
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value.lower())
+        except (ValueError, AttributeError) as err:
+            raise KISBadArguments(f"No such request priority: {value}") from err
+
+    @property
+    def rank(self) -> int:
+        return list(RequestPriority).index(self)
+
+    @property
+    def is_preemptible(self) -> bool:
+        """다른 요청이 기다리는 동안에는 전송하지 않는 요청인지 여부"""
+        return self is RequestPriority.BULK
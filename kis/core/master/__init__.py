@@ -1,17 +1,33 @@
+import hashlib
+import logging
 import os
-import tempfile
-import zipfile
+import pickle
+import threading
 from abc import ABCMeta
-from typing import Literal, Optional, Union, overload
-from urllib import request
-
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union, overload
 
 from kis.constants import CONFIG_DIR
 from kis.core.enum import Exchange
+from kis.utils.tool import load_yaml, save_yaml
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .screener import MasterQuery
+
+logger = logging.getLogger(__name__)
 
 MASTER_DIR = os.path.join(CONFIG_DIR, "master")
 
+# 여러 거래소를 합쳐서 조회하는 이름
+MASTER_GROUPS: Dict[str, Tuple[Exchange, ...]] = {
+    "KRX": (Exchange.KOSPI, Exchange.KOSDAQ),
+    "USA": (Exchange.NAS, Exchange.NYS, Exchange.AMS),
+}
+
+# parse_dataframe 결과가 바뀌는 경우 올려서 기존 cache를 무효화합니다.
+CACHE_VERSION = 2
+
 
 class MasterBook(metaclass=ABCMeta):
     """
@@ -36,50 +52,144 @@ class MasterBook(metaclass=ABCMeta):
 
         self.exchange = exchange
         self.master_info = self.exchange.master_file_name
-        self.cache_dir = os.path.join(MASTER_DIR, exchange)
+        self.cache_dir = os.path.join(MASTER_DIR, self.name)
 
     @property
     def name(self):
         """Get exchange name."""
         return self.exchange.name.lower()
 
+    @staticmethod
+    def source_path(exchange: Union[str, Exchange]) -> str:
+        """압축 해제된 마스터 파일 경로"""
+        exchange = Exchange.from_value(exchange)
+        if exchange == Exchange.KOSPI:
+            file_name = "kospi_code.mst"
+        elif exchange == Exchange.KOSDAQ:
+            file_name = "kosdaq_code.mst"
+        else:
+            file_name = f"{exchange.name}MST.COD"
+        return os.path.join(MASTER_DIR, exchange.name.lower(), file_name)
+
+    @property
+    def source_file(self) -> str:
+        """압축 해제된 마스터 파일 경로"""
+        return self.source_path(self.exchange)
+
     @property
     def url(self):
         """Get master file url."""
-        return (
-            "https://new.real.download.dws.co.kr/common/master/"
-            + self.exchange.master_file_name
-        )
+        return MasterRefresher.get().url(self.exchange)
 
-    def download_file(self, dirname: Optional[str] = None):
+    def download_file(self):
         """Download master file and unzip it."""
-        if dirname:
+        MasterRefresher.get().refresh(self.exchange, force=True)
+
+    @property
+    def cache_file(self) -> str:
+        """파싱된 DataFrame cache 경로"""
+        return os.path.join(self.cache_dir, f"{self.name}.pkl")
 
-            # path
-            master_path = os.path.join(dirname, "code.zip")
-            save_dir = os.path.join(MASTER_DIR, self.name)
+    @property
+    def cache_meta_file(self) -> str:
+        """cache를 만든 원본 파일의 fingerprint 경로"""
+        return os.path.join(self.cache_dir, f"{self.name}.meta.yaml")
 
-            # download
-            request.urlretrieve(self.url, filename=master_path)
+    def fingerprint(self, with_hash: bool = True) -> dict:
+        """원본 마스터 파일의 size, mtime, hash"""
+        stat = os.stat(self.source_file)
+        fingerprint = {
+            "version": CACHE_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if with_hash:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(self.source_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            fingerprint["hash"] = digest.hexdigest()
+        return fingerprint
 
-            # unzip
-            zip = zipfile.ZipFile(master_path)
-            zip.extractall(save_dir)
-            zip.close()
+    def load_cache(self) -> Optional["pd.DataFrame"]:
+        """
+        원본 파일이 바뀌지 않았으면 cache된 DataFrame을 반환합니다.
+        size/mtime이 같으면 hash 계산 없이 cache를 사용하고, 다르면 hash를 비교합니다.
+        """
+        if not os.path.exists(self.cache_file) or not os.path.exists(
+            self.cache_meta_file
+        ):
+            return None
+        try:
+            meta = load_yaml(self.cache_meta_file) or {}
+        except Exception:
+            return None
 
-        else:
-            with tempfile.TemporaryDirectory(
-                prefix="kis-", suffix=self.name
-            ) as dirname:
-                self.download_file(dirname)
+        fingerprint = self.fingerprint(with_hash=False)
+        if any(meta.get(key) != value for key, value in fingerprint.items()):
+            # 다시 다운로드 했지만 내용이 같은 경우 mtime만 갱신
+            fingerprint = self.fingerprint()
+            if (
+                meta.get("hash") != fingerprint["hash"]
+                or meta.get("version") != fingerprint["version"]
+            ):
+                return None
+            save_yaml(fingerprint, file_path=self.cache_meta_file)
 
-    def get_dataframe(self):
-        """Get master dataframe."""
-        raise NotImplemented("create_dataframe method must be implemented.")
+        try:
+            with open(self.cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Failed to load master cache '%s': %s", self.cache_file, e)
+            return None
+
+    def save_cache(self, df: "pd.DataFrame"):
+        """파싱된 DataFrame을 원본 파일의 fingerprint와 함께 저장합니다."""
+        fingerprint = self.fingerprint()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "wb") as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, self.cache_file)
+        save_yaml(fingerprint, file_path=self.cache_meta_file)
+
+    def clear_cache(self):
+        """cache를 삭제합니다."""
+        for path in (self.cache_file, self.cache_meta_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def parse_dataframe(self) -> "pd.DataFrame":
+        """원본 마스터 파일을 DataFrame으로 파싱합니다."""
+        raise NotImplementedError("parse_dataframe method must be implemented.")
+
+    def get_dataframe(self, refresh: bool = False) -> "pd.DataFrame":
+        """
+        Get master dataframe.
+        원본 파일이 없거나 TTL이 지났으면 다시 받고, 원본 파일이 바뀌지 않았으면 cache를 사용합니다.
+
+        :param refresh: True인 경우 cache를 무시하고 원본 파일을 다시 파싱
+        """
+        MasterRefresher.get().refresh_if_possible(self.exchange)
+
+        if not refresh:
+            df = self.load_cache()
+            if df is not None:
+                return df
+
+        df = self.parse_dataframe()
+        self.save_cache(df)
+        return df
 
     @overload
     @classmethod
-    def get(cls, name: str, with_detail: bool = False) -> pd.DataFrame:
+    def get(
+        cls,
+        name: str,
+        with_detail: bool = False,
+        compact: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> "pd.DataFrame":
         """str을 사용하는 경우(lower/upper case 허용)"""
         ...
 
@@ -89,18 +199,32 @@ class MasterBook(metaclass=ABCMeta):
         cls,
         name: Literal["KOSPI", "KOSDAQ", "KRX", "NAS", "NYS", "AMS", "USA"],
         with_detail: bool = False,
-    ) -> pd.DataFrame:
+        compact: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> "pd.DataFrame":
         """str을 사용하는 경우"""
         ...
 
     @overload
     @classmethod
-    def get(cls, name: Exchange, with_detail: bool = False) -> pd.DataFrame:
+    def get(
+        cls,
+        name: Exchange,
+        with_detail: bool = False,
+        compact: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> "pd.DataFrame":
         """Exchange enum을 사용하는 경우"""
         ...
 
     @classmethod
-    def get(cls, name: str, with_detail: bool = False) -> pd.DataFrame:
+    def get(
+        cls,
+        name: str,
+        with_detail: bool = False,
+        compact: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> "pd.DataFrame":
         """
         Get master book instance by exchange name.
         :param name: exchange name
@@ -108,26 +232,52 @@ class MasterBook(metaclass=ABCMeta):
             해외: 'NAS','NYS','AMS', 'USA'(NAS + NYS + AMS)
                   and etc('SHS','SHI','SZS','SZI','TSE','HKS','HNX','HSX')
         :param with_detail: if False, return only symbol column
+        :param compact: True인 경우 Y/N 여부는 bool, code는 category, 정수는 작은 정수 dtype으로 변환
+        :param columns: 가져올 column 목록(거래소 묶음의 경우 없는 column은 NaN)
         """
-        if name == "KRX":
-            return pd.concat(
-                [
-                    cls.get(Exchange.KOSPI, with_detail=with_detail),
-                    cls.get(Exchange.KOSDAQ, with_detail=with_detail),
-                ],
-                axis=0,
-            )
+        import pandas as pd
 
-        if name == "USA":
-            return pd.concat(
+        if name in MASTER_GROUPS:
+            exchanges = MASTER_GROUPS[name]
+            MasterRefresher.get().refresh_many(exchanges)
+            df = pd.concat(
                 [
-                    cls.get(Exchange.NAS, with_detail=with_detail),
-                    cls.get(Exchange.NYS, with_detail=with_detail),
-                    cls.get(Exchange.AMS, with_detail=with_detail),
+                    cls._get(exchange, with_detail, columns=columns, strict=False)
+                    for exchange in exchanges
                 ],
                 axis=0,
             )
+            if columns:
+                df = df.reindex(columns=columns)
+        else:
+            df = cls._get(name, with_detail, columns=columns)
+
+        if compact:
+            from .compact import compact_dataframe
+
+            df = compact_dataframe(df)
+        return df
+
+    @classmethod
+    def screen(cls, name: Union[str, Exchange]) -> "MasterQuery":
+        """
+        거래소(묶음) 전체 종목에 대한 조건 조회를 시작합니다.
+
+        :example:
+        >>> MasterBook.screen("KOSPI").tradable().where("ROE", ">", 10).top(20, by="시가총액")
+        """
+        from .screener import screen
+
+        return screen(name)
 
+    @classmethod
+    def _get(
+        cls,
+        name: Union[str, Exchange],
+        with_detail: bool = False,
+        columns: Optional[List[str]] = None,
+        strict: bool = True,
+    ) -> "pd.DataFrame":
         if (name := name.upper()) in list(Exchange):
             if name == Exchange.KOSPI:
                 from .kospi import KospiMaster
@@ -159,9 +309,48 @@ class MasterBook(metaclass=ABCMeta):
                 ]
 
             df = master.get_dataframe()
-            if with_detail:
-                return df
-            return df.loc[:, symbol_columns].rename(
-                columns=dict(zip(symbol_columns, renamed_symbol_columns))
-            )
+            if not with_detail:
+                df = df.loc[:, symbol_columns].rename(
+                    columns=dict(zip(symbol_columns, renamed_symbol_columns))
+                )
+            if columns:
+                if not strict:
+                    columns = [column for column in columns if column in df.columns]
+                df = df.loc[:, columns]
+            return df
         raise ValueError("Invalid exchange name.")
+
+
+class LazyMaster:
+    """
+    처음 접근할 때 MasterBook.get()으로 마스터 데이터를 읽는 class attribute descriptor.
+    모듈 import 시점에 마스터 파일을 다운로드/파싱하지 않도록 class attribute 대신 사용합니다.
+
+    :example:
+    >>> class OverseasClient:
+    ...     SYMBOL_MASTER = LazyMaster("USA")
+    >>> OverseasClient.SYMBOL_MASTER.head()  # 이 시점에 마스터 파일을 읽음
+    """
+
+    def __init__(self, name: str, with_detail: bool = False):
+        self.name = name
+        self.with_detail = with_detail
+        self._df: Optional["pd.DataFrame"] = None
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner) -> "pd.DataFrame":
+        if self._df is None:
+            with self._lock:
+                if self._df is None:
+                    self._df = MasterBook.get(self.name, with_detail=self.with_detail)
+        return self._df
+
+    def reset(self):
+        """읽어둔 마스터 데이터를 버리고 다음 접근 시 다시 읽습니다."""
+        with self._lock:
+            self._df = None
+
+
+from .index import SymbolIndex, SymbolInfo  # noqa: E402
+from .refresh import MasterRefresher  # noqa: E402
+from .search import SymbolSearch  # noqa: E402
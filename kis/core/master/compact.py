@@ -0,0 +1,70 @@
+"""
+# 마스터 DataFrame 메모리 절약
+
+object dtype으로 읽은 마스터 DataFrame을 column 성격에 맞는 dtype으로 변환합니다.
+
+- Y/N 여부 column: bool (빈 값이 있으면 nullable boolean)
+- 값의 종류가 적은 code column: category
+- 정수 column: 값 범위에 맞는 가장 작은 정수 dtype(NaN이 있으면 nullable 정수)
+"""
+import pandas as pd
+
+FLAG_VALUES = {"Y": True, "N": False}
+
+# 전체 행 대비 고유값 비율이 이 값 이하이면 category로 변환
+CATEGORY_RATIO = 0.5
+
+
+def compact_column(
+    series: pd.Series, category_ratio: float = CATEGORY_RATIO
+) -> pd.Series:
+    """column 하나를 메모리를 덜 사용하는 dtype으로 변환합니다."""
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast="integer")
+
+    if pd.api.types.is_float_dtype(series.dtype):
+        # 여러 거래소를 합치면서 NaN이 생긴 정수 column은 nullable 정수로 변환
+        values = series.dropna()
+        if (
+            not values.empty
+            and values.abs().max() < 2**53
+            and (values % 1 == 0).all()
+        ):
+            return pd.to_numeric(series.astype("Int64"), downcast="integer")
+        return series
+
+    if series.dtype != object:
+        return series
+
+    values = series.dropna()
+    if values.empty:
+        return series
+
+    uniques = set(values.unique())
+    if uniques <= FLAG_VALUES.keys():
+        flags = series.map(FLAG_VALUES)
+        if len(values) == len(series):
+            return flags.astype(bool)
+        return flags.astype("boolean")
+
+    if len(uniques) <= len(series) * category_ratio:
+        return series.astype("category")
+    return series
+
+
+def compact_dataframe(
+    df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO
+) -> pd.DataFrame:
+    """
+    마스터 DataFrame의 column dtype을 변환해 메모리 사용량을 줄입니다.
+
+    :param df: 마스터 DataFrame
+    :param category_ratio: category로 변환할 고유값 비율
+    """
+    return pd.DataFrame(
+        {
+            column: compact_column(df[column], category_ratio=category_ratio).array
+            for column in df.columns
+        },
+        index=df.index,
+    )
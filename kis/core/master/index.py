@@ -0,0 +1,179 @@
+"""
+# 종목코드 -> 거래소 index
+
+MasterBook을 매번 읽고 DataFrame 전체를 검색하는 대신, 프로세스 전체에서 한 번 만든
+dict로 종목코드의 거래소/종목명을 조회합니다. 마스터 파일이 갱신되면(mtime, size 변경)
+다음 조회 시점에 index를 다시 만듭니다.
+"""
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from kis.core.enum import Exchange
+from kis.exceptions import KISBadArguments
+
+# index를 만들 거래소 묶음
+INDEX_GROUPS: Dict[str, Tuple[Exchange, ...]] = {
+    "USA": (Exchange.NAS, Exchange.NYS, Exchange.AMS),
+    "KRX": (Exchange.KOSPI, Exchange.KOSDAQ),
+}
+
+
+def source_fingerprint(exchanges: Tuple[Exchange, ...]) -> List[Tuple[str, int, int]]:
+    """거래소 마스터 파일의 (경로, mtime, size) 목록"""
+    from . import MasterBook
+
+    fingerprint = []
+    for exchange in exchanges:
+        path = MasterBook.source_path(exchange)
+        try:
+            stat = os.stat(path)
+            fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            fingerprint.append((path, 0, 0))
+    return fingerprint
+
+
+class SymbolInfo(NamedTuple):
+    """종목 정보"""
+
+    symbol: str  # 종목코드
+    exchange: Exchange  # 거래소
+    name: str  # 종목명(한글)
+    english_name: str  # 종목명(영문)
+    currency: str  # 통화
+
+
+class SymbolIndex:
+    """
+    종목코드 -> SymbolInfo hash map
+
+    :example:
+    >>> from kis.core.master import SymbolIndex
+    >>> SymbolIndex.get("USA").exchange_of("AAPL")
+    <Exchange.NAS: 'NAS'>
+    """
+
+    _instances: Dict[str, "SymbolIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, group: str, check_interval: float = 60.0):
+        """
+        :param group: 'USA'(NAS + NYS + AMS) 또는 'KRX'(KOSPI + KOSDAQ)
+        :param check_interval: 마스터 파일 변경 여부를 확인하는 최소 간격(초)
+        """
+        group = group.upper()
+        if group not in INDEX_GROUPS:
+            raise KISBadArguments(f"No such index group: '{group}'")
+        self.group = group
+        self.exchanges = INDEX_GROUPS[group]
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._symbols: Dict[str, SymbolInfo] = {}
+        self._fingerprint: Optional[List[Tuple[str, int, int]]] = None
+        self._checked_at = 0.0
+
+    def __repr__(self):
+        return f"SymbolIndex(group='{self.group}', symbols={len(self._symbols)})"
+
+    @classmethod
+    def get(cls, group: str = "USA") -> "SymbolIndex":
+        """프로세스 전체에서 공유하는 index를 반환합니다."""
+        group = group.upper()
+        index = cls._instances.get(group)
+        if index is None:
+            with cls._instances_lock:
+                index = cls._instances.get(group)
+                if index is None:
+                    index = cls._instances[group] = cls(group)
+        return index
+
+    def _current_fingerprint(self) -> List[Tuple[str, int, int]]:
+        return source_fingerprint(self.exchanges)
+
+    def build(self) -> "SymbolIndex":
+        """마스터 파일을 읽어 index를 (다시) 만듭니다."""
+        from . import MasterBook
+
+        with self._lock:
+            symbols: Dict[str, SymbolInfo] = {}
+            # 같은 종목코드가 여러 거래소에 있으면 앞쪽 거래소를 우선
+            for exchange in reversed(self.exchanges):
+                df = MasterBook.get(exchange, with_detail=True)
+                if exchange in (Exchange.KOSPI, Exchange.KOSDAQ):
+                    codes, names = df["단축코드"], df["한글명"]
+                    english_names = currencies = None
+                else:
+                    codes, names = df["symbol"], df["korean_name"]
+                    english_names, currencies = df["english_name"], df["currency"]
+
+                codes = codes.astype(str).str.strip().tolist()
+                names = names.fillna("").astype(str).tolist()
+                if english_names is None:
+                    english_names = [""] * len(codes)
+                    currencies = [exchange.currency()] * len(codes)
+                else:
+                    english_names = english_names.fillna("").astype(str).tolist()
+                    currencies = currencies.fillna("").astype(str).tolist()
+
+                symbols.update(
+                    (code, SymbolInfo(code, exchange, name, english, currency))
+                    for code, name, english, currency in zip(
+                        codes, names, english_names, currencies
+                    )
+                )
+
+            self._symbols = symbols
+            self._fingerprint = self._current_fingerprint()
+            self._checked_at = time.monotonic()
+        return self
+
+    def refresh_if_changed(self, force: bool = False) -> bool:
+        """
+        마스터 파일이 바뀌었으면 index를 다시 만듭니다.
+
+        :param force: check_interval과 관계없이 즉시 확인
+        :return: index를 다시 만들었는지 여부
+        """
+        if self._fingerprint is None:
+            self.build()
+            return True
+
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+
+        if self._current_fingerprint() != self._fingerprint:
+            self.build()
+            return True
+        return False
+
+    @property
+    def fingerprint(self) -> Optional[List[Tuple[str, int, int]]]:
+        """index를 만든 마스터 파일의 fingerprint"""
+        return self._fingerprint
+
+    def symbols(self) -> List[SymbolInfo]:
+        """전체 종목 정보"""
+        self.refresh_if_changed()
+        return list(self._symbols.values())
+
+    def lookup(self, symbol: str) -> Optional[SymbolInfo]:
+        """종목코드로 종목 정보를 조회합니다. 없으면 None을 반환합니다."""
+        self.refresh_if_changed()
+        return self._symbols.get(symbol)
+
+    def exchange_of(self, symbol: str) -> Optional[Exchange]:
+        """종목코드의 거래소를 조회합니다. 없으면 None을 반환합니다."""
+        info = self.lookup(symbol)
+        return info.exchange if info else None
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.lookup(symbol) is not None
+
+    def __len__(self) -> int:
+        self.refresh_if_changed()
+        return len(self._symbols)
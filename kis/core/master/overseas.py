@@ -1,5 +1,3 @@
-import os
-
 import pandas as pd
 
 from . import MasterBook
@@ -10,10 +8,8 @@ class OverseasMaster(MasterBook):
     def __init__(self, name: str):
         super().__init__(exchange=name)
 
-    def get_dataframe(self) -> pd.DataFrame:
-        file_name = os.path.join(self.cache_dir, f"{self.name.upper()}MST.COD")
-        if not os.path.exists(file_name):
-            self.download_file()
+    def parse_dataframe(self) -> pd.DataFrame:
+        file_name = self.source_file
 
         columns = [
             "national_code",
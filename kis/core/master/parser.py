@@ -0,0 +1,157 @@
+"""
+# KOSPI/KOSDAQ 마스터 파일(.mst) parser
+
+.mst 파일의 각 행은 가변 길이의 앞부분(단축코드 9자리, 표준코드 12자리, 한글명)과
+고정 길이의 뒷부분(field_specs)으로 구성됩니다.
+파일을 한 번 bytes로 읽은 뒤 행 끝 위치를 기준으로 뒷부분을 (행, byte) 배열로 만들고,
+각 column을 offset으로 잘라 NumPy에서 한 번에 처리합니다.
+중간 파일 없이 `read_csv` + `read_fwf`를 사용하던 기존 결과와 같은 DataFrame을 만듭니다.
+"""
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+HEAD_COLUMNS = ["단축코드", "표준코드", "한글명"]
+
+# read_csv에서 기본으로 NaN으로 처리하는 문자열(pandas 기본 `na_values`)
+NA_VALUES = frozenset(
+    [
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "n/a",
+        "nan",
+        "null",
+    ]
+)
+
+
+def infer_column(values: np.ndarray) -> pd.Series:
+    """
+    문자열 column을 read_csv와 같은 규칙으로 변환합니다.
+    빈 값은 NaN, 모두 숫자이면 int64(NaN이 있으면 float64), 나머지는 문자열(object)
+    """
+    series = pd.Series(values.astype(object))
+    is_na = series.isin(NA_VALUES)
+    if is_na.any():
+        series[is_na] = np.nan
+    try:
+        return pd.to_numeric(series)
+    except (ValueError, TypeError):
+        return series
+
+
+def parse_digits(values: np.ndarray) -> Optional[pd.Series]:
+    """
+    (행, byte) 배열의 각 행이 공백으로 채운 숫자(0-9)이면 문자열 변환 없이 정수로 계산합니다.
+    read_csv와 동일하게 빈 행이 없으면 int64, 있으면 NaN을 포함한 float64를 반환하고,
+    숫자가 아닌 값이 있으면 None을 반환합니다.
+    """
+    width = values.shape[1]
+    if width > 18 or not values.size:
+        return None
+    is_space = values == ord(" ")
+    digits = values - ord("0")
+    if not (is_space | (digits <= 9)).all():
+        return None
+    if (~is_space[:, :-1] & is_space[:, 1:]).any():
+        # 숫자 뒤에 공백이 있는 경우(왼쪽 정렬)
+        return None
+
+    digits[is_space] = 0
+    numbers = digits.astype(np.int64) @ (
+        10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    )
+    is_blank = is_space[:, -1]
+    if is_blank.any():
+        numbers = numbers.astype(np.float64)
+        numbers[is_blank] = np.nan
+    return pd.Series(numbers)
+
+
+def parse_fixed_width(
+    file_name: str,
+    widths: Sequence[int],
+    columns: List[str],
+    encoding: str = "cp949",
+) -> pd.DataFrame:
+    """
+    .mst 파일을 DataFrame으로 변환합니다.
+
+    :param file_name: .mst 파일 경로
+    :param widths: 각 행 뒷부분의 고정 길이 column 너비(field_specs)
+    :param columns: 각 행 뒷부분의 column 이름
+    :param encoding: 파일 encoding
+    """
+    with open(file_name, mode="rb") as f:
+        data = f.read()
+    if data and not data.endswith(b"\n"):
+        data += b"\n"
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    # 행 시작/끝 위치('\r\n'은 '\n'과 동일하게 처리, 빈 행은 무시)
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
+    line_ends = newlines.copy()
+    line_ends[
+        (line_ends > line_starts) & (buffer[np.maximum(line_ends - 1, 0)] == ord("\r"))
+    ] -= 1
+    non_empty = line_ends > line_starts
+    line_starts, line_ends = line_starts[non_empty], line_ends[non_empty]
+
+    # 뒷부분: (행, byte) 배열
+    tail_width = int(sum(widths))
+    tail_starts = line_ends - tail_width
+    tail = buffer[tail_starts[:, None] + np.arange(tail_width)]
+
+    frame = {}
+
+    # 앞부분: 행마다 길이가 다르므로 행 단위로 decode
+    heads = [
+        data[start:end].decode(encoding)
+        for start, end in zip(line_starts.tolist(), tail_starts.tolist())
+    ]
+    frame[HEAD_COLUMNS[0]] = infer_column(
+        np.array([head[0:9].rstrip() for head in heads], dtype=object)
+    )
+    frame[HEAD_COLUMNS[1]] = infer_column(
+        np.array([head[9:21].rstrip() for head in heads], dtype=object)
+    )
+    frame[HEAD_COLUMNS[2]] = infer_column(
+        np.array([head[21:].strip() for head in heads], dtype=object)
+    )
+
+    # 뒷부분이 ASCII만으로 구성된 경우(일반적인 경우) decode 대신 dtype 변환
+    is_ascii = not tail.size or tail.max() < 0x80
+
+    offset = 0
+    for column, width in zip(columns, widths):
+        values = np.ascontiguousarray(tail[:, offset : offset + width])
+        offset += width
+
+        numbers = parse_digits(values)
+        if numbers is not None:
+            frame[column] = numbers
+            continue
+
+        values = np.char.strip(values.view(f"S{width}").ravel())
+        if is_ascii:
+            values = values.astype(f"U{width}")
+        else:
+            values = np.char.decode(values, encoding)
+        frame[column] = infer_column(values)
+
+    return pd.DataFrame(frame)
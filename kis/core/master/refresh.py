@@ -0,0 +1,277 @@
+"""
+# 마스터 파일 갱신
+
+거래소별 TTL이 지난 마스터 파일만 조건부 요청(ETag/Last-Modified)으로 다시 받습니다.
+zip은 MASTER_DIR 아래 임시 디렉토리에 받아서 압축을 풀고, 파일 단위로 `os.replace` 하기 때문에
+다른 process/thread가 쓰는 도중의 파일을 읽는 일이 없습니다.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Union
+from urllib import request
+from urllib.error import HTTPError, URLError
+
+from kis.constants import KIS_MASTER_BASE_URL
+from kis.core.enum import Exchange
+from kis.utils.tool import load_yaml, save_yaml
+
+logger = logging.getLogger(__name__)
+
+# 마스터 파일은 하루 한 번 갱신됩니다.
+DEFAULT_TTL = 12 * 60 * 60
+
+
+class MasterRefresher:
+    """
+    마스터 파일 갱신 관리
+
+    :example:
+    >>> from kis.core.master import MasterRefresher
+    >>> refresher = MasterRefresher.get()
+    >>> refresher.ttl[Exchange.NAS] = 60 * 60  # 거래소별 TTL(초)
+    >>> refresher.refresh_many(["NAS", "NYS", "AMS"])
+    {<Exchange.NAS: 'NAS'>: True, <Exchange.NYS: 'NYS'>: False, <Exchange.AMS: 'AMS'>: False}
+    """
+
+    _instance: Optional["MasterRefresher"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        default_ttl: float = DEFAULT_TTL,
+        ttl: Optional[Dict[Union[str, Exchange], float]] = None,
+        timeout: float = 30.0,
+        max_workers: int = 4,
+        retry_interval: float = 5 * 60,
+    ):
+        """
+        :param base_url: 마스터 zip 파일 base url(기본값: KIS_MASTER_BASE_URL)
+        :param default_ttl: 기본 TTL(초)
+        :param ttl: 거래소별 TTL(초)
+        :param timeout: 요청 timeout(초)
+        :param max_workers: 동시에 다운로드할 최대 거래소 수
+        :param retry_interval: 갱신에 실패한 경우 다시 시도하기까지의 최소 간격(초)
+        """
+        self.base_url = base_url or KIS_MASTER_BASE_URL
+        self.default_ttl = default_ttl
+        self.ttl: Dict[Exchange, float] = {
+            Exchange.from_value(exchange): value
+            for exchange, value in (ttl or {}).items()
+        }
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.retry_interval = retry_interval
+
+        self._failed_at: Dict[Exchange, float] = {}
+        self._locks: Dict[Exchange, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "MasterRefresher":
+        """프로세스 전체에서 공유하는 MasterRefresher를 반환합니다."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _lock(self, exchange: Exchange) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(exchange, threading.Lock())
+
+    def url(self, exchange: Union[str, Exchange]) -> str:
+        """마스터 zip 파일 url"""
+        exchange = Exchange.from_value(exchange)
+        return self.base_url.rstrip("/") + "/" + exchange.master_file_name
+
+    @staticmethod
+    def cache_dir(exchange: Exchange) -> str:
+        from . import MasterBook
+
+        return os.path.dirname(MasterBook.source_path(exchange))
+
+    def meta_path(self, exchange: Union[str, Exchange]) -> str:
+        """다운로드 정보(ETag, Last-Modified, 다운로드 시각) 파일 경로"""
+        exchange = Exchange.from_value(exchange)
+        return os.path.join(
+            self.cache_dir(exchange), f"{exchange.name.lower()}.download.yaml"
+        )
+
+    def load_meta(self, exchange: Exchange) -> dict:
+        path = self.meta_path(exchange)
+        if not os.path.exists(path):
+            return {}
+        try:
+            return load_yaml(path) or {}
+        except Exception:
+            return {}
+
+    def get_ttl(self, exchange: Union[str, Exchange]) -> float:
+        return self.ttl.get(Exchange.from_value(exchange), self.default_ttl)
+
+    def is_stale(self, exchange: Union[str, Exchange]) -> bool:
+        """마스터 파일이 없거나 TTL이 지났는지 여부"""
+        from . import MasterBook
+
+        exchange = Exchange.from_value(exchange)
+        source_file = MasterBook.source_path(exchange)
+        if not os.path.exists(source_file):
+            return True
+
+        # 다운로드 정보가 없으면(이전 버전에서 받은 파일) 파일 수정 시각을 사용
+        checked_at = self.load_meta(exchange).get("checked_at")
+        if checked_at is None:
+            checked_at = os.path.getmtime(source_file)
+        return time.time() - checked_at >= self.get_ttl(exchange)
+
+    def refresh(self, exchange: Union[str, Exchange], force: bool = False) -> bool:
+        """
+        TTL이 지난 경우 조건부 요청으로 마스터 파일을 갱신합니다.
+
+        :param exchange: 거래소
+        :param force: True인 경우 TTL과 ETag/Last-Modified를 무시하고 다시 다운로드
+        :return: 새 파일을 받았는지 여부(304 Not Modified이면 False)
+        """
+        exchange = Exchange.from_value(exchange)
+        with self._lock(exchange):
+            if not force and not self.is_stale(exchange):
+                return False
+            return self._download(exchange, conditional=not force)
+
+    def refresh_many(
+        self, exchanges: Iterable[Union[str, Exchange]], force: bool = False
+    ) -> Dict[Exchange, bool]:
+        """
+        여러 거래소의 마스터 파일을 병렬로 갱신합니다.
+        갱신에 실패해도 기존 마스터 파일이 있으면 기존 파일을 사용합니다.
+
+        :return: 거래소별 새 파일을 받았는지 여부
+        """
+        exchanges = [Exchange.from_value(exchange) for exchange in exchanges]
+        targets = [e for e in exchanges if force or self.is_stale(e)]
+        results = {exchange: False for exchange in exchanges}
+        if len(targets) == 1:
+            results[targets[0]] = self.refresh_if_possible(targets[0], force=force)
+        elif targets:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(targets)),
+                thread_name_prefix="kis-master",
+            ) as executor:
+                futures = {
+                    exchange: executor.submit(self.refresh_if_possible, exchange, force)
+                    for exchange in targets
+                }
+                for exchange, future in futures.items():
+                    results[exchange] = future.result()
+        return results
+
+    def refresh_if_possible(
+        self, exchange: Union[str, Exchange], force: bool = False
+    ) -> bool:
+        """
+        마스터 파일이 있으면 갱신 실패(network 오류 등)를 무시하고 기존 파일을 사용합니다.
+        마스터 파일이 없으면 오류를 그대로 발생시킵니다.
+        """
+        from . import MasterBook
+
+        exchange = Exchange.from_value(exchange)
+        has_file = os.path.exists(MasterBook.source_path(exchange))
+        failed_at = self._failed_at.get(exchange)
+        if (
+            has_file
+            and not force
+            and failed_at is not None
+            and time.time() - failed_at < self.retry_interval
+        ):
+            return False
+
+        try:
+            updated = self.refresh(exchange, force=force)
+            self._failed_at.pop(exchange, None)
+            return updated
+        except (URLError, OSError, zipfile.BadZipFile) as e:
+            if not has_file:
+                raise
+            self._failed_at[exchange] = time.time()
+            logger.warning(
+                "Failed to refresh master file of '%s', use cached file: %s",
+                exchange.name,
+                e,
+            )
+            return False
+
+    def _download(self, exchange: Exchange, conditional: bool = True) -> bool:
+        from . import MasterBook
+
+        cache_dir = self.cache_dir(exchange)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # 마스터 파일이 없으면 304를 받아도 복구할 수 없으므로 조건부 요청하지 않음
+        if not os.path.exists(MasterBook.source_path(exchange)):
+            conditional = False
+        meta = self.load_meta(exchange) if conditional else {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        # 같은 파일 시스템에서 os.replace 하도록 MASTER_DIR 아래에 임시 디렉토리 생성
+        temp_dir = tempfile.mkdtemp(prefix=f".{exchange.name.lower()}-", dir=cache_dir)
+        try:
+            req = request.Request(self.url(exchange), headers=headers)
+            zip_path = os.path.join(temp_dir, "code.zip")
+            try:
+                with request.urlopen(req, timeout=self.timeout) as res, open(
+                    zip_path, "wb"
+                ) as f:
+                    shutil.copyfileobj(res, f)
+                    etag = res.headers.get("ETag")
+                    last_modified = res.headers.get("Last-Modified")
+            except HTTPError as e:
+                if e.code != 304:
+                    raise
+                logger.debug("Master file of '%s' is not modified", exchange.name)
+                meta["checked_at"] = time.time()
+                save_yaml(meta, file_path=self.meta_path(exchange))
+                return False
+
+            # unzip
+            extracted = []
+            with zipfile.ZipFile(zip_path) as zip_file:
+                for info in zip_file.infolist():
+                    if info.is_dir():
+                        continue
+                    file_name = os.path.basename(info.filename)
+                    with zip_file.open(info) as src, open(
+                        os.path.join(temp_dir, file_name), "wb"
+                    ) as dst:
+                        shutil.copyfileobj(src, dst)
+                    extracted.append(file_name)
+
+            for file_name in extracted:
+                os.replace(
+                    os.path.join(temp_dir, file_name),
+                    os.path.join(cache_dir, file_name),
+                )
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        save_yaml(
+            {
+                "url": self.url(exchange),
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": time.time(),
+            },
+            file_path=self.meta_path(exchange),
+        )
+        logger.info("Downloaded master file of '%s'", exchange.name)
+        return True
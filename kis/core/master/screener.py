@@ -0,0 +1,382 @@
+"""
+# 마스터 종목 screening
+
+compact 마스터 DataFrame(bool/category/정수 dtype)을 column 단위로 보관하고,
+조건(filter), 정렬, 상위 N개 조회를 boolean mask 연산으로 처리합니다.
+자주 쓰는 조건 column은 값 -> 행 번호(동등 조건), 정렬 순서(범위 조건) index를 만들어 재사용합니다.
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from kis.core.enum import Exchange
+from kis.exceptions import KISBadArguments
+
+from .index import source_fingerprint
+
+# 매매할 수 없는 종목 여부 column(KOSPI, KOSDAQ)
+HALT_COLUMNS = [
+    "거래정지",
+    "정리매매",
+    "관리종목",
+    "거래정지 여부",
+    "정리매매 여부",
+    "관리 종목 여부",
+]
+
+OPERATORS = (
+    "==",
+    "!=",
+    ">",
+    ">=",
+    "<",
+    "<=",
+    "in",
+    "not in",
+    "between",
+    "isna",
+    "notna",
+)
+
+
+class MasterStore:
+    """
+    마스터 column store
+
+    column별 typed Series와 조건 index(동등/정렬)를 보관합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        from .compact import compact_dataframe
+
+        df = compact_dataframe(df.reset_index(drop=True))
+        self.frame = df
+        self.size = len(df)
+        self.columns: Dict[str, pd.Series] = {
+            column: df[column] for column in df.columns
+        }
+
+        self._lock = threading.Lock()
+        self._eq_indexes: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._sorted_indexes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def column(self, name: str) -> pd.Series:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KISBadArguments(f"No such master column: '{name}'")
+
+    def create_index(self, name: str):
+        """
+        조건 index를 만듭니다.
+        bool/category/문자열 column은 값 -> 행 번호, 숫자 column은 정렬 순서 index를 만듭니다.
+        """
+        series = self.column(name)
+        with self._lock:
+            if pd.api.types.is_numeric_dtype(
+                series.dtype
+            ) and not pd.api.types.is_bool_dtype(series.dtype):
+                if name not in self._sorted_indexes:
+                    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                    valid = np.flatnonzero(~np.isnan(values))
+                    order = valid[np.argsort(values[valid], kind="stable")]
+                    self._sorted_indexes[name] = (values[order], order)
+            elif name not in self._eq_indexes:
+                codes, uniques = pd.factorize(series)
+                order = np.argsort(codes, kind="stable")
+                bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+                self._eq_indexes[name] = {
+                    value: order[bounds[i] : bounds[i + 1]]
+                    for i, value in enumerate(uniques)
+                }
+
+    def has_index(self, name: str) -> bool:
+        return name in self._eq_indexes or name in self._sorted_indexes
+
+    def _positions_to_mask(self, positions: np.ndarray) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        mask[positions] = True
+        return mask
+
+    def mask(self, name: str, op: str, value: Any = None) -> np.ndarray:
+        """조건에 맞는 행의 boolean mask"""
+        if op not in OPERATORS:
+            raise KISBadArguments(f"Invalid operator: '{op}', available: {OPERATORS}")
+        series = self.column(name)
+
+        eq_index = self._eq_indexes.get(name)
+        if eq_index is not None and op in ("==", "!=", "in", "not in"):
+            values = [value] if op in ("==", "!=") else list(value)
+            positions = [eq_index[v] for v in values if v in eq_index]
+            mask = self._positions_to_mask(
+                np.concatenate(positions) if positions else np.array([], dtype=np.intp)
+            )
+            if op in ("!=", "not in"):
+                mask = ~mask & series.notna().to_numpy()
+            return mask
+
+        sorted_index = self._sorted_indexes.get(name)
+        if sorted_index is not None and op in ("==", ">", ">=", "<", "<=", "between"):
+            sorted_values, order = sorted_index
+            if op == "between":
+                low, high = value
+                start = np.searchsorted(sorted_values, low, side="left")
+                end = np.searchsorted(sorted_values, high, side="right")
+            else:
+                start, end = 0, len(sorted_values)
+                if op in ("==", ">=", ">"):
+                    start = np.searchsorted(
+                        sorted_values, value, side="left" if op != ">" else "right"
+                    )
+                if op in ("==", "<=", "<"):
+                    end = np.searchsorted(
+                        sorted_values, value, side="right" if op != "<" else "left"
+                    )
+            return self._positions_to_mask(order[start:end])
+
+        if op == "isna":
+            return series.isna().to_numpy()
+        if op == "notna":
+            return series.notna().to_numpy()
+        if op == "in":
+            return series.isin(list(value)).to_numpy()
+        if op == "not in":
+            return (~series.isin(list(value)) & series.notna()).to_numpy()
+        if op == "between":
+            low, high = value
+            result = series.between(low, high)
+        else:
+            result = {
+                "==": series.__eq__,
+                "!=": series.__ne__,
+                ">": series.__gt__,
+                ">=": series.__ge__,
+                "<": series.__lt__,
+                "<=": series.__le__,
+            }[op](value)
+        if op == "!=":
+            result = result & series.notna()
+        return result.fillna(False).to_numpy(dtype=bool)
+
+
+class MasterQuery:
+    """
+    마스터 조회 조건
+
+    조건을 추가할 때마다 새 MasterQuery를 반환하므로 중간 결과를 재사용할 수 있습니다.
+
+    :example:
+    >>> from kis.core import MasterBook
+    >>> query = MasterBook.screen("KOSPI").tradable()
+    >>> large_caps = query.where("시가총액", ">=", 10000).top(20, by="시가총액")
+    >>> large_caps.symbols()
+    >>> query.filter(KOSPI200섹터업종="1").where("ROE", ">", 10).sort_by("ROE").to_frame()
+    """
+
+    def __init__(
+        self,
+        store: MasterStore,
+        mask: Optional[np.ndarray] = None,
+        order_by: Optional[Tuple[str, bool]] = None,
+        limit: Optional[int] = None,
+    ):
+        self.store = store
+        self.mask = mask
+        self.order_by = order_by
+        self.limit = limit
+
+    def _replace(self, **kwargs) -> "MasterQuery":
+        params = dict(
+            store=self.store, mask=self.mask, order_by=self.order_by, limit=self.limit
+        )
+        params.update(kwargs)
+        return MasterQuery(**params)
+
+    def where(self, column: str, op: str, value: Any = None) -> "MasterQuery":
+        """
+        조건을 추가합니다(AND).
+
+        :param column: column 이름
+        :param op: '==', '!=', '>', '>=', '<', '<=', 'in', 'not in', 'between', 'isna', 'notna'
+        :param value: 비교값('in'은 목록, 'between'은 (최소, 최대))
+        """
+        mask = self.store.mask(column, op, value)
+        if self.mask is not None:
+            mask = mask & self.mask
+        return self._replace(mask=mask)
+
+    def filter(self, **conditions) -> "MasterQuery":
+        """column=값 동등 조건을 추가합니다. 목록/튜플/집합은 'in' 조건으로 처리합니다."""
+        query = self
+        for column, value in conditions.items():
+            op = "in" if isinstance(value, (list, tuple, set, frozenset)) else "=="
+            query = query.where(column, op, value)
+        return query
+
+    def tradable(self) -> "MasterQuery":
+        """거래정지/정리매매/관리종목을 제외합니다."""
+        mask = np.ones(self.store.size, dtype=bool)
+        for column in HALT_COLUMNS:
+            if column in self.store.columns:
+                # 여러 거래소를 합친 경우 다른 거래소 행은 NaN이므로 True인 행만 제외
+                mask &= ~self.store.mask(column, "==", True)
+        if self.mask is not None:
+            mask &= self.mask
+        return self._replace(mask=mask)
+
+    def sort_by(self, column: str, ascending: bool = False) -> "MasterQuery":
+        """정렬 기준을 지정합니다(NaN은 마지막)."""
+        self.store.column(column)
+        return self._replace(order_by=(column, ascending))
+
+    def head(self, n: int) -> "MasterQuery":
+        """앞에서 n개만 가져옵니다."""
+        return self._replace(limit=n)
+
+    def top(self, n: int, by: str, ascending: bool = False) -> "MasterQuery":
+        """by column 기준 상위 n개"""
+        return self.sort_by(by, ascending=ascending).head(n)
+
+    def positions(self) -> np.ndarray:
+        """조건에 맞는 행 번호(정렬/limit 적용)"""
+        if self.mask is None:
+            positions = np.arange(self.store.size)
+        else:
+            positions = np.flatnonzero(self.mask)
+
+        if self.order_by is not None:
+            column, ascending = self.order_by
+            series = self.store.column(column)
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)[positions]
+                if not ascending:
+                    values = -values
+                # NaN은 마지막, 같은 값은 원래 순서 유지
+                order = np.argsort(values, kind="stable")
+                if self.limit is not None and self.limit < len(order):
+                    order = order[: self.limit]
+                return positions[order]
+            values = series.iloc[positions]
+            order = np.argsort(
+                values.rank(
+                    method="first", ascending=ascending, na_option="bottom"
+                ).to_numpy(),
+                kind="stable",
+            )
+            positions = positions[order]
+
+        if self.limit is not None:
+            positions = positions[: self.limit]
+        return positions
+
+    def count(self) -> int:
+        """조건에 맞는 종목 수(limit 적용)"""
+        if self.order_by is None and self.limit is None and self.mask is not None:
+            return int(self.mask.sum())
+        return len(self.positions())
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """조건에 맞는 종목 DataFrame"""
+        df = self.store.frame
+        if columns:
+            df = df.loc[:, columns]
+        return df.iloc[self.positions()]
+
+    def symbols(self, column: Optional[str] = None) -> List[str]:
+        """조건에 맞는 종목코드 목록"""
+        if column is None:
+            column = "symbol" if "symbol" in self.store.columns else "단축코드"
+        return self.store.column(column).to_numpy()[self.positions()].tolist()
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class MasterScreener:
+    """
+    거래소(묶음)별 MasterStore 관리
+
+    마스터 파일이 바뀌면 다음 조회 시점에 store와 index를 다시 만듭니다.
+    """
+
+    # 기본으로 index를 만드는 column
+    DEFAULT_INDEXES = HALT_COLUMNS + ["그룹코드", "증권그룹구분코드", "KOSPI200섹터업종", "시가총액"]
+
+    _instances: Dict[str, "MasterScreener"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        name: str,
+        indexes: Optional[Iterable[str]] = None,
+        check_interval: float = 60.0,
+    ):
+        """
+        :param name: 거래소 또는 거래소 묶음('KOSPI', 'KOSDAQ', 'KRX', 'NAS', 'USA', ...)
+        :param indexes: index를 만들 column(기본값: DEFAULT_INDEXES 중 존재하는 column)
+        :param check_interval: 마스터 파일 변경 여부를 확인하는 최소 간격(초)
+        """
+        from . import MASTER_GROUPS
+
+        self.name = name.upper()
+        if self.name in MASTER_GROUPS:
+            self.exchanges = MASTER_GROUPS[self.name]
+        else:
+            self.exchanges = (Exchange.from_value(self.name),)
+        self.indexes = list(indexes) if indexes is not None else self.DEFAULT_INDEXES
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._store: Optional[MasterStore] = None
+        self._fingerprint = None
+        self._checked_at = 0.0
+
+    @classmethod
+    def get(cls, name: str) -> "MasterScreener":
+        """프로세스 전체에서 공유하는 MasterScreener를 반환합니다."""
+        name = name.upper()
+        screener = cls._instances.get(name)
+        if screener is None:
+            with cls._instances_lock:
+                screener = cls._instances.get(name)
+                if screener is None:
+                    screener = cls._instances[name] = cls(name)
+        return screener
+
+    def build(self) -> MasterStore:
+        """마스터 파일을 읽어 store와 index를 만듭니다."""
+        from . import MasterBook
+
+        with self._lock:
+            store = MasterStore(MasterBook.get(self.name, with_detail=True))
+            for column in self.indexes:
+                if column in store.columns:
+                    store.create_index(column)
+            self._store = store
+            self._fingerprint = source_fingerprint(self.exchanges)
+            self._checked_at = time.monotonic()
+        return store
+
+    @property
+    def store(self) -> MasterStore:
+        """마스터 파일이 바뀌었으면 다시 만든 store"""
+        if self._store is None:
+            return self.build()
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if source_fingerprint(self.exchanges) != self._fingerprint:
+                return self.build()
+        return self._store
+
+    def query(self) -> MasterQuery:
+        """전체 종목에 대한 MasterQuery"""
+        return MasterQuery(self.store)
+
+
+def screen(name: Union[str, Exchange]) -> MasterQuery:
+    """거래소(묶음) 전체 종목에 대한 MasterQuery"""
+    return MasterScreener.get(name).query()
@@ -0,0 +1,272 @@
+"""
+# 종목명 검색 index
+
+종목코드/한글명/영문명/한글 초성을 1~2글자 단위(n-gram)로 나눈 역색인(inverted index)을 만들어
+부분 문자열 검색을 DataFrame 전체 scan 없이 처리합니다.
+검색 결과는 일치(exact) > 앞부분 일치(prefix) > 부분 일치(infix) 순서로 정렬합니다.
+index는 마스터 파일의 fingerprint와 함께 MASTER_DIR에 저장되어, 마스터 파일이 그대로이면
+다음 실행에서 마스터 파일을 다시 파싱하지 않고 불러옵니다.
+"""
+import bisect
+import heapq
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from kis.core.enum import Exchange
+from kis.exceptions import KISBadArguments
+
+from .index import INDEX_GROUPS, SymbolIndex, SymbolInfo, source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# index 구조가 바뀌는 경우 올려서 저장된 index를 무효화합니다.
+SEARCH_INDEX_VERSION = 1
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+
+
+def normalize(text: str) -> str:
+    """검색용 문자열: 소문자, 공백 제거"""
+    return "".join(text.lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환합니다. 한글이 아닌 문자는 그대로 둡니다."""
+    return "".join(
+        CHOSEONG[(ord(char) - HANGUL_START) // 588]
+        if HANGUL_START <= ord(char) <= HANGUL_END
+        else char
+        for char in text
+    )
+
+
+def is_choseong(text: str) -> bool:
+    """초성만으로 된 문자열인지 여부"""
+    return bool(text) and all(char in CHOSEONG for char in text)
+
+
+def grams(text: str) -> set:
+    """1글자, 2글자 n-gram"""
+    return set(text) | {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class SymbolSearch:
+    """
+    종목명 검색
+
+    :example:
+    >>> from kis.core.master import SymbolSearch
+    >>> search = SymbolSearch.get("KRX")
+    >>> search.search("삼성")  # 한글명 앞부분 일치
+    >>> search.search("ㅅㅅㅈㅈ")  # 초성
+    >>> SymbolSearch.get("USA").search("apple")  # 영문명
+    """
+
+    _instances: Dict[str, "SymbolSearch"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, group: str, check_interval: float = 60.0):
+        """
+        :param group: 'USA'(NAS + NYS + AMS) 또는 'KRX'(KOSPI + KOSDAQ)
+        :param check_interval: 마스터 파일 변경 여부를 확인하는 최소 간격(초)
+        """
+        group = group.upper()
+        if group not in INDEX_GROUPS:
+            raise KISBadArguments(f"No such index group: '{group}'")
+        self.group = group
+        self.exchanges: Tuple[Exchange, ...] = INDEX_GROUPS[group]
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._entries: List[SymbolInfo] = []
+        # entry별 (종목코드, 한글명, 영문명, 한글명 초성)
+        self._keys: List[Tuple[str, str, str, str]] = []
+        self._grams: Dict[str, FrozenSet[int]] = {}
+        # key 종류별 (key, entry 번호) 정렬 목록(앞부분 일치 검색용)
+        self._sorted_keys: List[List[Tuple[str, int]]] = [[], [], [], []]
+        self._fingerprint: Optional[List[Tuple[str, int, int]]] = None
+        self._checked_at = 0.0
+
+    def __repr__(self):
+        return f"SymbolSearch(group='{self.group}', symbols={len(self._entries)})"
+
+    @classmethod
+    def get(cls, group: str = "USA") -> "SymbolSearch":
+        """프로세스 전체에서 공유하는 검색 index를 반환합니다."""
+        group = group.upper()
+        search = cls._instances.get(group)
+        if search is None:
+            with cls._instances_lock:
+                search = cls._instances.get(group)
+                if search is None:
+                    search = cls._instances[group] = cls(group)
+        return search
+
+    @property
+    def cache_file(self) -> str:
+        """저장된 검색 index 경로"""
+        from . import MASTER_DIR
+
+        return os.path.join(MASTER_DIR, f"search_{self.group.lower()}.pkl")
+
+    def load_cache(self) -> bool:
+        """마스터 파일이 바뀌지 않았으면 저장된 index를 불러옵니다."""
+        if not os.path.exists(self.cache_file):
+            return False
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning("Failed to load search index '%s': %s", self.cache_file, e)
+            return False
+
+        fingerprint = source_fingerprint(self.exchanges)
+        if (
+            data.get("version") != SEARCH_INDEX_VERSION
+            or data.get("fingerprint") != fingerprint
+        ):
+            return False
+
+        with self._lock:
+            self._entries = data["entries"]
+            self._keys = data["keys"]
+            self._grams = data["grams"]
+            self._sorted_keys = data["sorted_keys"]
+            self._fingerprint = fingerprint
+            self._checked_at = time.monotonic()
+        return True
+
+    def save_cache(self):
+        """index를 마스터 파일의 fingerprint와 함께 저장합니다."""
+        data = {
+            "version": SEARCH_INDEX_VERSION,
+            "fingerprint": self._fingerprint,
+            "entries": self._entries,
+            "keys": self._keys,
+            "grams": self._grams,
+            "sorted_keys": self._sorted_keys,
+        }
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, self.cache_file)
+
+    def build(self) -> "SymbolSearch":
+        """마스터 파일을 읽어 index를 (다시) 만들고 저장합니다."""
+        index = SymbolIndex.get(self.group)
+        index.refresh_if_changed(force=True)
+        entries = sorted(index.symbols(), key=lambda info: info.symbol)
+
+        keys = []
+        postings: Dict[str, set] = {}
+        for i, info in enumerate(entries):
+            name = normalize(info.name)
+            key = (
+                normalize(info.symbol),
+                name,
+                normalize(info.english_name),
+                to_choseong(name),
+            )
+            keys.append(key)
+            for gram in set().union(*(grams(text) for text in key)):
+                postings.setdefault(gram, set()).add(i)
+
+        with self._lock:
+            self._entries = entries
+            self._keys = keys
+            self._grams = {gram: frozenset(ids) for gram, ids in postings.items()}
+            self._sorted_keys = [
+                sorted(
+                    (key[key_index], i) for i, key in enumerate(keys) if key[key_index]
+                )
+                for key_index in range(4)
+            ]
+            self._fingerprint = index.fingerprint
+            self._checked_at = time.monotonic()
+
+        try:
+            self.save_cache()
+        except OSError as e:
+            logger.warning("Failed to save search index '%s': %s", self.cache_file, e)
+        return self
+
+    def refresh_if_changed(self, force: bool = False) -> bool:
+        """
+        마스터 파일이 바뀌었으면 index를 다시 만듭니다.
+
+        :param force: check_interval과 관계없이 즉시 확인
+        :return: index를 다시 만들었는지 여부
+        """
+        if self._fingerprint is None:
+            if not self.load_cache():
+                self.build()
+            return True
+
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+
+        if source_fingerprint(self.exchanges) != self._fingerprint:
+            self.build()
+            return True
+        return False
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[SymbolInfo]:
+        """
+        종목코드/한글명/영문명/초성으로 종목을 검색합니다.
+
+        :param query: 검색어(초성만 입력한 경우 한글명 초성으로 검색)
+        :param limit: 최대 결과 수(None이면 전체)
+        :return: 일치 > 앞부분 일치 > 부분 일치 순으로 정렬한 종목 정보
+        """
+        self.refresh_if_changed()
+        query = normalize(query)
+        if not query:
+            return []
+
+        key_indexes = (3,) if is_choseong(query) else (0, 1, 2)
+        ranks: Dict[int, Tuple[int, int, int]] = {}
+
+        # 일치/앞부분 일치: 정렬된 key에서 bisect로 범위 조회
+        for key_index in key_indexes:
+            sorted_keys = self._sorted_keys[key_index]
+            for position in range(
+                bisect.bisect_left(sorted_keys, (query,)), len(sorted_keys)
+            ):
+                key, i = sorted_keys[position]
+                if not key.startswith(query):
+                    break
+                rank = (0 if key == query else 1, key_index, len(key))
+                if i not in ranks or rank < ranks[i]:
+                    ranks[i] = rank
+
+        # 앞부분 일치만으로 결과가 부족한 경우에만 부분 일치 검색
+        if limit is None or len(ranks) < limit:
+            # 검색어의 n-gram을 모두 포함하는 종목만 후보로 사용(작은 집합부터 교집합)
+            postings = []
+            for gram in grams(query):
+                ids = self._grams.get(gram)
+                if not ids:
+                    postings = []
+                    break
+                postings.append(ids)
+            if postings:
+                postings.sort(key=len)
+                candidates = postings[0].intersection(*postings[1:])
+                for i in candidates.difference(ranks):
+                    keys = self._keys[i]
+                    for key_index in key_indexes:
+                        if query in keys[key_index]:
+                            ranks[i] = (2, key_index, len(keys[key_index]))
+                            break
+
+        ranked = [(rank, self._entries[i].symbol, i) for i, rank in ranks.items()]
+        ranked = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [self._entries[i] for _, _, i in ranked]
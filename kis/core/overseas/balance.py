@@ -1,5 +1,7 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+from kis.core.base.batch import DEFAULT_MAX_WORKERS, run_batch
+from kis.core.base.cache import Position
 from kis.core.base.resources import Balance
 from kis.core.enum import Exchange
 from kis.core.overseas.client import OverseasResource
@@ -7,6 +9,17 @@ from kis.core.overseas.client import OverseasResource
 from .schema import Deposit, Stock
 
 
+class ExchangeBalances(NamedTuple):
+    """여러 거래소 잔고 조회 결과"""
+
+    positions: Dict[str, Stock]  # 종목코드 -> 보유종목
+    deposits: Dict[Exchange, Deposit]  # 거래소 -> 잔고 합계
+
+    @property
+    def stocks(self) -> List[Stock]:
+        return list(self.positions.values())
+
+
 class OverseasBalance(OverseasResource, Balance):
     """
     해외주식주문/해외 잔고 조회
@@ -14,6 +27,9 @@ class OverseasBalance(OverseasResource, Balance):
     See https://apiportal.koreainvestment.com/apiservice/apiservice-overseas-stock#L_0482dfb1-154c-476c-8a3b-6fc1da498dbf
     """
 
+    # fetch_all_exchanges 기본 조회 거래소
+    EXCHANGES: Tuple[Exchange, ...] = (Exchange.NAS, Exchange.NYS, Exchange.AMS)
+
     def _fetch_one(
         self,
         exchange: Union[str, Exchange] = None,
@@ -57,16 +73,75 @@ class OverseasBalance(OverseasResource, Balance):
             detail_class=Dict[str, Any],
         )
 
-    def fetch(self) -> List[Stock]:
-        """해외주식 잔고 조회"""
-        result = self._fetch_one()
+    def fetch_with_deposit(
+        self, exchange: Union[str, Exchange] = None
+    ) -> Tuple[List[Stock], Deposit]:
+        """해외주식 잔고 조회(보유종목, 잔고 합계)"""
+        result = self._fetch_one(exchange=exchange)
 
         portfolio, deposit = [
             [Stock(**row) for row in result.summary],
             Deposit(**result.detail),
         ]
         while result.has_next:
-            result = self._fetch_one(fk200=result.fk200, nk200=result.nk200)
-            portfolio.append([Stock(**row) for row in result.summary])
+            result = self._fetch_one(
+                exchange=exchange, fk200=result.fk200, nk200=result.nk200
+            )
+            portfolio.extend([Stock(**row) for row in result.summary])
+
+        return portfolio, deposit
 
+    def fetch(self, exchange: Union[str, Exchange] = None) -> List[Stock]:
+        """해외주식 잔고 조회"""
+        portfolio, _ = self.fetch_with_deposit(exchange=exchange)
         return portfolio
+
+    def fetch_all_exchanges(
+        self,
+        exchanges: Optional[Iterable[Union[str, Exchange]]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> ExchangeBalances:
+        """
+        여러 거래소의 잔고를 동시에 조회해 합칩니다.
+
+        같은 종목이 여러 거래소 조회 결과에 포함된 경우(실전투자는 NAS 조회시 미국 전체 잔고를 반환)
+        먼저 조회한 거래소의 결과를 사용합니다. 한 거래소라도 조회에 실패하면 오류를 발생시킵니다.
+
+        :param exchanges: 조회할 거래소 목록. None이면 `EXCHANGES`
+        :param max_workers: 동시에 조회할 최대 요청 수
+        """
+        exchanges = [
+            Exchange.from_value(exchange) for exchange in (exchanges or self.EXCHANGES)
+        ]
+        # 주야간원장 구분은 한 번만 조회한 뒤 모든 거래소 조회에 사용
+        self.client.is_day
+
+        report = run_batch(
+            exchanges,
+            send=lambda exchange: self.fetch_with_deposit(exchange=exchange),
+            max_workers=max_workers,
+        )
+        if report.failed:
+            raise report.failed[0].error
+
+        positions: Dict[str, Stock] = {}
+        deposits: Dict[Exchange, Deposit] = {}
+        for result in report:
+            portfolio, deposit = result.data
+            deposits[result.item] = deposit
+            for stock in portfolio:
+                positions.setdefault(stock.ovrs_pdno, stock)
+        return ExchangeBalances(positions=positions, deposits=deposits)
+
+    def to_positions(self, snapshot: List[Stock]) -> List[Position]:
+        """잔고 조회 결과를 보유종목 목록으로 변환"""
+        return [
+            Position(
+                symbol=stock.ovrs_pdno,
+                quantity=stock.ovrs_cblc_qty,
+                average_price=stock.pchs_avg_pric,
+                exchange=stock.ovrs_excg_cd,
+            )
+            for stock in snapshot
+            if stock.ovrs_cblc_qty > 0
+        ]
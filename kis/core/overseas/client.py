@@ -1,14 +1,16 @@
-from functools import cached_property
-from typing import TYPE_CHECKING, Optional, Union
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 import requests
 from pydantic import validator
 
 from kis.core.base.client import KisClientBase
 from kis.core.enum import Exchange
-from kis.core.master import MasterBook
+from kis.core.master import LazyMaster
 from kis.core.overseas.schema import Currency
 from kis.exceptions import KISBadArguments
+from kis.utils.tool import locked_cached_property, next_session_boundary
 
 if TYPE_CHECKING:
     from .balance import OverseasBalance
@@ -20,7 +22,7 @@ class OverseasClient(KisClientBase):
     """해외 주식 전용 Client"""
 
     NAME = "OVERSEAS"
-    SYMBOL_MASTER = MasterBook.get("USA")
+    SYMBOL_MASTER = LazyMaster("USA")
 
     def __init__(
         self,
@@ -29,15 +31,31 @@ class OverseasClient(KisClientBase):
         app_secret: Optional[str] = None,
         account: Optional[str] = None,
         exchange: Union[str, Exchange] = None,
+        profile_name: Optional[str] = None,
+        load_token: bool = True,
+        token_path: Optional[str] = None,
+        strict: bool = False,
     ):
         super().__init__(
             is_dev=is_dev,
             app_key=app_key,
             app_secret=app_secret,
             account=account,
+            profile_name=profile_name,
+            load_token=load_token,
+            token_path=token_path,
+            strict=strict,
         )
         self.exchange = exchange
 
+        # 주야간원장 구분은 다음 장 운영시간 경계까지 캐싱
+        self._is_day: Optional[bool] = None
+        self._is_day_expires_at: Optional[datetime] = None
+        self._is_day_lock = threading.Lock()
+
+    def init_kwargs(self) -> Dict[str, Any]:
+        return {**super().init_kwargs(), "exchange": self.exchange}
+
     @property
     def exchange(self) -> Optional[Exchange]:
         return self._exchange
@@ -61,14 +79,28 @@ class OverseasClient(KisClientBase):
         """
         해외주식 주야간원장구분조회를 통해 주간인지 여부를 확인합니다.
 
+        조회 결과는 다음 장 운영시간 경계(`kis.utils.tool.SESSION_BOUNDARIES`)까지 캐싱합니다.
+
         :reference: https://apiportal.koreainvestment.com/apiservice/apiservice-overseas-stock#L_4e89faf9-0109-4f33-b463-fd88e01cc9b2
         :return: True if day, False if night
         """
+        now = datetime.now().astimezone()
+        if self._is_day is None or now >= self._is_day_expires_at:
+            with self._is_day_lock:
+                # 기다리는 동안 다른 thread가 조회한 경우 재사용
+                if self._is_day is None or now >= self._is_day_expires_at:
+                    self.refresh_is_day()
+        return self._is_day
+
+    def refresh_is_day(self) -> bool:
+        """캐싱된 주야간원장 구분을 무시하고 다시 조회합니다."""
         headers = {"tr_id": "JTTT3010R"}
         res = self.session.post(
             "/uapi/overseas-stock/v1/trading/dayornight", headers=headers
         )
-        return res.json()["output"]["PSBL_YN"] == "N"
+        self._is_day_expires_at = next_session_boundary()
+        self._is_day = res.json()["output"]["PSBL_YN"] == "N"
+        return self._is_day
 
     @staticmethod
     def get_currency() -> Currency:
@@ -86,19 +118,19 @@ class OverseasClient(KisClientBase):
             receiving=data["ttSellingPrice"],
         )
 
-    @cached_property
+    @locked_cached_property
     def quote(self) -> "OverseasQuote":
         from .quote import OverseasQuote
 
         return OverseasQuote(client=self)
 
-    @cached_property
+    @locked_cached_property
     def order(self) -> "OverseasOrder":
         from .order import OverseasOrder
 
         return OverseasOrder(client=self)
 
-    @cached_property
+    @locked_cached_property
     def balance(self) -> "OverseasBalance":
         from .balance import OverseasBalance
 
@@ -2,8 +2,10 @@ import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Literal, Optional, Union, overload
 
+from kis.core.base.batch import OpenOrder
 from kis.core.base.resources import Order
 from kis.core.base.schema import ResponseData
+from kis.core.base.tracker import OrderFill
 from kis.core.enum import Exchange
 from kis.exceptions import KISBadArguments, KISDevModeError, KISNoData
 from kis.utils.tool import as_datetime
@@ -100,6 +102,16 @@ class OverseasOrder(OverseasResource, Order):
                     raise KISBadArguments("price is required")
                 order_division = "00"
 
+        if self.client.price_check:
+            price = self.client.references.check(
+                symbol,
+                order_type=order_type,
+                price=price,
+                quantity=quantity,
+                mode=self.client.price_check,
+                exchange=exchange,
+            )
+
         headers = {"tr_id": tr_id, "custtype": "P"}
         data = {
             "CANO": account_prefix,
@@ -196,12 +208,15 @@ class OverseasOrder(OverseasResource, Order):
 
         See https://apiportal.koreainvestment.com/apiservice/apiservice-overseas-stock#L_4812f155-bdb5-47ac-a35b-a70d3d8f14c9
 
+        취소 주문은 price와 관계없이 주문단가(OVRS_ORD_UNPR)를 0으로, 주문수량(ORD_QTY)은
+        취소할 수량으로 전송합니다.
+
         :param modify_type: 주문구분 (cancel, update)
         :param org_no: 한국거래소주문조직번호
         :param order_no: 주문번호
-        :param quantity: 주문수량
+        :param quantity: 주문수량(취소 주문은 취소할 수량)
         :param total: True 잔량 전체, False 잔량 일부
-        :param price: 가격
+        :param price: 가격. 정정 주문에만 사용
         :param as_market_price: 시장가 주문 여부
         :param exchange: 거래소
         """
@@ -244,13 +259,13 @@ class OverseasOrder(OverseasResource, Order):
             else:
                 raise KISBadArguments("exchange is not supported")
 
-        if not price:
-            raise KISBadArguments("price is required")
-
         if modify_type == "cancel":
-            quantity = 0
+            # 취소 주문은 주문단가 0
+            price = 0
             cancel_or_update_cd = "02"
         else:
+            if not price:
+                raise KISBadArguments("price is required")
             cancel_or_update_cd = "01"
 
         headers = {"tr_id": tr_id, "custtype": "P"}
@@ -274,6 +289,87 @@ class OverseasOrder(OverseasResource, Order):
             data_class=OrderData,
         )
 
+    def fetch_open_orders(
+        self, exchange: Union[str, Exchange] = None
+    ) -> List[OpenOrder]:
+        """
+        정정/취소 가능한 미체결 주문 조회
+
+        :param exchange: 거래소
+        """
+        exchanges = {item.code: item for item in Exchange if item.code}
+        return [
+            OpenOrder(
+                order_no=order.odno,
+                org_no=order.ord_gno_brno,
+                symbol=order.pdno,
+                order_type="sell" if order.sll_buy_dvsn_cd == "01" else "buy",
+                quantity=order.nccs_qty,
+                price=order.ft_ord_unpr3,
+                exchange=exchanges.get(order.ovrs_excg_cd, exchange),
+                raw=order,
+            )
+            for order in self.fetch_unexecuted_orders(exchange=exchange)
+            if order.nccs_qty > 0
+        ]
+
+    def fetch_order_fills(
+        self, exchange: Union[str, Exchange] = None
+    ) -> List[OrderFill]:
+        """
+        당일 주문별 체결 현황 조회
+
+        정정/취소 주문은 별도 주문번호로 조회되며, origin_order_no에 원주문번호가 들어갑니다.
+
+        :param exchange: 거래소
+        """
+        today = datetime.now()
+        modify_types = {"01": "update", "02": "cancel"}
+        return [
+            OrderFill(
+                order_no=item.odno,
+                origin_order_no=item.orgn_odno,
+                symbol=item.pdno,
+                order_type="sell" if item.sll_buy_dvsn_cd == "01" else "buy",
+                quantity=item.ft_ord_qty,
+                filled_quantity=item.ft_ccld_qty,
+                price=item.ft_ccld_unpr3,
+                modify_type=modify_types.get(item.rvse_cncl_dvsn, "new"),
+                is_rejected="거부" in item.prcs_stat_name or bool(item.rjct_rson),
+            )
+            for item in self.fetch_executed_orders(
+                start_date=today, end_date=today, exchange=exchange
+            )
+        ]
+
+    def _cancel_open_order(self, order: OpenOrder) -> OrderData:
+        return self._modify(
+            modify_type="cancel",
+            org_no=order.org_no,
+            order_no=order.order_no,
+            symbol=order.symbol,
+            quantity=order.quantity,
+            exchange=order.exchange,
+        ).data
+
+    def _modify_open_order(
+        self,
+        order: OpenOrder,
+        price: Optional[float] = None,
+        quantity: Optional[int] = None,
+        as_market_price: bool = False,
+    ) -> OrderData:
+        return self._modify(
+            modify_type="update",
+            org_no=order.org_no,
+            order_no=order.order_no,
+            symbol=order.symbol,
+            quantity=quantity if quantity is not None else order.quantity,
+            price=price if price is not None else order.price,
+            as_market_price=as_market_price,
+            exchange=order.exchange,
+        ).data
+
     @overload
     def get_available_amount(self, symbol: str, price: float) -> PrettyBidAvailability:
         ...
@@ -532,7 +628,7 @@ class OverseasOrder(OverseasResource, Order):
         """
 
         exchange = exchange or self.client.exchange
-        if self.client.strict:
+        if self.client.strict or not symbol:
             exchange = Exchange.from_value(exchange)
         else:
             exchange = Exchange.find_symbol(symbol)
@@ -1,6 +1,7 @@
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union, overload
 
+from kis.core.base.reference import ReferenceData
 from kis.core.base.resources import Quote
 from kis.core.enum import Exchange
 from kis.core.overseas.schema import (
@@ -85,6 +86,27 @@ class OverseasQuote(OverseasResource, Quote):
             data_class=PriceDetail,
         )
 
+    def fetch_reference(
+        self, symbol: str, exchange: Union[str, Exchange] = None
+    ) -> ReferenceData:
+        """
+        주문 검증용 종목 기준정보 조회
+
+        현재가 상세 조회를 사용하므로 모의투자에서는 사용할 수 없습니다.
+
+        :param symbol: 종목코드
+        :param exchange: 거래소
+        """
+        detail = self.fetch_current_price_detail(symbol, exchange=exchange).data
+        return ReferenceData(
+            symbol=symbol,
+            tick_size=float(detail.tick_size or 0),
+            upper_bound=detail.price_upper_bound,
+            lower_bound=detail.price_lower_bound,
+            lot_size=detail.unit or 1,
+            tradable=detail.order_state != "매매 불가",
+        )
+
     def _fetch_histories(
         self,
         symbol: str,
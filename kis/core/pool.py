@@ -0,0 +1,104 @@
+"""
+# 여러 계좌 client pool
+
+`kis config init`으로 등록한 여러 profile(계좌)의 client를 한 번에 생성하고, 계좌별 조회를 동시에 실행합니다.
+
+- 요청 간격(`RequestScheduler`)은 app_key별, token은 계좌별(`~/.kis/{account}/token.yaml`)로 따로 관리하므로
+  한 계좌의 요청이 다른 계좌의 요청 한도를 소모하지 않습니다.
+- 종목 마스터(`SYMBOL_MASTER`)는 client class 단위로, 주문 검증용 종목 기준정보(`references`)는
+  같은 모의투자 여부를 가진 client끼리 공유합니다.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Type
+
+from kis.exceptions import KISBadArguments
+
+from .base.batch import DEFAULT_MAX_WORKERS, BatchReport, run_batch
+from .base.client import KisClientBase, read_profiles
+from .base.reference import ReferenceCache
+from .domestic import DomesticClient
+
+
+class ClientPool:
+    """
+    profile별 client 모음
+
+    :example:
+    >>> pool = ClientPool(["account1", "account2", "account3"])
+    >>> pool["account1"].quote.fetch_current_price("005930")
+    >>> report = pool.fetch_balances()  # 모든 계좌 잔고를 동시에 조회
+    >>> {result.item: result.data for result in report.succeeded}
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Iterable[str]] = None,
+        client_class: Type[KisClientBase] = DomesticClient,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **client_kwargs,
+    ):
+        """
+        :param profiles: 사용할 profile_name 목록. None이면 config.ini에 등록된 모든 profile
+        :param client_class: DomesticClient 또는 OverseasClient
+        :param max_workers: 계좌별 조회를 동시에 실행할 최대 thread 수
+        :param client_kwargs: client 생성시 추가로 전달할 인자(load_token, exchange 등)
+        """
+        if profiles is None:
+            profiles = read_profiles()
+        self.client_class = client_class
+        self.max_workers = max_workers
+        self.clients: Dict[str, KisClientBase] = {
+            profile_name: client_class(profile_name=profile_name, **client_kwargs)
+            for profile_name in profiles
+        }
+        if not self.clients:
+            raise KISBadArguments("'profiles' is empty")
+
+        # 종목 기준정보는 계좌와 관계없으므로 모의투자 여부별로 하나만 사용
+        references: Dict[bool, ReferenceCache] = {}
+        for client in self.clients.values():
+            if client.is_dev not in references:
+                references[client.is_dev] = client.references
+            client.references = references[client.is_dev]
+
+    def __repr__(self):
+        return (
+            f"ClientPool({self.client_class.__name__}, profiles={list(self.clients)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __iter__(self) -> Iterator[KisClientBase]:
+        return iter(self.clients.values())
+
+    def __contains__(self, profile_name: str) -> bool:
+        return profile_name in self.clients
+
+    def __getitem__(self, profile_name: str) -> KisClientBase:
+        try:
+            return self.clients[profile_name]
+        except KeyError as err:
+            raise KISBadArguments(f"Profile '{profile_name}' is not in pool") from err
+
+    def map(
+        self,
+        func: Callable[[KisClientBase], Any],
+        profiles: Optional[Iterable[str]] = None,
+    ) -> BatchReport:
+        """
+        계좌별로 func를 동시에 실행합니다. 한 계좌가 실패해도 나머지 계좌는 계속 실행합니다.
+
+        :param func: client를 입력받아 실행할 함수
+        :param profiles: 실행할 profile_name 목록. None이면 전체
+        :return: profile_name 순서대로 결과/오류를 담은 BatchReport(`BatchResult.item`: profile_name)
+        """
+        profiles = list(self.clients) if profiles is None else list(profiles)
+        return run_batch(
+            profiles,
+            send=lambda profile_name: func(self[profile_name]),
+            max_workers=self.max_workers,
+        )
+
+    def fetch_balances(self, profiles: Optional[Iterable[str]] = None) -> BatchReport:
+        """모든 계좌의 잔고를 동시에 조회합니다."""
+        return self.map(lambda client: client.balance.fetch(), profiles=profiles)
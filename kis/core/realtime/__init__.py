@@ -0,0 +1,28 @@
+from .bar import BarAggregator
+from .buffer import TickRingBuffer, TickStore
+from .client import RealtimeClient
+from .schema import (
+    DomesticOrderbook,
+    DomesticTrade,
+    ExecutionNotice,
+    OverseasOrderbook,
+    OverseasTrade,
+    decode_records,
+    decrypt,
+    parse_frame,
+)
+
+__all__ = [
+    "RealtimeClient",
+    "BarAggregator",
+    "TickRingBuffer",
+    "TickStore",
+    "DomesticTrade",
+    "DomesticOrderbook",
+    "OverseasTrade",
+    "OverseasOrderbook",
+    "ExecutionNotice",
+    "decode_records",
+    "decrypt",
+    "parse_frame",
+]
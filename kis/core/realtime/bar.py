@@ -0,0 +1,252 @@
+"""
+# 실시간 분봉 집계
+
+체결 틱을 받아 여러 timeframe의 시가/고가/저가/종가/거래량을 틱당 O(1)로 갱신하고, 봉 경계를
+넘는 틱이 들어오면 완성된 봉을 내보냅니다. 완성된 봉은 `fetch_prices_by_minutes`와 같은
+`PriceHistoryByMinutes` 형태이므로 기존 분봉 처리 코드를 그대로 사용할 수 있습니다.
+"""
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from kis.core.domestic.schema import PriceHistoryByMinutes
+from kis.exceptions import KISBadArguments
+
+from .schema import DomesticTrade, OverseasTrade
+
+BarCallback = Callable[[str, int, PriceHistoryByMinutes], None]
+
+
+def parse_timeframe(timeframe: Union[int, str]) -> int:
+    """timeframe을 분 단위 정수로 변환합니다.(예: 1, '5m', '1h')"""
+    if isinstance(timeframe, int):
+        minutes = timeframe
+    else:
+        value = timeframe.strip().lower()
+        try:
+            if value.endswith("h"):
+                minutes = int(value[:-1]) * 60
+            elif value.endswith("m"):
+                minutes = int(value[:-1])
+            else:
+                minutes = int(value)
+        except ValueError as err:
+            raise KISBadArguments(f"Invalid timeframe: '{timeframe}'") from err
+    if minutes <= 0 or 24 * 60 % minutes:
+        raise KISBadArguments(f"Invalid timeframe: '{timeframe}'")
+    return minutes
+
+
+class _Bar:
+    """집계 중인 봉"""
+
+    __slots__ = ("bucket", "date", "open", "high", "low", "close", "volume", "amount")
+
+    def __init__(self, bucket: int, date: str, price: float):
+        self.bucket = bucket
+        self.date = date
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0
+        self.amount = 0
+
+    def to_history(self, span: int) -> PriceHistoryByMinutes:
+        seconds = self.bucket * span
+        return PriceHistoryByMinutes(
+            stck_bsop_date=self.date,
+            stck_cntg_hour=(
+                f"{seconds // 3600:02d}{seconds % 3600 // 60:02d}{seconds % 60:02d}"
+            ),
+            acml_tr_pbmn=int(self.amount),
+            cntg_vol=self.volume,
+            stck_hgpr=self.high,
+            stck_prpr=self.close,
+            stck_lwpr=self.low,
+            stck_oprc=self.open,
+        )
+
+
+class BarAggregator:
+    """
+    체결 틱을 여러 timeframe의 분봉으로 집계합니다.
+
+    봉의 `execution_time`은 봉 시작 시각이며, `accumulated_amount`는 틱에 누적거래대금이
+    있으면 그 값을, 없으면 영업일별 `가격 * 체결량`의 누적합을 사용합니다.
+
+    늦게 도착한 틱은 이미 지난 봉에는 반영하지 않고, 집계 중인 봉에 반영하더라도
+    종가는 바꾸지 않습니다.
+
+    :example:
+    >>> aggregator = BarAggregator(timeframes=["1m", "5m"], on_bar=print)
+    >>> client.realtime.on(RealtimeChannel.DOMESTIC_TRADE, aggregator.append_trade)
+    >>> ...
+    >>> aggregator.histories("005930", "1m")  # 최신순 List[PriceHistoryByMinutes]
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[Union[int, str]] = (1,),
+        on_bar: Optional[BarCallback] = None,
+        max_histories: int = 1000,
+    ):
+        """
+        :param timeframes: 집계할 timeframe 목록(분). 예: [1, 5, '15m', '1h']
+        :param on_bar: 봉이 완성될 때마다 (symbol, timeframe(분), bar)로 호출할 callback
+        :param max_histories: 종목/timeframe별로 보관할 완성된 봉의 최대 개수
+        """
+        self.timeframes: Tuple[int, ...] = tuple(
+            sorted({parse_timeframe(timeframe) for timeframe in timeframes})
+        )
+        if not self.timeframes:
+            raise KISBadArguments("At least one timeframe is required")
+        self.on_bar = on_bar
+        self.max_histories = max_histories
+
+        self._bars: Dict[Tuple[str, int], _Bar] = {}
+        self._histories: Dict[Tuple[str, int], Deque[PriceHistoryByMinutes]] = {}
+        # 종목별 직전 누적거래량. REST 조회처럼 누적값만 있을 때 사용
+        self._accumulated: Dict[str, int] = {}
+        # 종목별 누적거래대금
+        self._amounts: Dict[str, float] = {}
+        # 종목별 마지막 틱의 (영업일자, 체결시각(초))
+        self._last_ticks: Dict[str, Tuple[str, int]] = {}
+
+    def __repr__(self):
+        return f"BarAggregator(timeframes={list(self.timeframes)})"
+
+    def _emit(
+        self, symbol: str, minutes: int, bar: _Bar
+    ) -> Tuple[str, int, PriceHistoryByMinutes]:
+        history = bar.to_history(minutes * 60)
+        key = (symbol, minutes)
+        histories = self._histories.get(key)
+        if histories is None:
+            histories = self._histories[key] = deque(maxlen=self.max_histories)
+        histories.appendleft(history)
+        if self.on_bar is not None:
+            self.on_bar(symbol, minutes, history)
+        return symbol, minutes, history
+
+    def update(
+        self,
+        symbol: str,
+        business_date: str,
+        time: str,
+        price: float,
+        volume: int,
+        accumulated_amount: Optional[float] = None,
+    ) -> List[Tuple[str, int, PriceHistoryByMinutes]]:
+        """
+        체결 틱 하나를 반영합니다.
+
+        :param symbol: 종목코드
+        :param business_date: 영업일자(YYYYMMDD)
+        :param time: 체결시간(HHMMSS)
+        :param price: 체결가
+        :param volume: 체결량
+        :param accumulated_amount: 누적거래대금(없으면 가격 * 체결량을 누적)
+        :return: 이 틱으로 완성된 (symbol, timeframe, bar) 목록
+        """
+        seconds = int(time[:2]) * 3600 + int(time[2:4]) * 60 + int(time[4:6])
+        last = self._last_ticks.get(symbol)
+        late = last is not None and (business_date, seconds) < last
+        if not late:
+            self._last_ticks[symbol] = (business_date, seconds)
+            if last is not None and last[0] < business_date:
+                # 영업일이 바뀌면 누적거래대금을 다시 집계
+                self._amounts.pop(symbol, None)
+        elif business_date < last[0]:
+            # 이전 영업일의 틱
+            return []
+
+        if accumulated_amount is None:
+            accumulated_amount = self._amounts.get(symbol, 0) + price * volume
+        elif late:
+            accumulated_amount = max(accumulated_amount, self._amounts.get(symbol, 0))
+        self._amounts[symbol] = accumulated_amount
+
+        emitted = []
+        for minutes in self.timeframes:
+            key = (symbol, minutes)
+            bucket = seconds // (minutes * 60)
+            bar = self._bars.get(key)
+
+            if late and (bar is None or bar.bucket != bucket):
+                # 이미 내보낸 봉의 틱
+                continue
+            if bar is None or bar.date < business_date or bar.bucket < bucket:
+                if bar is not None:
+                    emitted.append(self._emit(symbol, minutes, bar))
+                bar = self._bars[key] = _Bar(bucket, business_date, price)
+            elif price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
+
+            if not late:
+                bar.close = price
+            bar.volume += volume
+            bar.amount = accumulated_amount
+        return emitted
+
+    def update_accumulated(
+        self,
+        symbol: str,
+        business_date: str,
+        time: str,
+        price: float,
+        accumulated_volume: int,
+        accumulated_amount: Optional[float] = None,
+    ) -> List[Tuple[str, int, PriceHistoryByMinutes]]:
+        """
+        누적거래량만 알 수 있는 시세(REST 현재가 조회 등)를 반영합니다.
+
+        직전 조회와의 누적거래량 차이를 체결량으로 사용합니다.(첫 조회의 체결량은 0)
+        """
+        previous_volume = self._accumulated.get(symbol, accumulated_volume)
+        volume = max(accumulated_volume - previous_volume, 0)
+        self._accumulated[symbol] = accumulated_volume
+        return self.update(
+            symbol, business_date, time, price, volume, accumulated_amount
+        )
+
+    def append_trade(
+        self, trade: Union[DomesticTrade, OverseasTrade]
+    ) -> List[Tuple[str, int, PriceHistoryByMinutes]]:
+        """실시간 체결가 record(DomesticTrade, OverseasTrade)를 반영합니다."""
+        if isinstance(trade, DomesticTrade):
+            business_date, time = trade.business_date, trade.time
+        else:
+            business_date, time = trade.local_date, trade.local_time
+        return self.update(
+            trade.symbol,
+            business_date,
+            time,
+            trade.price,
+            trade.volume,
+            trade.accumulated_amount,
+        )
+
+    def current(
+        self, symbol: str, timeframe: Union[int, str] = 1
+    ) -> Optional[PriceHistoryByMinutes]:
+        """집계 중인(아직 완성되지 않은) 봉"""
+        minutes = parse_timeframe(timeframe)
+        bar = self._bars.get((symbol, minutes))
+        if bar is None:
+            return None
+        return bar.to_history(minutes * 60)
+
+    def histories(
+        self, symbol: str, timeframe: Union[int, str] = 1
+    ) -> List[PriceHistoryByMinutes]:
+        """완성된 봉 목록(최신순)"""
+        return list(self._histories.get((symbol, parse_timeframe(timeframe)), ()))
+
+    def flush(
+        self, symbol: Optional[str] = None
+    ) -> List[Tuple[str, int, PriceHistoryByMinutes]]:
+        """장 종료 등으로 집계 중인 봉을 완성된 봉으로 내보냅니다."""
+        emitted = []
+        for key in list(self._bars):
+            if symbol is None or key[0] == symbol:
+                emitted.append(self._emit(*key, self._bars.pop(key)))
+        return emitted
@@ -0,0 +1,201 @@
+"""
+# 실시간 틱 저장소
+
+틱마다 python 객체를 보관하지 않도록 종목별로 미리 할당한 NumPy structured array에 틱을
+기록합니다. 배열은 capacity의 두 배 크기로 할당하고 끝에 도달하면 최근 capacity개의 틱을
+앞으로 옮기기 때문에, append는 새로운 메모리를 할당하지 않고 최근 capacity개 이내의
+window는 항상 연속된 구간(zero-copy view)으로 조회할 수 있습니다.
+"""
+import os
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
+
+import numpy as np
+
+from .schema import DomesticTrade, OverseasTrade
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TICK_DTYPE = np.dtype(
+    [
+        ("timestamp", "datetime64[ms]"),
+        ("price", "f8"),
+        ("volume", "i8"),
+        ("bid", "f8"),
+        ("ask", "f8"),
+    ]
+)
+
+
+def to_timestamp(ymd: str, hms: str) -> np.datetime64:
+    """'YYYYMMDD', 'HHMMSS' 형태의 일자/시간을 datetime64[ms]로 변환합니다."""
+    return np.datetime64(
+        f"{ymd[:4]}-{ymd[4:6]}-{ymd[6:8]}T{hms[:2]}:{hms[2:4]}:{hms[4:6]}", "ms"
+    )
+
+
+class TickRingBuffer:
+    """
+    한 종목의 틱을 저장하는 고정 크기 ring buffer
+
+    :example:
+    >>> buffer = TickRingBuffer(capacity=1024)
+    >>> buffer.append(np.datetime64("2023-08-01T09:00:00"), 71900, 10, 71800, 71900)
+    >>> prices = buffer.window(20)["price"]  # 최근 20개 틱의 가격(zero-copy view)
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        self.capacity = capacity
+        self._data = np.zeros(capacity * 2, dtype=TICK_DTYPE)
+        # field별 view. append시 행(np.void) 객체를 만들지 않고 바로 기록
+        self._timestamp = self._data["timestamp"]
+        self._price = self._data["price"]
+        self._volume = self._data["volume"]
+        self._bid = self._data["bid"]
+        self._ask = self._data["ask"]
+        self._end = 0  # 다음에 기록할 위치
+        self._total = 0  # 지금까지 기록된 틱 수
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    def __repr__(self):
+        return f"TickRingBuffer(capacity={self.capacity}, size={len(self)})"
+
+    @property
+    def total(self) -> int:
+        """버려진 틱을 포함해 지금까지 기록된 틱 수"""
+        return self._total
+
+    def append(
+        self,
+        timestamp: Union[np.datetime64, int],
+        price: float,
+        volume: int,
+        bid: float = 0.0,
+        ask: float = 0.0,
+    ):
+        """틱을 기록합니다. capacity를 넘으면 가장 오래된 틱부터 버려집니다."""
+        if self._end == len(self._data):
+            # 최근 capacity개를 앞으로 옮겨 연속된 window를 유지
+            self._data[: self.capacity] = self._data[self.capacity :]
+            self._end = self.capacity
+
+        end = self._end
+        self._timestamp[end] = timestamp
+        self._price[end] = price
+        self._volume[end] = volume
+        self._bid[end] = bid
+        self._ask[end] = ask
+
+        self._end = end + 1
+        self._total += 1
+
+    def window(self, size: Optional[int] = None) -> np.ndarray:
+        """
+        최근 size개 틱의 view를 반환합니다.(오래된 순서)
+
+        반환값은 복사본이 아닌 내부 배열의 view이므로, 이후 append에 의해 내용이
+        바뀔 수 있습니다. 오래 보관해야 한다면 `.copy()`를 사용하세요.
+
+        :param size: 조회할 틱 수. None이면 저장된 전체
+        """
+        size = len(self) if size is None else min(size, len(self))
+        return self._data[self._end - size : self._end]
+
+    def last(self) -> Optional[np.void]:
+        """가장 최근 틱"""
+        if not self._total:
+            return None
+        return self._data[self._end - 1]
+
+    def clear(self):
+        self._end = 0
+        self._total = 0
+
+
+class TickStore:
+    """
+    종목별 TickRingBuffer 모음
+
+    실시간 체결가 record를 그대로 append할 수 있어 RealtimeClient callback으로 바로
+    등록할 수 있습니다. 장 종료 후에는 snapshot()/to_parquet()으로 저장합니다.
+
+    :example:
+    >>> store = TickStore(capacity=4096)
+    >>> client.realtime.on(RealtimeChannel.DOMESTIC_TRADE, store.append_trade)
+    >>> ...
+    >>> store["005930"].window(60)["price"].mean()
+    >>> store.to_parquet("ticks.parquet")
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        :param capacity: 종목별로 보관할 최대 틱 수.
+            종목당 capacity * 2 * 40 bytes 메모리를 미리 할당합니다.
+        """
+        self.capacity = capacity
+        self._buffers: Dict[str, TickRingBuffer] = {}
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buffers)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._buffers
+
+    def __getitem__(self, symbol: str) -> TickRingBuffer:
+        return self._buffers[symbol]
+
+    def __repr__(self):
+        return f"TickStore(capacity={self.capacity}, symbols={len(self)})"
+
+    def buffer(self, symbol: str) -> TickRingBuffer:
+        """종목의 buffer를 반환합니다. 없으면 새로 할당합니다."""
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = self._buffers[symbol] = TickRingBuffer(self.capacity)
+        return buffer
+
+    def append(
+        self,
+        symbol: str,
+        timestamp: Union[np.datetime64, int],
+        price: float,
+        volume: int,
+        bid: float = 0.0,
+        ask: float = 0.0,
+    ):
+        self.buffer(symbol).append(timestamp, price, volume, bid, ask)
+
+    def append_trade(self, trade: Union[DomesticTrade, OverseasTrade]):
+        """실시간 체결가 record(DomesticTrade, OverseasTrade)를 기록합니다."""
+        if isinstance(trade, DomesticTrade):
+            timestamp = to_timestamp(trade.business_date, trade.time)
+        else:
+            timestamp = to_timestamp(trade.local_date, trade.local_time)
+        self.buffer(trade.symbol).append(
+            timestamp, trade.price, trade.volume, trade.bid, trade.ask
+        )
+
+    def snapshot(self) -> "pd.DataFrame":
+        """전체 종목의 틱을 symbol column을 포함한 DataFrame으로 복사합니다."""
+        import pandas as pd
+
+        frames = [pd.DataFrame(np.zeros(0, dtype=TICK_DTYPE))]
+        for symbol, buffer in self._buffers.items():
+            frames.append(pd.DataFrame(buffer.window().copy()).assign(symbol=symbol))
+        df = pd.concat(frames, ignore_index=True)
+        return df[["symbol", *TICK_DTYPE.names]]
+
+    def to_parquet(self, path: str, **kwargs) -> str:
+        """snapshot을 parquet 파일로 저장합니다.(pyarrow 필요)"""
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.snapshot().to_parquet(path, index=False, **kwargs)
+        return path
@@ -0,0 +1,414 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import websockets
+
+from kis.core.base.client import get_websocket_url
+from kis.core.enum import Exchange, RealtimeChannel
+from kis.exceptions import KISBadArguments
+
+from .schema import ExecutionNotice, decode_records, decrypt, parse_frame
+
+if TYPE_CHECKING:
+    from kis.core.base.client import KisClientBase
+
+logger = logging.getLogger(__name__)
+
+# 한 session에서 등록 가능한 최대 실시간 구독 수
+MAX_SUBSCRIPTIONS = 41
+
+Callback = Callable[[NamedTuple], Union[None, Awaitable[None]]]
+
+_STOP = object()
+
+
+def _put(queue: asyncio.Queue, item: Any):
+    if queue.full():
+        # 느린 consumer 때문에 수신이 막히지 않도록 가장 오래된 record를 버림
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+class RealtimeClient:
+    """
+    실시간(WebSocket) 시세 client
+
+    KisClient의 subclass로 사용되며 `client.realtime`으로 접근합니다.
+    접속키(approval_key)를 발급받아 체결가/호가를 구독하고, 수신한 frame을 compact record
+    (NamedTuple)로 변환해 callback 또는 async iterator로 전달합니다.
+    연결이 끊어지면 재접속 후 기존 구독을 다시 등록합니다.
+
+    :example:
+    >>> import asyncio
+    >>> from kis import DomesticClient
+    >>> client = DomesticClient(profile_name="default")
+    >>> realtime = client.realtime
+    >>> realtime.on(RealtimeChannel.DOMESTIC_TRADE, print)
+    >>>
+    >>> async def main():
+    ...     await realtime.subscribe_trade("005930")
+    ...     await realtime.run()
+    >>>
+    >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        client: "KisClientBase",
+        url: Optional[str] = None,
+        approval_key: Optional[str] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        queue_size: int = 10000,
+    ):
+        """
+        :param client: KisClient
+        :param url: WebSocket 접속 url. 입력하지 않으면 client.is_dev에 맞는 url 사용
+        :param approval_key: 실시간 접속키. 입력하지 않으면 첫 접속시 발급
+        :param reconnect_delay: 재접속 대기 시간(초). 실패할 때마다 두 배씩 증가
+        :param max_reconnect_delay: 최대 재접속 대기 시간(초)
+        :param queue_size: stream()의 queue 크기. 가득 차면 가장 오래된 record를 버림
+        """
+        self.client = client
+        self.url = url or get_websocket_url(is_dev=client.is_dev)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.queue_size = queue_size
+
+        self._approval_key = approval_key
+        self._websocket = None
+        self._closed = False
+
+        # (tr_id, tr_key) 순서를 유지하는 구독 목록
+        self._subscriptions: Dict[Tuple[str, str], None] = {}
+        self._callbacks: Dict[Optional[str], List[Callback]] = defaultdict(list)
+        self._queues: Dict[Optional[str], List[asyncio.Queue]] = defaultdict(list)
+
+        # 체결통보 복호화를 위한 tr_id별 (key, iv). 구독 응답으로 전달받음
+        self._cipher_keys: Dict[str, Tuple[str, str]] = {}
+
+    def __repr__(self):
+        return (
+            f"RealtimeClient(url='{self.url}', "
+            f"subscriptions={len(self._subscriptions)})"
+        )
+
+    @property
+    def approval_key(self) -> str:
+        """실시간 접속키. 처음 접근할 때 발급받은 후 재사용합니다."""
+        if self._approval_key is None:
+            self._approval_key = self.client.session.get_approval_key().approval_key
+        return self._approval_key
+
+    @property
+    def is_connected(self) -> bool:
+        return self._websocket is not None
+
+    @property
+    def subscriptions(self) -> List[Tuple[str, str]]:
+        """현재 등록된 (tr_id, tr_key) 목록"""
+        return list(self._subscriptions)
+
+    @staticmethod
+    def get_tr_key(
+        channel: RealtimeChannel,
+        symbol: str,
+        exchange: Union[str, Exchange, None] = None,
+    ) -> str:
+        """
+        구독 key를 생성합니다.
+
+        국내주식은 종목코드, 해외주식은 'D' + 거래소코드(3자리) + 종목코드(예: 'DNASAAPL'),
+        체결통보는 HTS ID를 그대로 사용합니다.
+        """
+        if channel.is_notice or not channel.is_overseas:
+            return symbol
+        if exchange:
+            exchange = Exchange.from_value(exchange)
+        else:
+            exchange = Exchange.find_symbol(symbol)
+        if exchange is None:
+            raise KISBadArguments(f"Cannot find exchange of symbol: '{symbol}'")
+        return f"D{exchange.name}{symbol}"
+
+    def _message(self, tr_type: str, tr_id: str, tr_key: str) -> str:
+        return json.dumps(
+            {
+                "header": {
+                    "approval_key": self.approval_key,
+                    "custtype": "P",
+                    "tr_type": tr_type,  # 1: 등록, 2: 해제
+                    "content-type": "utf-8",
+                },
+                "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+            }
+        )
+
+    async def _send(self, tr_type: str, tr_id: str, tr_key: str):
+        if self._websocket is None:
+            return
+        if self._approval_key is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self.approval_key)
+        await self._websocket.send(self._message(tr_type, tr_id, tr_key))
+
+    async def subscribe(
+        self,
+        channel: Union[str, RealtimeChannel],
+        symbol: str,
+        exchange: Union[str, Exchange, None] = None,
+    ):
+        """
+        실시간 시세를 구독합니다.
+
+        연결 전에 호출하면 등록만 해두고, 연결되는 시점에 전송합니다.
+
+        :param channel: 실시간 tr_id (RealtimeChannel)
+        :param symbol: 종목코드
+        :param exchange: 거래소(해외주식)
+        """
+        channel = RealtimeChannel.from_value(channel)
+        key = (channel.value, self.get_tr_key(channel, symbol, exchange))
+        if key in self._subscriptions:
+            return
+        if len(self._subscriptions) >= MAX_SUBSCRIPTIONS:
+            raise KISBadArguments(
+                f"Realtime subscriptions cannot exceed {MAX_SUBSCRIPTIONS}"
+            )
+        self._subscriptions[key] = None
+        await self._send("1", *key)
+
+    async def unsubscribe(
+        self,
+        channel: Union[str, RealtimeChannel],
+        symbol: str,
+        exchange: Union[str, Exchange, None] = None,
+    ):
+        """
+        실시간 시세 구독을 해제합니다.
+
+        :param channel: 실시간 tr_id (RealtimeChannel)
+        :param symbol: 종목코드
+        :param exchange: 거래소(해외주식)
+        """
+        channel = RealtimeChannel.from_value(channel)
+        key = (channel.value, self.get_tr_key(channel, symbol, exchange))
+        if self._subscriptions.pop(key, False) is None:
+            await self._send("2", *key)
+
+    async def subscribe_trade(
+        self, symbol: str, exchange: Union[str, Exchange, None] = None
+    ):
+        """client 종류(국내/해외)에 맞는 실시간 체결가를 구독합니다."""
+        if self.client.NAME == "OVERSEAS":
+            channel = RealtimeChannel.OVERSEAS_TRADE
+            exchange = exchange or self.client.exchange
+        else:
+            channel = RealtimeChannel.DOMESTIC_TRADE
+        await self.subscribe(channel, symbol, exchange)
+
+    async def subscribe_orderbook(
+        self, symbol: str, exchange: Union[str, Exchange, None] = None
+    ):
+        """client 종류(국내/해외)에 맞는 실시간 호가를 구독합니다."""
+        if self.client.NAME == "OVERSEAS":
+            channel = RealtimeChannel.OVERSEAS_ORDERBOOK
+            exchange = exchange or self.client.exchange
+        else:
+            channel = RealtimeChannel.DOMESTIC_ORDERBOOK
+        await self.subscribe(channel, symbol, exchange)
+
+    async def subscribe_executions(self, hts_id: str):
+        """
+        client 종류(국내/해외)와 모의투자 여부에 맞는 실시간 체결통보를 구독합니다.
+
+        체결통보는 암호화되어 전달되며 구독 응답으로 받은 key/iv로 자동 복호화됩니다.
+
+        :param hts_id: HTS ID
+        """
+        channel = RealtimeChannel.notice(
+            is_overseas=self.client.NAME == "OVERSEAS", is_dev=self.client.is_dev
+        )
+        await self.subscribe(channel, hts_id)
+
+    def on_execution(
+        self, callback: Callable[[ExecutionNotice], Union[None, Awaitable[None]]]
+    ):
+        """
+        체결통보(ExecutionNotice)를 받을 callback을 등록합니다.
+
+        주문 접수/정정/취소/거부/체결 통보가 모두 전달되며, `notice.is_executed`로
+        체결 여부를 구분할 수 있습니다.
+        """
+        for channel in RealtimeChannel:
+            if channel.is_notice:
+                self.on(channel, callback)
+        return callback
+
+    def on(
+        self, channel: Union[str, RealtimeChannel, None], callback: Callback
+    ) -> Callback:
+        """
+        record를 받을 callback을 등록합니다. coroutine function도 사용할 수 있습니다.
+
+        :param channel: 실시간 tr_id. None이면 모든 record를 전달
+        :param callback: record를 인자로 받는 함수
+        """
+        if channel is not None:
+            channel = RealtimeChannel.from_value(channel).value
+        self._callbacks[channel].append(callback)
+        return callback
+
+    async def stream(
+        self, channel: Union[str, RealtimeChannel, None] = None
+    ) -> AsyncIterator[NamedTuple]:
+        """
+        수신한 record를 async iterator로 받습니다. run()이 종료되면 iteration도 종료됩니다.
+
+        :param channel: 실시간 tr_id. None이면 모든 record를 전달
+
+        :example:
+        >>> async for trade in client.realtime.stream(RealtimeChannel.DOMESTIC_TRADE):
+        ...     print(trade.symbol, trade.price)
+        """
+        if channel is not None:
+            channel = RealtimeChannel.from_value(channel).value
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[channel].append(queue)
+        try:
+            while True:
+                record = await queue.get()
+                if record is _STOP:
+                    return
+                yield record
+        finally:
+            self._queues[channel].remove(queue)
+
+    async def _dispatch(self, tr_id: str, record: Any):
+        for callback in self._callbacks[tr_id] + self._callbacks[None]:
+            try:
+                result = callback(record)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception(f"Realtime callback failed: {callback}")
+
+        for queue in self._queues[tr_id] + self._queues[None]:
+            _put(queue, record)
+
+    async def _handle_system(self, websocket, raw: str):
+        """구독 응답, PINGPONG 등 JSON 메시지 처리"""
+        data = json.loads(raw)
+        header = data.get("header", {})
+        tr_id = header.get("tr_id")
+
+        if tr_id == "PINGPONG":
+            try:
+                await websocket.pong(raw)
+            except websockets.exceptions.ConnectionClosed:
+                # 이미 닫히는 중인 연결이면 수신 loop에서 재접속 처리
+                pass
+            return
+
+        body = data.get("body", {})
+        msg = f"[{tr_id}] '{header.get('tr_key')}' {body.get('msg1', '').strip()}"
+        if body.get("rt_cd") == "0":
+            logger.info(msg)
+        else:
+            logger.error(msg)
+
+        output = body.get("output") or {}
+        if output.get("key") and output.get("iv"):
+            self._cipher_keys[tr_id] = (output["key"], output["iv"])
+
+    async def _handle(self, websocket, raw: Union[str, bytes]):
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+
+        if raw[:1] not in ("0", "1"):
+            await self._handle_system(websocket, raw)
+            return
+
+        frame = parse_frame(raw)
+        payload = frame.payload
+        if frame.encrypted:
+            if frame.tr_id not in self._cipher_keys:
+                logger.warning(f"No cipher key for encrypted frame: {frame.tr_id}")
+                return
+            payload = decrypt(*self._cipher_keys[frame.tr_id], payload)
+
+        for record in decode_records(frame.tr_id, payload, frame.count):
+            await self._dispatch(frame.tr_id, record)
+
+    async def run(self):
+        """
+        WebSocket에 연결하고 수신 loop를 실행합니다.
+
+        연결이 끊어지면 reconnect_delay 이후 재접속하고 등록된 구독을 다시 전송합니다.
+        변환할 수 없는 frame(잘림, 복호화 실패 등)은 로그를 남기고 버린 뒤 계속 수신합니다.
+        close()를 호출하면 종료됩니다.
+        """
+        self._closed = False
+        delay = self.reconnect_delay
+
+        try:
+            while not self._closed:
+                try:
+                    async with websockets.connect(
+                        self.url, ping_interval=None
+                    ) as websocket:
+                        self._websocket = websocket
+                        delay = self.reconnect_delay
+                        logger.info(f"Realtime connected: {self.url}")
+
+                        for key in list(self._subscriptions):
+                            await self._send("1", *key)
+
+                        async for raw in websocket:
+                            try:
+                                await self._handle(websocket, raw)
+                            except websockets.exceptions.ConnectionClosed:
+                                raise
+                            except Exception:
+                                # 잘못된 frame 하나 때문에 수신 loop가 종료되지 않도록 버림
+                                logger.exception(
+                                    f"Realtime frame dropped: {raw!r:.200}"
+                                )
+
+                except (websockets.exceptions.ConnectionClosed, OSError) as err:
+                    if self._closed:
+                        break
+                    logger.warning(f"Realtime disconnected: {err}")
+                finally:
+                    self._websocket = None
+
+                if self._closed:
+                    break
+                logger.info(f"Reconnect after {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+        finally:
+            for queues in self._queues.values():
+                for queue in queues:
+                    _put(queue, _STOP)
+
+    async def close(self):
+        """수신 loop를 종료하고 연결을 닫습니다."""
+        self._closed = True
+        if self._websocket is not None:
+            await self._websocket.close()
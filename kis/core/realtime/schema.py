@@ -0,0 +1,293 @@
+"""
+# 실시간(WebSocket) 시세 데이터 모델을 정의합니다.
+
+KIS 실시간 시세는 다음과 같이 '|'로 구분된 frame으로 전달됩니다.
+
+    {암호화여부}|{tr_id}|{데이터건수}|{데이터}
+
+데이터는 '^'로 구분된 field의 나열이며, 데이터건수가 2 이상이면 한 frame에 여러 record가
+이어서 전달됩니다. 틱마다 pydantic model을 생성하는 비용을 피하기 위해 각 record는 필요한
+field만 골라낸 NamedTuple로 변환합니다.
+
+체결통보는 암호화여부가 '1'로 전달되며, 구독 응답으로 받은 key/iv로 AES-256-CBC 복호화한
+뒤 같은 방식으로 변환합니다.
+"""
+from base64 import b64decode
+from typing import Callable, Dict, List, Literal, NamedTuple, Tuple
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import unpad
+
+from kis.core.enum import Exchange, RealtimeChannel, Sign
+from kis.exceptions import KISBadArguments
+
+
+class Frame(NamedTuple):
+    """실시간 데이터 frame"""
+
+    encrypted: bool  # 암호화여부
+    tr_id: str  # tr_id
+    count: int  # 데이터건수
+    payload: str  # '^' 구분 데이터
+
+
+class DomesticTrade(NamedTuple):
+    """국내주식 실시간체결가(H0STCNT0)"""
+
+    symbol: str  # 유가증권단축종목코드
+    business_date: str  # 영업일자(YYYYMMDD)
+    time: str  # 주식체결시간(HHMMSS)
+    price: int  # 주식현재가
+    diff_sign: Sign  # 전일대비부호
+    diff_price: int  # 전일대비
+    diff_rate: float  # 전일대비율
+    open: int  # 주식시가
+    high: int  # 주식최고가
+    low: int  # 주식최저가
+    ask: int  # 매도호가1
+    bid: int  # 매수호가1
+    volume: int  # 체결거래량
+    accumulated_volume: int  # 누적거래량
+    accumulated_amount: int  # 누적거래대금
+    strength: float  # 체결강도
+    side: str  # 체결구분(1: 매수, 3: 장전, 5: 매도)
+
+
+class DomesticOrderbook(NamedTuple):
+    """국내주식 실시간호가(H0STASP0)"""
+
+    symbol: str  # 유가증권단축종목코드
+    time: str  # 영업시간(HHMMSS)
+    ask_prices: Tuple[int, ...]  # 매도호가1~10
+    bid_prices: Tuple[int, ...]  # 매수호가1~10
+    ask_volumes: Tuple[int, ...]  # 매도호가잔량1~10
+    bid_volumes: Tuple[int, ...]  # 매수호가잔량1~10
+    total_ask_volume: int  # 총매도호가잔량
+    total_bid_volume: int  # 총매수호가잔량
+
+
+class OverseasTrade(NamedTuple):
+    """해외주식 실시간지연체결가(HDFSCNT0)"""
+
+    symbol: str  # 종목코드
+    exchange: Exchange  # 거래소
+    local_date: str  # 현지일자(YYYYMMDD)
+    local_time: str  # 현지시간(HHMMSS)
+    price: float  # 현재가
+    diff_sign: Sign  # 대비구분
+    diff_price: float  # 전일대비
+    diff_rate: float  # 등락율
+    open: float  # 시가
+    high: float  # 고가
+    low: float  # 저가
+    bid: float  # 매수호가
+    ask: float  # 매도호가
+    bid_volume: int  # 매수잔량
+    ask_volume: int  # 매도잔량
+    volume: int  # 체결량
+    accumulated_volume: int  # 거래량
+    accumulated_amount: float  # 거래대금
+    strength: float  # 체결강도
+
+
+class OverseasOrderbook(NamedTuple):
+    """해외주식 실시간지연호가(HDFSASP0, 미국 1호가)"""
+
+    symbol: str  # 종목코드
+    exchange: Exchange  # 거래소
+    local_date: str  # 현지일자(YYYYMMDD)
+    local_time: str  # 현지시간(HHMMSS)
+    bid: float  # 매수호가1
+    ask: float  # 매도호가1
+    bid_volume: int  # 매수잔량1
+    ask_volume: int  # 매도잔량1
+    total_bid_volume: int  # 매수총잔량
+    total_ask_volume: int  # 매도총잔량
+
+
+class ExecutionNotice(NamedTuple):
+    """국내/해외주식 실시간체결통보(H0STCNI0, H0GSCNI0)"""
+
+    account: str  # 계좌번호
+    order_no: str  # 주문번호
+    original_order_no: str  # 원주문번호
+    order_type: Literal["buy", "sell"]  # 매도매수구분(01: 매도, 02: 매수)
+    modify_type: Literal["new", "update", "cancel"]  # 정정구분(0: 정상, 1: 정정, 2: 취소)
+    symbol: str  # 종목코드
+    quantity: int  # 체결수량(접수 통보일 경우 주문수량)
+    price: float  # 체결단가(접수 통보일 경우 주문단가)
+    time: str  # 체결시간(HHMMSS)
+    is_rejected: bool  # 거부여부
+    is_executed: bool  # 체결여부(False: 주문/정정/취소/거부 접수 통보, True: 체결 통보)
+    accept_type: str  # 접수여부(1: 주문접수, 2: 확인, 3: 취소(FOK/IOC))
+    order_quantity: int  # 주문수량
+    symbol_name: str  # 체결종목명
+    is_overseas: bool  # 해외주식 여부
+
+
+def _to_int(value: str) -> int:
+    return int(value) if value else 0
+
+
+def _to_float(value: str) -> float:
+    return float(value) if value else 0.0
+
+
+def _domestic_trade(f: List[str]) -> DomesticTrade:
+    return DomesticTrade(
+        symbol=f[0],
+        business_date=f[33],
+        time=f[1],
+        price=_to_int(f[2]),
+        diff_sign=Sign.from_value(f[3]),
+        diff_price=_to_int(f[4]),
+        diff_rate=_to_float(f[5]),
+        open=_to_int(f[7]),
+        high=_to_int(f[8]),
+        low=_to_int(f[9]),
+        ask=_to_int(f[10]),
+        bid=_to_int(f[11]),
+        volume=_to_int(f[12]),
+        accumulated_volume=_to_int(f[13]),
+        accumulated_amount=_to_int(f[14]),
+        strength=_to_float(f[18]),
+        side=f[21],
+    )
+
+
+def _domestic_orderbook(f: List[str]) -> DomesticOrderbook:
+    return DomesticOrderbook(
+        symbol=f[0],
+        time=f[1],
+        ask_prices=tuple(_to_int(v) for v in f[3:13]),
+        bid_prices=tuple(_to_int(v) for v in f[13:23]),
+        ask_volumes=tuple(_to_int(v) for v in f[23:33]),
+        bid_volumes=tuple(_to_int(v) for v in f[33:43]),
+        total_ask_volume=_to_int(f[43]),
+        total_bid_volume=_to_int(f[44]),
+    )
+
+
+def _overseas_trade(f: List[str]) -> OverseasTrade:
+    # RSYM = D + 시장구분(3자리) + 종목코드
+    return OverseasTrade(
+        symbol=f[1],
+        exchange=Exchange(f[0][1:4]),
+        local_date=f[4],
+        local_time=f[5],
+        price=_to_float(f[11]),
+        diff_sign=Sign.from_value(f[12]),
+        diff_price=_to_float(f[13]),
+        diff_rate=_to_float(f[14]),
+        open=_to_float(f[8]),
+        high=_to_float(f[9]),
+        low=_to_float(f[10]),
+        bid=_to_float(f[15]),
+        ask=_to_float(f[16]),
+        bid_volume=_to_int(f[17]),
+        ask_volume=_to_int(f[18]),
+        volume=_to_int(f[19]),
+        accumulated_volume=_to_int(f[20]),
+        accumulated_amount=_to_float(f[21]),
+        strength=_to_float(f[24]),
+    )
+
+
+def _overseas_orderbook(f: List[str]) -> OverseasOrderbook:
+    return OverseasOrderbook(
+        symbol=f[1],
+        exchange=Exchange(f[0][1:4]),
+        local_date=f[3],
+        local_time=f[4],
+        bid=_to_float(f[11]),
+        ask=_to_float(f[12]),
+        bid_volume=_to_int(f[13]),
+        ask_volume=_to_int(f[14]),
+        total_bid_volume=_to_int(f[7]),
+        total_ask_volume=_to_int(f[8]),
+    )
+
+
+_ORDER_TYPES = {"01": "sell", "02": "buy"}
+_MODIFY_TYPES = {"0": "new", "1": "update", "2": "cancel"}
+
+
+def _domestic_notice(f: List[str]) -> ExecutionNotice:
+    return ExecutionNotice(
+        account=f[1],
+        order_no=f[2],
+        original_order_no=f[3],
+        order_type=_ORDER_TYPES.get(f[4], f[4]),
+        modify_type=_MODIFY_TYPES.get(f[5], f[5]),
+        symbol=f[8],
+        quantity=_to_int(f[9]),
+        price=_to_float(f[10]),
+        time=f[11],
+        is_rejected=f[12] == "1",
+        is_executed=f[13] == "2",
+        accept_type=f[14],
+        order_quantity=_to_int(f[16]),
+        symbol_name=f[18],
+        is_overseas=False,
+    )
+
+
+def _overseas_notice(f: List[str]) -> ExecutionNotice:
+    return ExecutionNotice(
+        account=f[1],
+        order_no=f[2],
+        original_order_no=f[3],
+        order_type=_ORDER_TYPES.get(f[4], f[4]),
+        modify_type=_MODIFY_TYPES.get(f[5], f[5]),
+        symbol=f[7],
+        quantity=_to_int(f[8]),
+        price=_to_float(f[9]),
+        time=f[10],
+        is_rejected=f[11] == "1",
+        is_executed=f[12] == "2",
+        accept_type=f[13],
+        order_quantity=_to_int(f[15]),
+        symbol_name=f[17],
+        is_overseas=True,
+    )
+
+
+# tr_id -> (record 당 field 수, decoder)
+DECODERS: Dict[str, Tuple[int, Callable[[List[str]], NamedTuple]]] = {
+    RealtimeChannel.DOMESTIC_TRADE.value: (46, _domestic_trade),
+    RealtimeChannel.DOMESTIC_ORDERBOOK.value: (59, _domestic_orderbook),
+    RealtimeChannel.OVERSEAS_TRADE.value: (26, _overseas_trade),
+    RealtimeChannel.OVERSEAS_ORDERBOOK.value: (17, _overseas_orderbook),
+    RealtimeChannel.DOMESTIC_NOTICE.value: (23, _domestic_notice),
+    RealtimeChannel.DOMESTIC_NOTICE_DEV.value: (23, _domestic_notice),
+    RealtimeChannel.OVERSEAS_NOTICE.value: (21, _overseas_notice),
+    RealtimeChannel.OVERSEAS_NOTICE_DEV.value: (21, _overseas_notice),
+}
+
+
+def parse_frame(raw: str) -> Frame:
+    """'|'로 구분된 실시간 frame을 분리합니다."""
+    try:
+        encrypted, tr_id, count, payload = raw.split("|", 3)
+        return Frame(encrypted == "1", tr_id, int(count), payload)
+    except ValueError as err:
+        raise KISBadArguments(f"Invalid realtime frame: {raw[:50]}") from err
+
+
+def decode_records(tr_id: str, payload: str, count: int = 1) -> List[NamedTuple]:
+    """'^'로 구분된 데이터를 tr_id에 맞는 record로 변환합니다."""
+    if tr_id not in DECODERS:
+        raise KISBadArguments(f"Unsupported realtime tr_id: {tr_id}")
+    size, decoder = DECODERS[tr_id]
+    fields = payload.split("^")
+    return [decoder(fields[i * size : (i + 1) * size]) for i in range(count)]
+
+
+def decrypt(key: str, iv: str, cipher_text: str) -> str:
+    """체결통보 데이터를 구독 응답으로 받은 key/iv로 복호화합니다.(AES-256-CBC)"""
+    try:
+        cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+        plain = unpad(cipher.decrypt(b64decode(cipher_text)), AES.block_size)
+        return plain.decode("utf-8")
+    except (ValueError, KeyError) as err:
+        raise KISBadArguments("Cannot decrypt realtime frame") from err
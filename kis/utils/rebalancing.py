@@ -1,222 +1,374 @@
 """
-TODO 리밸런싱 리포트를 만들어줍니다
+# 리밸런싱
+
+목표 비중(weight)에 맞춰 종목별 매수/매도 수량을 계산하고 리포트를 만들어줍니다.
+
+- `rebalance`: 현재가를 동시에 조회하고 계산 결과(`RebalanceResult`)를 반환합니다.
+- `compute_rebalance`: 조회 없이 주어진 현재가로 계산합니다(numpy/pandas 벡터 연산).
+- `summary_markdown`, `to_markdown`, `write_report`: 계산 결과를 Markdown/Excel로 출력합니다.
+- `do_rebalance`: 위 함수를 차례로 실행하고 리포트를 저장하는 기존 함수
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from textwrap import dedent
-from typing import Any, Dict, List
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
 from kis.core import OverseasClient
-
-
-def do_rebalance(
-    items: List[Dict[str, Any]],
-    balance_won: float,
-    balance_usd: float,
-    multiplier: float = 0.95,
-    as_won: bool = True,
-    app_key: str = None,
-    app_secret: str = None,
-    account: str = None,
-):
-    """
-
-    :param items:
-    :param balance_won:
-    :param balance_usd:
-    :param multiplier:
-    :param as_won:
-    :return:
-    """
-    # validation
+from kis.core.base.batch import DEFAULT_MAX_WORKERS, run_batch
+
+if TYPE_CHECKING:
+    from kis.core.base.client import KisClientBase
+
+# 계산 결과 컬럼(순서대로 리포트의 AS-IS/EXPECTED/REAL 컬럼)
+COLUMNS: List[List[str]] = [
+    ["AS-IS", "count"],
+    ["AS-IS", "weight"],
+    ["AS-IS", "price"],
+    ["AS-IS", "amount"],
+    ["AS-IS", "pct"],
+    ["EXPECTED", "count"],
+    ["EXPECTED", "diff"],
+    ["EXPECTED", "amount"],
+    ["EXPECTED", "profit_or_loss"],
+    ["REAL", "count"],
+    ["REAL", "diff"],
+    ["REAL", "amount"],
+    ["REAL", "profit_or_loss"],
+]
+FIELDS: List[str] = [
+    "count",
+    "weight",
+    "price",
+    "amount",
+    "pct",
+    "expected_count",
+    "expected_count_diff",
+    "expected_amount",
+    "expected_profit_or_loss",
+    "real_count",
+    "real_count_diff",
+    "real_amount",
+    "real_profit_or_loss",
+]
+# 원화로 변환하는 금액 컬럼
+MONEY_FIELDS: List[str] = [
+    field
+    for field in FIELDS
+    if field.endswith("price")
+    or field.endswith("amount")
+    or field.endswith("profit_or_loss")
+]
+
+
+class RebalanceResult(NamedTuple):
+    """리밸런싱 계산 결과"""
+
+    frame: pd.DataFrame  # 종목별 계산 결과(index: symbol, columns: FIELDS)
+    total_budget: float  # 전체 예산(보유종목 평가금액 + 예수금)
+    expected_balance: float  # 목표 비중대로 매수한 후 남는 예수금
+    real_balance: float  # 정수 주수로 매수한 후 남는 예수금
+    currency: float  # 원/달러 환율
+    balance_won: float
+    balance_usd: float
+    as_won: bool
+
+    @property
+    def expected_pct(self) -> float:
+        return self.expected_balance / self.total_budget * 100
+
+    @property
+    def real_pct(self) -> float:
+        return self.real_balance / self.total_budget * 100
+
+    def rounded(self) -> pd.DataFrame:
+        """금액은 원화면 정수, 달러면 소수점 2자리로, 나머지는 소수점 2자리로 반올림"""
+        df = self.frame.copy()
+        money = df[MONEY_FIELDS]
+        df[MONEY_FIELDS] = money.astype(int) if self.as_won else money.round(2)
+        others = [field for field in FIELDS if field not in MONEY_FIELDS]
+        df[others] = df[others].round(2)
+        return df
+
+    @property
+    def pretty(self) -> pd.DataFrame:
+        """AS-IS/EXPECTED/REAL MultiIndex 컬럼으로 변환한 결과"""
+        df = self.rounded()
+        df.columns = pd.MultiIndex.from_frame(pd.DataFrame(COLUMNS, columns=["", ""]))
+        return df
+
+
+def validate_items(
+    items: Iterable[Dict[str, Any]], multiplier: float
+) -> List[Dict[str, Any]]:
+    items = list(items)
     required_keys = ["symbol", "weight"]
-    total_weight = 0
     for item in items:
         for key in required_keys:
             if key not in item.keys():
                 raise KeyError(f"No required key: {key}")
-        total_weight += item["weight"]
 
-    if total_weight > 1.0:
+    if sum(item["weight"] for item in items) > 1.0:
         raise ValueError("The sum of weights must be less than equal to 1")
 
     if multiplier > 1:
-        raise ValueError("multiplier must be greater than equal to 1. (default 0.95)")
+        raise ValueError("multiplier must be less than equal to 1. (default 0.95)")
+    return items
 
-    client = OverseasClient(
-        is_dev=True, app_key=app_key, app_secret=app_secret, account=account
-    )
 
-    currency = client.get_currency().price
+def fetch_prices(
+    client: "KisClientBase",
+    symbols: Iterable[str],
+    price_of: Optional[Callable[[str], float]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> pd.Series:
+    """
+    여러 종목의 현재가를 동시에 조회합니다. 한 종목이라도 실패하면 오류를 발생시킵니다.
 
-    # 1. 금액 계산 + 전체 예산 계산
-    total_budget = balance_usd + balance_won / currency
+    :param client: 현재가를 조회할 client
+    :param symbols: 종목코드 목록
+    :param price_of: 종목 1개의 현재가를 반환하는 함수. None이면 `client.quote.fetch_current_price`
+    :param max_workers: 동시에 조회할 최대 요청 수
+    :return: 종목코드별 현재가
+    """
+    if price_of is None:
 
-    for item in items:
-        symbol, count = item["symbol"], item.get("count", 0)
+        def price_of(symbol: str) -> float:
+            return client.quote.fetch_current_price(symbol).pretty.current
 
-        # get price
-        price = client.quote.fetch_current_price(symbol).pretty.current
+    symbols = list(symbols)
+    report = run_batch(symbols, send=price_of, max_workers=max_workers)
+    if report.failed:
+        raise report.failed[0].error
+    return pd.Series(report.data, index=symbols, dtype=float)
 
-        # calculate amount
-        amount = price * count
 
-        # 전체 예산 계산
-        total_budget += amount
-        item.update(price=price, amount=amount)
+def compute_rebalance(
+    items: Iterable[Dict[str, Any]],
+    prices: pd.Series,
+    balance_won: float,
+    balance_usd: float,
+    currency: float,
+    multiplier: float = 0.95,
+    as_won: bool = True,
+) -> RebalanceResult:
+    """
+    주어진 현재가로 리밸런싱 수량을 계산합니다.
+
+    :param items: 종목별 symbol, weight(목표 비중), count(보유수량, 기본 0)
+    :param prices: 종목코드별 현재가(달러)
+    :param balance_won: 원화 예수금
+    :param balance_usd: 달러 예수금
+    :param currency: 원/달러 환율
+    :param multiplier: 목표 금액에 곱하는 비율(예수금 여유분)
+    :param as_won: True인 경우 금액을 원화로 변환
+    """
+    items = validate_items(items, multiplier)
+    df = pd.DataFrame(items).set_index("symbol")
+    count = (
+        df["count"].fillna(0).to_numpy(dtype=float)
+        if "count" in df
+        else np.zeros(len(df))
+    )
+    weight = df["weight"].to_numpy(dtype=float)
+    price = prices.reindex(df.index).to_numpy(dtype=float)
 
-    # 2. weight로 expect, real amount 계산
-    for item in items:
-        symbol, weight, price, count, amount = (
-            item["symbol"],
-            item["weight"],
-            item["price"],
-            item.get("count", 0),
-            item["amount"],
-        )
+    # 1. 금액 계산 + 전체 예산 계산
+    amount = price * count
+    total_budget = balance_usd + balance_won / currency + amount.sum()
 
-        # 전체 중 현재 비율
-        pct = amount / total_budget
-
-        # 예상하는 리밸런싱 금액
-        expected_amount = total_budget * weight * multiplier
-        expected_count = expected_amount / price
-        expected_count_diff = expected_count - count
-        expected_profit_or_loss = expected_amount - amount
-
-        # 현재가로 계산했을 때 주수
-        real_count = expected_amount // price
-        real_count_diff = real_count - count
-
-        # 실제 가격
-        real_amount = real_count * price
-        real_profit_or_loss = real_amount - amount
-
-        item.update(
-            weight=weight,
-            pct=pct,
-            expected_count=expected_count,
-            expected_count_diff=expected_count_diff,
-            expected_amount=expected_amount,
-            expected_profit_or_loss=expected_profit_or_loss,
-            real_count=real_count,
-            real_count_diff=real_count_diff,
-            real_amount=real_amount,
-            real_profit_or_loss=real_profit_or_loss,
-        )
+    # 2. weight로 expect, real amount 계산
+    expected_amount = total_budget * weight * multiplier
+    expected_count = expected_amount / price
+    real_count = np.floor_divide(expected_amount, price)
+    real_amount = real_count * price
+
+    frame = pd.DataFrame(
+        {
+            "count": count,
+            "weight": weight,
+            "price": price,
+            "amount": amount,
+            "pct": amount / total_budget,
+            "expected_count": expected_count,
+            "expected_count_diff": expected_count - count,
+            "expected_amount": expected_amount,
+            "expected_profit_or_loss": expected_amount - amount,
+            "real_count": real_count,
+            "real_count_diff": real_count - count,
+            "real_amount": real_amount,
+            "real_profit_or_loss": real_amount - amount,
+        },
+        index=df.index,
+    )
 
     # 3. (optional) 원으로 변경
     if as_won:
-        total_budget = total_budget * currency
-        for item in items:
-            for key in item.keys():
-                if (
-                    key.endswith("amount")
-                    or key.endswith("price")
-                    or key.endswith("profit_or_loss")
-                ):
-                    item[key] = item[key] * currency
+        total_budget *= currency
+        frame[MONEY_FIELDS] *= currency
 
     # 4. 남은 예수금 계산
-    expected_balance = real_balance = total_budget
-    for item in items:
-        expected_balance -= item["expected_amount"]
-        real_balance -= item["real_amount"]
-    expected_pct = expected_balance / total_budget * 100
-    real_pct = real_balance / total_budget * 100
-
-    # 5. as dataframe
-    df = pd.DataFrame(items)
-    df.set_index("symbol", inplace=True)
-
-    # 6. round
-    for column in df.columns:
-        if (
-            "price" in column
-            or column.endswith("amount")
-            or column.endswith("profit_or_loss")
-        ):
-            if as_won:
-                df[column] = df[column].astype(int)
-            else:
-                df[column] = df[column].round(2)
-        elif "count" in column or column in ["pct", "weight"]:
-            df[column] = df[column].round(2)
-
-    # rename column
-    columns = pd.DataFrame(
-        [
-            ["AS-IS", "count"],
-            ["AS-IS", "weight"],
-            ["AS-IS", "price"],
-            ["AS-IS", "amount"],
-            ["AS-IS", "pct"],
-            ["EXPECTED", "count"],
-            ["EXPECTED", "diff"],
-            ["EXPECTED", "amount"],
-            ["EXPECTED", "profit_or_loss"],
-            ["REAL", "count"],
-            ["REAL", "diff"],
-            ["REAL", "amount"],
-            ["REAL", "profit_or_loss"],
-        ],
-        columns=["", ""],
+    return RebalanceResult(
+        frame=frame,
+        total_budget=total_budget,
+        expected_balance=total_budget - frame["expected_amount"].sum(),
+        real_balance=total_budget - frame["real_amount"].sum(),
+        currency=currency,
+        balance_won=balance_won,
+        balance_usd=balance_usd,
+        as_won=as_won,
     )
 
-    pretty_df = df.copy()
-    pretty_df.columns = pd.MultiIndex.from_frame(columns)
 
-    # 7. print
-    if as_won:
-        balance_info = dedent(
-            f"""\
-            # 요약
-            ## 전체 예산
-            - {total_budget:.0f} 원
-            
-            ## 예수금
-            - AS-IS WON: {balance_won or 0:.0f} 원
-            - AS-IS USD: {balance_usd or 0:.2f} $
-            - Expected: {expected_balance:.0f} 원 ({expected_pct:.1f} %)
-            - Real: {real_balance:.0f} 원 ({real_pct:.1f} %)
-            
-            ## 종목별 상세
-            """
+def rebalance(
+    items: Iterable[Dict[str, Any]],
+    balance_won: float,
+    balance_usd: float,
+    multiplier: float = 0.95,
+    as_won: bool = True,
+    client: Optional["KisClientBase"] = None,
+    currency: Optional[float] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> RebalanceResult:
+    """
+    현재가와 환율을 동시에 조회한 뒤 리밸런싱 수량을 계산합니다.
+
+    :param client: 현재가를 조회할 client. None이면 환경변수/default profile로 OverseasClient 생성
+    :param currency: 원/달러 환율. None이면 조회
+    """
+    items = validate_items(items, multiplier)
+    client = client or OverseasClient(is_dev=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = None if currency else executor.submit(OverseasClient.get_currency)
+        prices = fetch_prices(
+            client, [item["symbol"] for item in items], max_workers=max_workers
         )
-    else:
-        balance_info = dedent(
+        if future is not None:
+            currency = future.result().price
+
+    return compute_rebalance(
+        items,
+        prices=prices,
+        balance_won=balance_won,
+        balance_usd=balance_usd,
+        currency=currency,
+        multiplier=multiplier,
+        as_won=as_won,
+    )
+
+
+def summary_markdown(result: RebalanceResult) -> str:
+    """전체 예산, 예수금 요약"""
+    if result.as_won:
+        return dedent(
             f"""\
             # 요약
             ## 전체 예산
-            - {total_budget:.2f} $
+            - {result.total_budget:.0f} 원
 
             ## 예수금
-            - AS-IS WON: {balance_won or 0:.0f} 원
-            - AS-IS USD: {balance_usd or 0:.2f} $
-            - Expected: {expected_balance:.2f} $ ({expected_pct:.1f} %)
-            - Real: {real_balance:.2f} $ ({real_pct:.1f} %)
+            - AS-IS WON: {result.balance_won or 0:.0f} 원
+            - AS-IS USD: {result.balance_usd or 0:.2f} $
+            - Expected: {result.expected_balance:.0f} 원 ({result.expected_pct:.1f} %)
+            - Real: {result.real_balance:.0f} 원 ({result.real_pct:.1f} %)
 
             ## 종목별 상세
             """
         )
+    return dedent(
+        f"""\
+        # 요약
+        ## 전체 예산
+        - {result.total_budget:.2f} $
+
+        ## 예수금
+        - AS-IS WON: {result.balance_won or 0:.0f} 원
+        - AS-IS USD: {result.balance_usd or 0:.2f} $
+        - Expected: {result.expected_balance:.2f} $ ({result.expected_pct:.1f} %)
+        - Real: {result.real_balance:.2f} $ ({result.real_pct:.1f} %)
+
+        ## 종목별 상세
+        """
+    )
+
+
+def to_markdown(result: RebalanceResult) -> str:
+    """계산 결과 요약과 종목별 상세를 Markdown으로 변환"""
+    portfolio_info = tabulate(
+        result.rounded(), headers="keys", tablefmt="psql", floatfmt=".2f"
+    )
+    return summary_markdown(result) + portfolio_info
+
+
+def write_report(result: RebalanceResult, directory: Optional[str] = None) -> str:
+    """
+    summary.md, detail.xlsx 리포트를 저장합니다.
+
+    :param directory: 저장할 경로. None이면 `./portfolio/{현재시각}`
+    :return: 저장한 경로
+    """
+    if directory is None:
+        now = datetime.now().strftime("%Y%m%d_%H%M%S")
+        directory = os.path.join(os.getcwd(), "portfolio", now)
+    os.makedirs(directory, exist_ok=True)
 
-    # as str
-    portfolio_info = tabulate(df, headers="keys", tablefmt="psql", floatfmt=".2f")
+    with open(os.path.join(directory, "summary.md"), "w", encoding="utf-8") as f:
+        f.write(to_markdown(result))
 
-    # write
-    now = datetime.now().strftime("%Y%m%d_%H%M%S")
-    portfolio_dir = os.path.join(os.getcwd(), "portfolio", now)
-    os.makedirs(portfolio_dir, exist_ok=True)
-    with open(os.path.join(portfolio_dir, "summary.md"), "w", encoding="utf-8") as f:
-        f.write(balance_info)
-        f.write(portfolio_info)
+    result.pretty.to_excel(os.path.join(directory, "detail.xlsx"))
+    return directory
+
+
+def do_rebalance(
+    items: List[Dict[str, Any]],
+    balance_won: float,
+    balance_usd: float,
+    multiplier: float = 0.95,
+    as_won: bool = True,
+    app_key: str = None,
+    app_secret: str = None,
+    account: str = None,
+):
+    """
+    리밸런싱 수량을 계산하고 `./portfolio/{현재시각}`에 리포트를 저장합니다.
+
+    :param items: 종목별 symbol, weight(목표 비중), count(보유수량, 기본 0)
+    :param balance_won: 원화 예수금
+    :param balance_usd: 달러 예수금
+    :param multiplier: 목표 금액에 곱하는 비율(예수금 여유분)
+    :param as_won: True인 경우 금액을 원화로 변환
+    :return: AS-IS/EXPECTED/REAL MultiIndex 컬럼의 DataFrame
+    """
+    client = OverseasClient(
+        is_dev=True, app_key=app_key, app_secret=app_secret, account=account
+    )
+    result = rebalance(
+        items,
+        balance_won=balance_won,
+        balance_usd=balance_usd,
+        multiplier=multiplier,
+        as_won=as_won,
+        client=client,
+    )
 
-    pretty_df.to_excel(os.path.join(portfolio_dir, "detail.xlsx"))
+    write_report(result)
 
-    print(balance_info)
+    pretty_df = result.pretty
+    print(summary_markdown(result))
     print(pretty_df.to_string())
 
     return pretty_df
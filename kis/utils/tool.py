@@ -1,13 +1,46 @@
 import os
-from datetime import datetime, time, date
-from typing import Union, overload, Optional, List
+import threading
+import time as _time
+from contextlib import contextmanager
+from datetime import datetime, time, date, timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Union, overload, Optional, List, Tuple
 
-import pandas as pd
 import pytz
 import yaml
 from dateutil.parser import parse
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+_NOT_FOUND = object()
+
+
+class locked_cached_property(cached_property):
+    """
+    여러 thread에서 처음 접근해도 한 번만 생성하는 cached_property
+
+    python 3.12부터 `functools.cached_property`는 lock을 사용하지 않으므로, 동시에 접근하면
+    session/tracker 등이 thread마다 따로 생성될 수 있습니다. 객체별 RLock으로 생성 구간만 보호합니다.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        value = cache.get(self.attrname, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            # dict.setdefault는 atomic하므로 객체별 lock은 하나만 생성됨
+            lock = cache.setdefault("_cached_property_lock", threading.RLock())
+            with lock:
+                value = cache.get(self.attrname, _NOT_FOUND)
+                if value is _NOT_FOUND:
+                    value = self.func(instance)
+                    cache[self.attrname] = value
+        return value
+
 
 def read_text(file_path: str, encoding: str = "utf-8") -> str:
     with open(file_path, "r", encoding=encoding) as file:
@@ -32,8 +65,46 @@ def save_yaml(
 ):
     """save yaml file"""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w", encoding=encoding) as file:
+    # 다른 process에서 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding=encoding) as file:
         file.write(yaml.dump(data))
+    os.replace(temp_path, file_path)
+
+
+@contextmanager
+def file_lock(file_path: str, timeout: float = 30.0, poll: float = 0.05):
+    """
+    여러 process가 공유하는 파일에 대한 lock(`{file_path}.lock` 파일 생성)
+
+    lock 파일이 timeout보다 오래된 경우 비정상 종료된 process가 남긴 것으로 보고 삭제합니다.
+    """
+    lock_path = f"{file_path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    deadline = _time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if _time.time() - os.path.getmtime(lock_path) > timeout:
+                    os.remove(lock_path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if _time.monotonic() > deadline:
+                raise TimeoutError(f"Failed to acquire lock: '{lock_path}'")
+            _time.sleep(poll)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
 
 
 @overload
@@ -86,6 +157,43 @@ def is_us_market_hours():
     return False
 
 
-def model_to_df(data: List[BaseModel]) -> pd.DataFrame:
+# 해외주식 주간/야간 원장이 바뀔 수 있는 시각(현지 시각)
+# 한국: 주간거래 시작/종료, 미국: 프리마켓 시작, 정규장 시작/종료, 애프터마켓 종료
+SESSION_BOUNDARIES: Tuple[Tuple[str, time], ...] = (
+    ("Asia/Seoul", time(hour=9)),
+    ("Asia/Seoul", time(hour=18)),
+    ("US/Eastern", time(hour=4)),
+    ("US/Eastern", time(hour=9, minute=30)),
+    ("US/Eastern", time(hour=16)),
+    ("US/Eastern", time(hour=20)),
+)
+
+
+def next_session_boundary(now: Optional[datetime] = None) -> datetime:
+    """
+    다음 장 운영시간 경계 시각을 반환합니다.
+
+    미국 시각은 서머타임을 반영하며, 반환값은 timezone이 지정된 datetime입니다.
+
+    :param now: 기준 시각. timezone이 없으면 local time으로 간주
+    """
+    now = (now or datetime.now()).astimezone(pytz.utc)
+    candidates = []
+    for timezone_name, boundary in SESSION_BOUNDARIES:
+        timezone = pytz.timezone(timezone_name)
+        local_date = now.astimezone(timezone).date()
+        for days in (0, 1):
+            candidate = timezone.localize(
+                datetime.combine(local_date + timedelta(days=days), boundary)
+            )
+            if candidate > now:
+                candidates.append(candidate)
+                break
+    return min(candidates)
+
+
+def model_to_df(data: List[BaseModel]) -> "pd.DataFrame":
+    import pandas as pd
+
     rows = [row.dict() for row in data]
     return pd.DataFrame(rows)
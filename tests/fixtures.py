@@ -1,4 +1,5 @@
 import os
+
 import pytest
 
 
@@ -15,3 +16,80 @@ def fixture_app_secret():
 @pytest.fixture(name="account", scope="session")
 def fixture_account():
     return os.getenv("KIS_ACCOUNT")
+
+
+@pytest.fixture(name="kis_simulator")
+def fixture_kis_simulator(monkeypatch):
+    """로컬 KIS REST API simulator. client의 base url을 simulator로 바꿉니다."""
+    import kis.core.base.client as base_client
+    from kis.core.base.cache import AccountCaches
+    from tests.simulator import KisSimulator
+
+    simulator = KisSimulator()
+    monkeypatch.setattr(base_client, "get_base_url", lambda is_dev: simulator.url)
+    # 계좌별 cache는 프로세스 전체에서 공유하므로 test마다 초기화
+    monkeypatch.setattr(AccountCaches, "_instances", {})
+    yield simulator
+    simulator.close()
+
+
+@pytest.fixture(name="simulated_domestic_client")
+def fixture_simulated_domestic_client(kis_simulator, tmp_path):
+    from kis.core.domestic import DomesticClient
+
+    return DomesticClient(
+        app_key="app_key",
+        app_secret="app_secret",
+        account="12345678-01",
+        token_path=str(tmp_path / "token.yaml"),
+    )
+
+
+@pytest.fixture(name="simulated_overseas_client")
+def fixture_simulated_overseas_client(kis_simulator, tmp_path, monkeypatch):
+    import kis.core.base.session as base_session
+    from kis.core.overseas import OverseasClient
+
+    monkeypatch.setattr(base_session, "CONFIG_DIR", str(tmp_path))
+    client = OverseasClient(
+        app_key="app_key",
+        app_secret="app_secret",
+        account="12345678-01",
+        exchange="NAS",
+    )
+    client.strict = True
+    return client
+
+
+PROFILES = """
+[first]
+app_key = app_key_1
+app_secret = app_secret_1
+account = 10000001-01
+is_dev = True
+
+[second]
+app_key = app_key_2
+app_secret = app_secret_2
+account = 10000002-01
+is_dev = True
+
+[real]
+app_key = app_key_3
+app_secret = app_secret_3
+account = 10000003-01
+is_dev = False
+"""
+
+
+@pytest.fixture(name="config_path")
+def fixture_config_path(kis_simulator, tmp_path, monkeypatch):
+    """profile 3개(first, second, real)가 등록된 임시 config.ini"""
+    import kis.core.base.client as base_client
+    import kis.core.base.session as base_session
+
+    path = tmp_path / "config.ini"
+    path.write_text(PROFILES)
+    monkeypatch.setattr(base_client, "CONFIG_PATH", str(path))
+    monkeypatch.setattr(base_session, "CONFIG_DIR", str(tmp_path))
+    return path
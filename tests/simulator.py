@@ -0,0 +1,622 @@
+"""
+# KIS REST API simulator
+
+실제 서버 대신 test에서 사용하는 로컬 KIS OpenAPI 대역입니다.
+token/hashkey 발급과 주문 API를 흉내내고, 받은 요청을 시각과 함께 기록합니다.
+test에서는 `kis.core.base.client.get_base_url`을 simulator url로 바꿔서 사용합니다.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from kis.core.base.reference import krx_tick_size
+from kis.core.domestic.schema import Deposit, Price, Stock
+from kis.core.overseas import schema as overseas_schema
+
+Response = Tuple[int, Dict[str, Any], Dict[str, str]]
+
+# 매수 주문 tr_id(나머지는 매도)
+BUY_TR_IDS = {"VTTC0802U", "TTTC0802U", "VTTT1002U", "JTTT1002U"}
+
+
+class SimulatedRequest(NamedTuple):
+    """simulator가 받은 요청"""
+
+    method: str
+    path: str
+    tr_id: Optional[str]
+    params: Dict[str, str]
+    body: Dict[str, Any]
+    received_at: float
+    authorization: Optional[str] = None
+
+
+def ok(output: Any = None, msg: str = "정상처리 되었습니다.", **kwargs) -> Dict[str, Any]:
+    data = {"rt_cd": "0", "msg_cd": "APBK0013", "msg1": msg, **kwargs}
+    if output is not None:
+        data["output"] = output
+    return data
+
+
+def fail(msg_cd: str, msg: str) -> Dict[str, Any]:
+    return {"rt_cd": "1", "msg_cd": msg_cd, "msg1": msg}
+
+
+class KisSimulator:
+    """
+    로컬 KIS REST API simulator
+
+    :param latency: 주문 API 응답 지연 시간(초)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests: List[SimulatedRequest] = []
+        # 주문번호 -> 주문 body
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        # 주문이 거절되는 종목코드 -> 오류 메시지
+        self.rejects: Dict[str, str] = {}
+        self.tokens = 0
+        # 만료 응답(EGW00123)을 보낼 Authorization header
+        self.expired_tokens = set()
+
+        self._lock = threading.Lock()
+        self._order_no = count(1)
+        self.routes: Dict[Tuple[str, str], Callable[[SimulatedRequest], Response]] = {
+            ("POST", "/oauth2/tokenP"): self.issue_token,
+            ("POST", "/uapi/hashkey"): self.hash_key,
+            ("POST", "/uapi/domestic-stock/v1/trading/order-cash"): self.place_order,
+            ("POST", "/uapi/overseas-stock/v1/trading/order"): self.place_order,
+            (
+                "POST",
+                "/uapi/domestic-stock/v1/trading/order-rvsecncl",
+            ): self.modify_order,
+            (
+                "POST",
+                "/uapi/overseas-stock/v1/trading/order-rvsecncl",
+            ): self.modify_order,
+            (
+                "GET",
+                "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl",
+            ): self.domestic_open_orders,
+            (
+                "GET",
+                "/uapi/overseas-stock/v1/trading/inquire-nccs",
+            ): self.overseas_open_orders,
+            (
+                "GET",
+                "/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
+            ): self.domestic_executed_orders,
+            (
+                "GET",
+                "/uapi/overseas-stock/v1/trading/inquire-ccnl",
+            ): self.overseas_executed_orders,
+            ("POST", "/uapi/overseas-stock/v1/trading/dayornight"): self.day_or_night,
+            (
+                "GET",
+                "/uapi/domestic-stock/v1/quotations/inquire-price",
+            ): self.domestic_price,
+            (
+                "GET",
+                "/uapi/domestic-stock/v1/trading/inquire-psbl-order",
+            ): self.domestic_available_amount,
+            (
+                "GET",
+                "/uapi/domestic-stock/v1/trading/inquire-balance",
+            ): self.domestic_balance,
+            (
+                "GET",
+                "/uapi/overseas-stock/v1/trading/inquire-balance",
+            ): self.overseas_balance,
+        }
+        # 주문가능현금(국내)
+        self.cash = 10_000_000
+        # 종목별 보유수량, 매입평균가격(국내)
+        self.holdings: Dict[str, Tuple[int, float]] = {}
+        # 거래소별 종목별 보유수량, 매입평균가격(해외)
+        self.overseas_holdings: Dict[str, Dict[str, Tuple[int, float]]] = {}
+        # 종목별 현재가 시세(국내, Price 응답 필드)
+        self.prices: Dict[str, Dict[str, Any]] = {}
+        # 미체결 내역 조회시 한 번에 응답하는 주문 수(연속조회 확인용)
+        self.page_size = 100
+
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                simulator.handle(self, "GET")
+
+            def do_POST(self):
+                simulator.handle(self, "POST")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def requests_to(self, path: str) -> List[SimulatedRequest]:
+        return [req for req in self.requests if req.path == path]
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str):
+        url = urlparse(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length) or b"{}") if length else {}
+        req = SimulatedRequest(
+            method=method,
+            path=url.path,
+            tr_id=handler.headers.get("tr_id"),
+            params=dict(parse_qsl(url.query)),
+            body=body,
+            received_at=time.monotonic(),
+            authorization=handler.headers.get("Authorization"),
+        )
+        with self._lock:
+            self.requests.append(req)
+
+        route = self.routes.get((method, url.path))
+        if route is None:
+            status, data, headers = 404, fail("EGW00202", "Not Found"), {}
+        elif req.authorization in self.expired_tokens:
+            status, data, headers = 500, fail("EGW00123", "기간이 만료된 token 입니다."), {}
+        else:
+            status, data, headers = route(req)
+
+        payload = json.dumps(data).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=UTF-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        if req.tr_id:
+            handler.send_header("tr_id", req.tr_id)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def issue_token(self, req: SimulatedRequest) -> Response:
+        with self._lock:
+            self.tokens += 1
+            token = f"token-{self.tokens}"
+        return (
+            200,
+            {"access_token": token, "token_type": "Bearer", "expires_in": 86400},
+            {},
+        )
+
+    def expire_token(self):
+        """마지막으로 발급한 token을 만료시킵니다."""
+        self.expired_tokens.add(f"Bearer token-{self.tokens}")
+
+    def hash_key(self, req: SimulatedRequest) -> Response:
+        return 200, {"BODY": req.body, "HASH": f"hash-{len(json.dumps(req.body))}"}, {}
+
+    def add_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: float,
+        exchange: Optional[str] = None,
+        filled: int = 0,
+        **body,
+    ) -> str:
+        """
+        미체결 주문을 추가합니다.
+
+        :param exchange: 해외 거래소 코드(NASD 등). None이면 국내 주문
+        :return: 주문번호
+        """
+        with self._lock:
+            order_no = f"{next(self._order_no):010d}"
+            self.orders[order_no] = {
+                **body,
+                "PDNO": symbol,
+                "side": side,
+                "quantity": quantity,
+                "price": price,
+                "exchange": exchange,
+                "filled": filled,
+                "open": True,
+            }
+        return order_no
+
+    @staticmethod
+    def order_output(order_no: str) -> Dict[str, str]:
+        return {
+            "KRX_FWDG_ORD_ORGNO": "91252",
+            "ODNO": order_no,
+            "ORD_TMD": time.strftime("%H%M%S"),
+        }
+
+    def place_order(self, req: SimulatedRequest) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        symbol = req.body.get("PDNO")
+        if symbol in self.rejects:
+            return 200, fail("APBK0919", self.rejects[symbol]), {}
+
+        order_no = self.add_order(
+            symbol=symbol,
+            side="buy" if req.tr_id in BUY_TR_IDS else "sell",
+            quantity=int(req.body["ORD_QTY"]),
+            price=float(req.body.get("ORD_UNPR") or req.body.get("OVRS_ORD_UNPR")),
+            exchange=req.body.get("OVRS_EXCG_CD"),
+            tr_id=req.tr_id,
+            **req.body,
+        )
+        return 200, ok(self.order_output(order_no), msg="주문 전송 완료 되었습니다."), {}
+
+    def modify_order(self, req: SimulatedRequest) -> Response:
+        """정정(01)/취소(02): 원주문을 닫고, 정정인 경우 새 주문번호로 잔량을 다시 접수"""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            origin = self.orders.get(req.body["ORGN_ODNO"])
+            if origin is None or not origin["open"]:
+                return 200, fail("APBK1664", "정정/취소 가능한 주문이 없습니다."), {}
+            if origin["PDNO"] in self.rejects:
+                return 200, fail("APBK0919", self.rejects[origin["PDNO"]]), {}
+            origin["open"] = False
+            remaining = origin["quantity"] - origin["filled"]
+
+        if req.body["RVSE_CNCL_DVSN_CD"] == "02":
+            order_no = self.add_order(
+                symbol=origin["PDNO"],
+                side=origin["side"],
+                quantity=remaining,
+                price=0,
+                exchange=origin["exchange"],
+                ORGN_ODNO=req.body["ORGN_ODNO"],
+                cancel=True,
+            )
+            self.orders[order_no]["open"] = False
+        else:
+            quantity = int(req.body["ORD_QTY"])
+            if req.body.get("QTY_ALL_ORD_YN") == "Y" or not quantity:
+                quantity = remaining
+            price = float(req.body.get("ORD_UNPR") or req.body.get("OVRS_ORD_UNPR"))
+            order_no = self.add_order(
+                symbol=origin["PDNO"],
+                side=origin["side"],
+                quantity=quantity,
+                price=price,
+                exchange=origin["exchange"],
+                ORGN_ODNO=req.body["ORGN_ODNO"],
+            )
+        return 200, ok(self.order_output(order_no), msg="정정/취소 주문 완료"), {}
+
+    def fill(self, order_no: str, quantity: int, price: Optional[float] = None):
+        """주문을 체결합니다. 전량 체결되면 미체결 내역에서 빠집니다."""
+        with self._lock:
+            order = self.orders[order_no]
+            filled = order["filled"] + quantity
+            amount = order.get("filled_amount", 0) + quantity * (
+                price or order["price"]
+            )
+            order.update(filled=filled, filled_amount=amount)
+            if filled >= order["quantity"]:
+                order["open"] = False
+
+    def reject(self, order_no: str):
+        """주문을 거부 처리합니다."""
+        with self._lock:
+            self.orders[order_no].update(open=False, rejected=True)
+
+    def all_orders(self, domestic: bool) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            return [
+                (order_no, dict(order))
+                for order_no, order in self.orders.items()
+                if (order["exchange"] is None) == domestic
+            ]
+
+    def open_orders(self, domestic: bool) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            return [
+                (order_no, dict(order))
+                for order_no, order in self.orders.items()
+                if order["open"] and (order["exchange"] is None) == domestic
+            ]
+
+    def paginate(self, rows: list, offset: str, size: int, key: str) -> Response:
+        start = int(offset or 0)
+        end = start + self.page_size
+        has_next = end < len(rows)
+        data = ok(
+            rows[start:end],
+            **{f"ctx_area_fk{size}": "", key: str(end) if has_next else ""},
+        )
+        return 200, data, {"tr_cont": "M" if has_next else "D"}
+
+    def domestic_open_orders(self, req: SimulatedRequest) -> Response:
+        rows = []
+        for order_no, order in self.open_orders(domestic=True):
+            rows.append(
+                {
+                    "ord_gno_brno": "91252",
+                    "odno": order_no,
+                    "orgn_odno": order.get("ORGN_ODNO", "0"),
+                    "ord_dvsn_name": "지정가",
+                    "pdno": order["PDNO"],
+                    "prdt_name": order["PDNO"],
+                    "rvse_cncl_dvsn_name": "정정" if order.get("ORGN_ODNO") else "",
+                    "ord_qty": str(order["quantity"]),
+                    "ord_unpr": str(int(order["price"])),
+                    "ord_tmd": "090000",
+                    "tot_ccld_qty": str(order["filled"]),
+                    "tot_ccld_amt": str(order["filled"] * order["price"]),
+                    "psbl_qty": str(order["quantity"] - order["filled"]),
+                    "sll_buy_dvsn_cd": "02" if order["side"] == "buy" else "01",
+                    "ord_dvsn_cd": "00",
+                    "mgco_aptm_odno": "",
+                }
+            )
+        return self.paginate(
+            rows, req.params.get("CTX_AREA_NK100"), 100, "ctx_area_nk100"
+        )
+
+    def overseas_open_orders(self, req: SimulatedRequest) -> Response:
+        rows = []
+        for order_no, order in self.open_orders(domestic=False):
+            if order["exchange"] != req.params.get("OVRS_EXCG_CD"):
+                continue
+            rows.append(
+                {
+                    "ord_dt": time.strftime("%Y%m%d"),
+                    "ord_gno_brno": "01790",
+                    "odno": order_no,
+                    "orgn_odno": order.get("ORGN_ODNO", "0"),
+                    "pdno": order["PDNO"],
+                    "prdt_name": order["PDNO"],
+                    "sll_buy_dvsn_cd": "02" if order["side"] == "buy" else "01",
+                    "sll_buy_dvsn_cd_name": "매수" if order["side"] == "buy" else "매도",
+                    "rvse_cncl_dvsn_cd": "00",
+                    "rvse_cncl_dvsn_cd_name": "",
+                    "rjct_rson": "",
+                    "rjct_rson_name": "",
+                    "ord_tmd": "093000",
+                    "tr_mket_name": "나스닥",
+                    "tr_crcy_cd": "USD",
+                    "natn_cd": "840",
+                    "natn_kor_name": "미국",
+                    "ft_ord_qty": str(order["quantity"]),
+                    "ft_ccld_qty": str(order["filled"]),
+                    "nccs_qty": str(order["quantity"] - order["filled"]),
+                    "ft_ord_unpr3": str(order["price"]),
+                    "ft_ccld_unpr3": "0",
+                    "ft_ccld_amt3": "0",
+                    "ovrs_excg_cd": order["exchange"],
+                    "prcs_stat_name": "",
+                    "loan_type_cd": "",
+                    "loan_dt": "",
+                }
+            )
+        return self.paginate(
+            rows, req.params.get("CTX_AREA_NK200"), 200, "ctx_area_nk200"
+        )
+
+    def domestic_executed_orders(self, req: SimulatedRequest) -> Response:
+        rows = []
+        for order_no, order in self.all_orders(domestic=True):
+            filled = order["filled"]
+            rows.append(
+                {
+                    "ord_dt": time.strftime("%Y%m%d"),
+                    "ord_gno_brno": "91252",
+                    "odno": order_no,
+                    "orgn_odno": order.get("ORGN_ODNO", ""),
+                    "ord_dvsn_name": "지정가",
+                    "sll_buy_dvsn_cd": "02" if order["side"] == "buy" else "01",
+                    "sll_buy_dvsn_cd_name": "매수" if order["side"] == "buy" else "매도",
+                    "pdno": order["PDNO"],
+                    "prdt_name": order["PDNO"],
+                    "ord_qty": str(order["quantity"]),
+                    "ord_unpr": str(int(order["price"])),
+                    "ord_tmd": "090000",
+                    "tot_ccld_qty": str(filled),
+                    "avg_prvs": str(
+                        order.get("filled_amount", 0) / filled if filled else 0
+                    ),
+                    "cncl_yn": "Y" if order.get("cancel") else "N",
+                    "tot_ccld_amt": str(int(order.get("filled_amount", 0))),
+                    "loan_dt": "",
+                    "ord_dvsn_cd": "00",
+                    "cncl_cfrm_qty": str(order["quantity"])
+                    if order.get("cancel")
+                    else "0",
+                    "rmn_qty": str(order["quantity"] - filled),
+                    "rjct_qty": str(order["quantity"])
+                    if order.get("rejected")
+                    else "0",
+                    "ccld_cndt_name": "없음",
+                    "infm_tmd": "",
+                    "ctac_tlno": "",
+                    "prdt_type_cd": "300",
+                    "excg_dvsn_cd": "01",
+                }
+            )
+        detail = {
+            "tot_ord_qty": str(sum(int(row["ord_qty"]) for row in rows)),
+            "tot_ccld_qty": str(sum(int(row["tot_ccld_qty"]) for row in rows)),
+            "pchs_avg_pric": "0",
+            "tot_ccld_amt": str(sum(int(row["tot_ccld_amt"]) for row in rows)),
+            "prsm_tlex_smtl": "0",
+        }
+        return 200, ok(output1=rows, output2=detail), {"tr_cont": "D"}
+
+    def overseas_executed_orders(self, req: SimulatedRequest) -> Response:
+        rows = []
+        for order_no, order in self.all_orders(domestic=False):
+            filled = order["filled"]
+            if order.get("cancel"):
+                modify = ("02", "취소")
+            elif order.get("ORGN_ODNO"):
+                modify = ("01", "정정")
+            else:
+                modify = ("00", "")
+            rows.append(
+                {
+                    "ord_dt": time.strftime("%Y%m%d"),
+                    "ord_gno_brno": "01790",
+                    "odno": order_no,
+                    "orgn_odno": order.get("ORGN_ODNO", ""),
+                    "sll_buy_dvsn_cd": "02" if order["side"] == "buy" else "01",
+                    "sll_buy_dvsn_cd_name": "매수" if order["side"] == "buy" else "매도",
+                    "rvse_cncl_dvsn": modify[0],
+                    "rvse_cncl_dvsn_name": modify[1],
+                    "pdno": order["PDNO"],
+                    "prdt_name": order["PDNO"],
+                    "ft_ord_qty": str(order["quantity"]),
+                    "ft_ord_unpr3": str(order["price"]),
+                    "ft_ccld_qty": str(filled),
+                    "ft_ccld_unpr3": str(
+                        order.get("filled_amount", 0) / filled if filled else 0
+                    ),
+                    "ft_ccld_amt3": str(order.get("filled_amount", 0)),
+                    "nccs_qty": str(order["quantity"] - filled),
+                    "prcs_stat_name": "거부" if order.get("rejected") else "완료",
+                    "rjct_rson": "",
+                    "ord_tmd": "093000",
+                    "tr_mket_name": "나스닥",
+                    "tr_natn": "840",
+                    "tr_natn_name": "미국",
+                    "ovrs_excg_cd": order["exchange"],
+                    "tr_crcy_cd": "USD",
+                    "dmst_ord_dt": time.strftime("%Y%m%d"),
+                    "thco_ord_tmd": "093000",
+                    "loan_type_cd": "",
+                    "mdia_dvsn_name": "OpenAPI",
+                    "loan_dt": "",
+                    "rjct_rson_name": "",
+                }
+            )
+        return 200, ok(rows), {"tr_cont": "D"}
+
+    def day_or_night(self, req: SimulatedRequest) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return 200, ok({"PSBL_YN": "N"}), {}
+
+    def set_price(self, symbol: str, price: int, **fields):
+        """
+        국내 종목 현재가 시세를 등록합니다.
+        지정하지 않은 필드는 빈 값(0)으로 응답하고, 상한가/하한가는 기준가의 ±30%입니다.
+        """
+        self.prices[symbol] = {
+            "stck_prpr": price,
+            "stck_sdpr": price,
+            "stck_mxpr": int(price * 1.3),
+            "stck_llam": int(price * 0.7),
+            "aspr_unit": krx_tick_size(price),
+            "rprs_mrkt_kor_name": "KOSPI200",
+            "bstp_kor_isnm": "전기.전자",
+            "temp_stop_yn": "N",
+            "hts_deal_qty_unit_val": 1,
+            **fields,
+        }
+
+    def domestic_price(self, req: SimulatedRequest) -> Response:
+        fields = self.prices.get(req.params.get("fid_input_iscd"))
+        if fields is None:
+            return 200, fail("EGW00123", "종목코드가 올바르지 않습니다."), {}
+        output = {
+            name: "" if field.outer_type_ is str else "0"
+            for name, field in Price.__fields__.items()
+        }
+        output.update({key: str(value) for key, value in fields.items()})
+        return 200, ok(output), {}
+
+    def domestic_available_amount(self, req: SimulatedRequest) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        price = int(req.params.get("ORD_UNPR") or 0) or 10000
+        quantity = self.cash // price
+        output = {
+            "ord_psbl_cash": str(self.cash),
+            "ord_psbl_sbst": "0",
+            "ruse_psbl_amt": "0",
+            "fund_rpch_chgs": "0",
+            "psbl_qty_calc_unpr": str(price),
+            "nrcvb_buy_amt": str(quantity * price),
+            "nrcvb_buy_qty": str(quantity),
+            "max_buy_amt": str(quantity * price),
+            "max_buy_qty": str(quantity),
+            "cma_evlu_amt": "0",
+            "ovrs_re_use_amt_wcrc": "0",
+            "ord_psbl_frcr_amt_wcrc": "0",
+        }
+        return 200, ok(output), {}
+
+    @staticmethod
+    def empty_row(schema) -> Dict[str, str]:
+        return {
+            field.alias: "" if field.outer_type_ is str else "0"
+            for field in schema.__fields__.values()
+        }
+
+    def domestic_balance(self, req: SimulatedRequest) -> Response:
+        stocks = []
+        for symbol, (quantity, average_price) in self.holdings.items():
+            row = self.empty_row(Stock)
+            row.update(
+                pdno=symbol,
+                prdt_name=symbol,
+                hldg_qty=str(quantity),
+                ord_psbl_qty=str(quantity),
+                pchs_avg_pric=str(average_price),
+                pchs_amt=str(int(quantity * average_price)),
+            )
+            stocks.append(row)
+        deposit = self.empty_row(Deposit)
+        deposit.update(dnca_tot_amt=str(self.cash))
+        return 200, ok(output1=stocks, output2=[deposit]), {"tr_cont": "D"}
+
+    def overseas_balance(self, req: SimulatedRequest) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        exchange = req.params.get("OVRS_EXCG_CD")
+        rows = []
+        for symbol, (quantity, average_price) in self.overseas_holdings.get(
+            exchange, {}
+        ).items():
+            row = self.empty_row(overseas_schema.Stock)
+            row.update(
+                ovrs_pdno=symbol,
+                ovrs_item_name=symbol,
+                ovrs_cblc_qty=str(quantity),
+                ord_psbl_qty=str(quantity),
+                pchs_avg_pric=str(average_price),
+                frcr_pchs_amt1=str(quantity * average_price),
+                tr_crcy_cd="USD",
+                ovrs_excg_cd=exchange,
+            )
+            rows.append(row)
+        deposit = self.empty_row(overseas_schema.Deposit)
+        deposit.update(
+            frcr_pchs_amt1=str(sum(float(row["frcr_pchs_amt1"]) for row in rows))
+        )
+
+        start = int(req.params.get("CTX_AREA_NK200") or 0)
+        end = start + self.page_size
+        has_next = end < len(rows)
+        data = ok(
+            output1=rows[start:end],
+            output2=deposit,
+            ctx_area_fk200="",
+            ctx_area_nk200=str(end) if has_next else "",
+        )
+        return 200, data, {"tr_cont": "M" if has_next else "D"}
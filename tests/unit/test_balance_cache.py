@@ -0,0 +1,230 @@
+import threading
+import time
+
+import pytest
+
+from kis.core.base.cache import BalanceCache, Position
+from kis.core.domestic.balance import DomesticBalance
+from kis.core.realtime.schema import ExecutionNotice
+
+BALANCE_PATH = "/uapi/domestic-stock/v1/trading/inquire-balance"
+
+
+def notice(**kwargs) -> ExecutionNotice:
+    fields = dict(
+        account="5000000001",
+        order_no="0000000001",
+        original_order_no="",
+        order_type="buy",
+        modify_type="new",
+        symbol="005930",
+        quantity=10,
+        price=70000.0,
+        time="090000",
+        is_rejected=False,
+        is_executed=True,
+        accept_type="1",
+        order_quantity=10,
+        symbol_name="삼성전자",
+        is_overseas=False,
+    )
+    fields.update(kwargs)
+    return ExecutionNotice(**fields)
+
+
+class TestBalanceCache:
+    @pytest.fixture
+    def cache(self, kis_simulator, simulated_domestic_client) -> BalanceCache:
+        kis_simulator.holdings = {"005930": (10, 70000.0), "000660": (5, 120000.0)}
+        return simulated_domestic_client.balance_cache
+
+    def test_fetch(self, kis_simulator, cache):
+        """ttl 동안 같은 잔고 조회 결과를 재사용합니다."""
+        portfolio, deposits = cache.fetch()
+        assert {stock.pdno for stock in portfolio} == {"005930", "000660"}
+        assert deposits[0].dnca_tot_amt == kis_simulator.cash
+
+        assert cache.fetch() == (portfolio, deposits)
+        assert cache.positions["005930"].quantity == 10
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 1
+
+        cache.fetch(refresh=True)
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+    def test_order_invalidates(self, kis_simulator, cache):
+        """주문을 전송하면 잔고는 다시 조회하지만, 보유종목은 체결 전까지 그대로 사용합니다."""
+        cache.fetch()
+        cache.client.order.buy("005930", quantity=1, price=70000)
+
+        assert cache.positions["005930"].quantity == 10
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 1
+
+        cache.fetch()
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+    def test_apply_notice(self, kis_simulator, cache):
+        """체결통보로 보유수량과 매입평균가격을 조회 없이 갱신합니다."""
+        cache.fetch()
+
+        cache.apply_notice(notice(quantity=10, price=72000.0))
+        assert cache.positions["005930"].quantity == 20
+        assert cache.positions["005930"].average_price == pytest.approx(71000)
+
+        cache.apply_notice(notice(symbol="000660", order_type="sell", quantity=5))
+        assert "000660" not in cache.positions
+
+        cache.apply_notice(notice(symbol="035720", quantity=3, price=50000.0))
+        assert cache.positions["035720"].quantity == 3
+
+        # 접수/거부/해외 체결통보는 무시
+        cache.apply_notice(notice(is_executed=False))
+        cache.apply_notice(notice(is_rejected=True))
+        cache.apply_notice(notice(is_overseas=True))
+        assert cache.positions["005930"].quantity == 20
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 1
+
+        # 체결 이후 잔고(예수금 등)는 다시 조회
+        cache.fetch()
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+    def test_invalidated_while_loading(self, kis_simulator, cache, monkeypatch):
+        """보유종목을 조회한 직후 다른 thread에서 비워도 다시 조회해 반환합니다."""
+        fetch = cache.fetch
+
+        def fetch_then_invalidate(refresh: bool = False):
+            snapshot = fetch(refresh=refresh)
+            monkeypatch.setattr(cache, "fetch", fetch)
+            cache.invalidate()
+            return snapshot
+
+        monkeypatch.setattr(cache, "fetch", fetch_then_invalidate)
+        assert cache.positions["005930"].quantity == 10
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+    @pytest.fixture
+    def slow_balance(self, monkeypatch):
+        """release 전까지 잔고 조회 응답을 기다리게 합니다."""
+        fetch = DomesticBalance.fetch
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_fetch(self, *args, **kwargs):
+            snapshot = fetch(self, *args, **kwargs)
+            started.set()
+            release.wait(5)
+            return snapshot
+
+        monkeypatch.setattr(DomesticBalance, "fetch", blocking_fetch)
+        return started, release
+
+    def test_fill_while_loading(self, kis_simulator, cache, slow_balance):
+        """조회 중에 반영한 체결을 체결 전 조회 결과로 덮어쓰지 않습니다."""
+        started, release = slow_balance
+        release.set()
+        cache.fetch()
+        release.clear()
+
+        thread = threading.Thread(target=cache.fetch, kwargs={"refresh": True})
+        thread.start()
+        started.wait(5)
+        cache.apply_notice(notice(quantity=5, price=70000.0))
+        release.set()
+        thread.join()
+
+        assert cache.positions["005930"].quantity == 15
+        # 체결 전 잔고 조회 결과는 저장하지 않음
+        cache.fetch()
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 3
+
+    def test_fill_before_first_load(self, kis_simulator, cache, slow_balance):
+        """첫 조회 중에 체결되면 체결이 반영된 잔고를 다시 조회합니다."""
+        started, release = slow_balance
+        positions = []
+        thread = threading.Thread(target=lambda: positions.append(cache.positions))
+        thread.start()
+        started.wait(5)
+        kis_simulator.holdings["005930"] = (15, 70000.0)
+        cache.apply_notice(notice(quantity=5, price=70000.0))
+        release.set()
+        thread.join()
+
+        assert positions[0]["005930"].quantity == 15
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+    def test_ttl(self, kis_simulator, cache):
+        """ttl이 지나면 잔고와 보유종목을 다시 조회합니다."""
+        cache.ttl = 0.05
+        cache.fetch()
+        kis_simulator.holdings["005930"] = (7, 70000.0)
+        time.sleep(0.1)
+
+        assert cache.positions["005930"].quantity == 7
+        assert len(kis_simulator.requests_to(BALANCE_PATH)) == 2
+
+
+OVERSEAS_BALANCE_PATH = "/uapi/overseas-stock/v1/trading/inquire-balance"
+
+
+class TestOverseasBalances:
+    @pytest.fixture
+    def balance(self, kis_simulator, simulated_overseas_client):
+        kis_simulator.overseas_holdings = {
+            "NASD": {"AAPL": (10, 180.0), "MSFT": (3, 400.0), "NVDA": (2, 900.0)},
+            "NYSE": {"KO": (20, 60.0)},
+            "AMEX": {},
+        }
+        return simulated_overseas_client.balance
+
+    def test_fetch_pages(self, kis_simulator, balance):
+        """연속조회한 보유종목을 모두 합칩니다."""
+        kis_simulator.page_size = 2
+        portfolio, deposit = balance.fetch_with_deposit()
+
+        assert [stock.ovrs_pdno for stock in portfolio] == ["AAPL", "MSFT", "NVDA"]
+        assert deposit.purchase_amount == 10 * 180 + 3 * 400 + 2 * 900
+        assert len(kis_simulator.requests_to(OVERSEAS_BALANCE_PATH)) == 2
+
+    def test_fetch_all_exchanges(self, kis_simulator, balance):
+        """거래소별 잔고를 동시에 조회해 종목코드별로 합칩니다."""
+        kis_simulator.latency = 0.3
+        result = balance.fetch_all_exchanges()
+
+        assert set(result.positions) == {"AAPL", "MSFT", "NVDA", "KO"}
+        assert result.positions["KO"].ovrs_excg_cd == "NYSE"
+        assert {exchange.name for exchange in result.deposits} == {"NAS", "NYS", "AMS"}
+        assert result.deposits["NYS"].purchase_amount == 20 * 60
+
+        requests = kis_simulator.requests_to(OVERSEAS_BALANCE_PATH)
+        assert {req.params["OVRS_EXCG_CD"] for req in requests} == {
+            "NASD",
+            "NYSE",
+            "AMEX",
+        }
+        # 주야간원장 구분은 한 번만 조회
+        assert (
+            len(kis_simulator.requests_to("/uapi/overseas-stock/v1/trading/dayornight"))
+            == 1
+        )
+        # 동시에 조회해 응답 대기 시간이 겹침
+        assert (
+            max(req.received_at for req in requests)
+            - min(req.received_at for req in requests)
+            < kis_simulator.latency
+        )
+
+    def test_apply_notice(self, kis_simulator, balance, simulated_overseas_client):
+        """해외 체결통보로 새로 생긴 보유종목에도 거래소코드를 채웁니다."""
+        cache = simulated_overseas_client.balance_cache
+        cache.fetch()
+
+        cache.apply_notice(
+            notice(symbol="AAPL", quantity=5, price=186.0, is_overseas=True)
+        )
+        cache.apply_notice(
+            notice(symbol="TSLA", quantity=1, price=250.0, is_overseas=True)
+        )
+
+        positions = cache.positions
+        assert positions["AAPL"].quantity == 15
+        assert positions["AAPL"].exchange == "NASD"
+        # strict mode: 보유하지 않았던 종목은 client.exchange
+        assert positions["TSLA"] == Position("TSLA", 1, 250.0, exchange="NASD")
@@ -0,0 +1,322 @@
+import threading
+import time
+
+import pytest
+
+from kis.core.base.batch import BasketOrder, LatencySummary
+from kis.core.base.schema import ResponseData
+from kis.core.base.session import REQUEST_MIN_INTERVAL
+from kis.exceptions import KISBadArguments
+
+DOMESTIC_ORDER_PATH = "/uapi/domestic-stock/v1/trading/order-cash"
+OVERSEAS_ORDER_PATH = "/uapi/overseas-stock/v1/trading/order"
+
+BASKET = [
+    {"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000},
+    {"order_type": "sell", "symbol": "000660", "quantity": 5, "price": 120000},
+    {"order_type": "buy", "symbol": "035420", "quantity": 3, "as_market_price": True},
+    {"order_type": "sell", "symbol": "035720", "quantity": 7, "price": 50000},
+    {"order_type": "buy", "symbol": "051910", "quantity": 1, "price": 450000},
+    {"order_type": "sell", "symbol": "005380", "quantity": 2, "as_market_price": True},
+]
+
+
+class TestSubmitBasket:
+    def test_results_and_errors(self, kis_simulator, simulated_domestic_client):
+        """주문별 결과/오류를 입력 순서대로 반환하고, 실패한 주문이 있어도 나머지를 전송합니다."""
+        kis_simulator.rejects["035420"] = "주문가능금액을 초과 했습니다"
+
+        report = simulated_domestic_client.order.submit_basket(BASKET)
+
+        assert len(report) == len(BASKET)
+        assert [result.item.symbol for result in report] == [
+            o["symbol"] for o in BASKET
+        ]
+        assert [result.index for result in report.failed] == [2]
+        assert isinstance(report.failed[0].error, KISBadArguments)
+        assert len(report.succeeded) == 5
+        assert all(data.order_no for data in report.data)
+
+        # 주문 body: 지정가는 정수 단가 그대로, 시장가는 0
+        orders = {order["PDNO"]: order for order in kis_simulator.orders.values()}
+        assert orders["005930"]["ORD_UNPR"] == "70000"
+        assert orders["005380"]["ORD_UNPR"] == "0"
+        assert orders["000660"]["tr_id"] == "VTTC0801U"
+        assert orders["005930"]["tr_id"] == "VTTC0802U"
+
+        # token은 여러 thread가 동시에 요청해도 한 번만 발급
+        assert kis_simulator.tokens == 1
+
+        latency = report.latency
+        assert isinstance(latency, LatencySummary)
+        assert latency.count == len(BASKET)
+        assert latency.min <= latency.p50 <= latency.p95 <= latency.max
+
+    def test_sell_first(self, kis_simulator, simulated_domestic_client):
+        """sequential=True이면 매도 주문이 모두 접수된 뒤 매수 주문을 전송합니다."""
+        simulated_domestic_client.order.submit_basket(BASKET, sequential=True)
+
+        sides = [req.tr_id for req in kis_simulator.requests_to(DOMESTIC_ORDER_PATH)]
+        assert sides == ["VTTC0801U"] * 3 + ["VTTC0802U"] * 3
+
+    def test_concurrent_under_rate_limit(
+        self, kis_simulator, simulated_domestic_client
+    ):
+        """응답을 기다리는 시간은 겹치지만, 요청 간격은 REQUEST_MIN_INTERVAL 이상 유지합니다."""
+        kis_simulator.latency = 0.5
+
+        report = simulated_domestic_client.order.submit_basket(BASKET, max_workers=4)
+
+        assert not report.failed
+        # 순차 전송이면 주문 응답 대기만 최소 0.5 * 6초
+        assert report.elapsed < kis_simulator.latency * len(BASKET)
+
+        received = [
+            req.received_at
+            for req in kis_simulator.requests
+            if req.path != "/oauth2/tokenP"
+        ]
+        gaps = [b - a for a, b in zip(received, received[1:])]
+        assert min(gaps) >= REQUEST_MIN_INTERVAL * 0.8
+
+    def test_custom_priority(self, kis_simulator, simulated_overseas_client):
+        """해외 주문도 같은 방식으로 전송하고, 정렬 key 함수로 전송 순서를 정할 수 있습니다."""
+        orders = [
+            BasketOrder(order_type="buy", symbol="MSFT", quantity=1, price=330.5),
+            BasketOrder(order_type="buy", symbol="AAPL", quantity=2, price=187.25),
+            BasketOrder(order_type="sell", symbol="TSLA", quantity=1, price=250),
+        ]
+        report = simulated_overseas_client.order.submit_basket(
+            orders, priority=lambda order: order.symbol, max_workers=1
+        )
+
+        assert not report.failed
+        sent = kis_simulator.requests_to(OVERSEAS_ORDER_PATH)
+        assert [req.body["PDNO"] for req in sent] == ["AAPL", "MSFT", "TSLA"]
+        assert [req.body["OVRS_ORD_UNPR"] for req in sent] == ["187.25", "330.5", "250"]
+        assert {req.body["OVRS_EXCG_CD"] for req in sent} == {"NASD"}
+
+    def test_bad_arguments(self, simulated_domestic_client):
+        """잘못된 priority는 주문 전송 전에 오류를 발생시킵니다."""
+        with pytest.raises(KISBadArguments):
+            simulated_domestic_client.order.submit_basket(BASKET, priority="random")
+
+
+class TestBulkModify:
+    @pytest.fixture
+    def domestic_orders(self, kis_simulator, simulated_domestic_client):
+        # 미체결 내역 조회는 실거래 모드에서만 가능
+        simulated_domestic_client.is_dev = False
+        kis_simulator.page_size = 2
+        return {
+            "buy_small": kis_simulator.add_order("005930", "buy", 10, 70000),
+            "buy_large": kis_simulator.add_order("000660", "buy", 10, 120000, filled=2),
+            "sell": kis_simulator.add_order("035720", "sell", 5, 50000),
+            "locked": kis_simulator.add_order("051910", "sell", 1, 450000),
+        }
+
+    def test_cancel_all(
+        self, kis_simulator, simulated_domestic_client, domestic_orders
+    ):
+        """미체결 주문을 한 번(연속조회 포함) 조회한 뒤 동시에 취소하고, 실패한 주문은 따로 기록합니다."""
+        kis_simulator.rejects["051910"] = "이미 체결된 주문입니다"
+
+        report = simulated_domestic_client.order.cancel_all()
+
+        fetches = kis_simulator.requests_to(
+            "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl"
+        )
+        assert len(fetches) == 2  # page_size=2, 4건
+        assert len(report) == 4
+        assert [result.item.order_no for result in report.failed] == [
+            domestic_orders["locked"]
+        ]
+        assert isinstance(report.failed[0].error, KISBadArguments)
+        assert {
+            order_no
+            for order_no, order in kis_simulator.orders.items()
+            if order["open"]
+        } == {domestic_orders["locked"]}
+
+        # 취소 요청은 전량 취소, 미체결 수량은 체결된 수량을 제외
+        cancels = kis_simulator.requests_to(
+            "/uapi/domestic-stock/v1/trading/order-rvsecncl"
+        )
+        assert {req.body["RVSE_CNCL_DVSN_CD"] for req in cancels} == {"02"}
+        assert {req.body["QTY_ALL_ORD_YN"] for req in cancels} == {"Y"}
+        large = next(
+            r.item for r in report if r.item.order_no == domestic_orders["buy_large"]
+        )
+        assert large.quantity == 8 and large.order_type == "buy"
+
+    def test_cancel_all_filter(
+        self, kis_simulator, simulated_domestic_client, domestic_orders
+    ):
+        """filter에 맞는 주문만 취소합니다."""
+        report = simulated_domestic_client.order.cancel_all(
+            lambda order: order.order_type == "buy", max_workers=1
+        )
+
+        # 기본 priority: 미체결 금액이 큰 주문 먼저
+        assert [
+            req.body["ORGN_ODNO"]
+            for req in kis_simulator.requests_to(
+                "/uapi/domestic-stock/v1/trading/order-rvsecncl"
+            )
+        ] == [domestic_orders["buy_large"], domestic_orders["buy_small"]]
+        assert not report.failed
+        assert kis_simulator.orders[domestic_orders["sell"]]["open"]
+
+    def test_modify_many(
+        self, kis_simulator, simulated_domestic_client, domestic_orders
+    ):
+        """주문번호별 정정 내용을 동시에 전송하고, 없는 주문번호는 요청 없이 실패로 기록합니다."""
+        report = simulated_domestic_client.order.modify_many(
+            {
+                domestic_orders["buy_small"]: {"price": 70100},
+                domestic_orders["sell"]: {"price": 49900, "quantity": 3},
+                "9999999999": {"price": 1},
+            }
+        )
+
+        assert len(report.succeeded) == 2
+        assert [result.item[0] for result in report.failed] == ["9999999999"]
+        modified = {
+            order["ORGN_ODNO"]: order
+            for order in kis_simulator.orders.values()
+            if order.get("ORGN_ODNO") and order["open"]
+        }
+        assert modified[domestic_orders["buy_small"]]["price"] == 70100
+        assert modified[domestic_orders["buy_small"]]["quantity"] == 10
+        assert modified[domestic_orders["sell"]]["quantity"] == 3
+
+    def test_overseas_cancel_all(self, kis_simulator, simulated_overseas_client):
+        """해외 미체결 주문도 같은 방식으로 취소합니다."""
+        kis_simulator.add_order("AAPL", "buy", 2, 187.25, exchange="NASD")
+        kis_simulator.add_order("MSFT", "sell", 1, 330.5, exchange="NASD")
+
+        report = simulated_overseas_client.order.cancel_all()
+
+        assert not report.failed and len(report) == 2
+        sent = kis_simulator.requests_to(
+            "/uapi/overseas-stock/v1/trading/order-rvsecncl"
+        )
+        assert {req.body["OVRS_ORD_UNPR"] for req in sent} == {"0"}
+        assert sorted(req.body["ORD_QTY"] for req in sent) == ["1", "2"]
+        assert {req.tr_id for req in sent} == {"VTTT1004U"}
+        assert not any(order["open"] for order in kis_simulator.orders.values())
+
+    def test_overseas_cancel_body(self, kis_simulator, simulated_overseas_client):
+        """해외 취소 주문은 주문단가 0, 취소할 수량으로 전송하고 응답 전체를 반환합니다."""
+        order_no = kis_simulator.add_order("AAPL", "buy", 2, 187.25, exchange="NASD")
+
+        result = simulated_overseas_client.order._modify(
+            modify_type="cancel",
+            org_no="",
+            order_no=order_no,
+            symbol="AAPL",
+            quantity=2,
+            price=187.25,
+        )
+
+        assert isinstance(result, ResponseData)
+        assert result.data.order_no
+        (req,) = kis_simulator.requests_to(
+            "/uapi/overseas-stock/v1/trading/order-rvsecncl"
+        )
+        assert req.body["RVSE_CNCL_DVSN_CD"] == "02"
+        assert req.body["OVRS_ORD_UNPR"] == "0"
+        assert req.body["ORD_QTY"] == "2"
+
+
+class TestAvailableAmounts:
+    PATH = "/uapi/domestic-stock/v1/trading/inquire-psbl-order"
+
+    def test_concurrent(self, kis_simulator, simulated_domestic_client):
+        """여러 종목의 주문가능금액을 동시에 조회하고 입력 순서대로 반환합니다."""
+        kis_simulator.latency = 0.3
+        items = [
+            ("005930", 70000),
+            ("000660", 120000),
+            ("035720", 50000),
+            ("051910", 450000),
+        ]
+
+        report = simulated_domestic_client.order.get_available_amounts(items)
+
+        assert not report.failed
+        assert [data.max_buy_qty for data in report.data] == [142, 83, 200, 22]
+        assert report.elapsed < kis_simulator.latency * len(items)
+
+    def test_cache(self, kis_simulator, simulated_domestic_client):
+        """같은 조회는 ttl 동안 재사용하고, 같은 계좌로 주문을 전송하면 다시 조회합니다."""
+        order = simulated_domestic_client.order
+        items = [("005930", 70000), {"symbol": "000660", "is_market_price": True}]
+
+        order.get_available_amounts(items)
+        order.get_available_amounts(items)
+        assert len(kis_simulator.requests_to(self.PATH)) == 2
+
+        # 가격이 다르면 다른 조회
+        order.get_available_amounts([("005930", 69900)])
+        assert len(kis_simulator.requests_to(self.PATH)) == 3
+
+        order.buy("005930", quantity=1, price=70000)
+        kis_simulator.cash = 0
+        report = order.get_available_amounts(items)
+        assert len(kis_simulator.requests_to(self.PATH)) == 5
+        assert [data.max_buy_qty for data in report.data] == [0, 0]
+
+    def test_ttl(self):
+        """ttl이 지나면 다시 조회하고, 동시에 조회해도 한 번만 조회합니다."""
+        from kis.core.base.cache import TTLCache
+
+        calls = []
+        cache = TTLCache(ttl=0.1)
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return len(calls)
+
+        threads = [
+            threading.Thread(target=cache.get_or_load, args=("key", load))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.get_or_load("key", load) == 1
+        # 조회가 끝난 key의 lock은 남기지 않음
+        assert not cache._locks
+
+        time.sleep(0.15)
+        assert cache.get_or_load("key", load) == 2
+
+    def test_invalidate_while_loading(self):
+        """조회 중에 key를 invalidate하면 그 조회 결과는 저장하지 않습니다."""
+        from kis.core.base.cache import TTLCache
+
+        cache = TTLCache(ttl=60)
+        started, release = threading.Event(), threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(cache.get_or_load("key", load))
+        )
+        thread.start()
+        started.wait(5)
+        cache.invalidate("key")
+        release.set()
+        thread.join()
+
+        assert results == ["stale"]
+        assert cache.get("key") is None
+        assert cache.get_or_load("key", lambda: "fresh") == "fresh"
+        assert cache.get("key") == "fresh"
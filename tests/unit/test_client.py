@@ -0,0 +1,40 @@
+import pytest
+
+import kis.core.base.client as base_client
+from kis.core.domestic import DomesticClient
+from kis.exceptions import KISBadArguments, KISSecretNotFound
+
+
+@pytest.fixture(name="no_config")
+def fixture_no_config(tmp_path, monkeypatch):
+    """config.ini와 $KIS_APP_KEY 등의 환경변수가 없는 상태"""
+    monkeypatch.setattr(base_client, "CONFIG_PATH", str(tmp_path / "config.ini"))
+    for name in ["KIS_APP_KEY", "KIS_APP_SECRET", "KIS_ACCOUNT"]:
+        monkeypatch.setattr(base_client, name, None)
+
+
+class TestDefaultProfile:
+    def test_credentials_given(self, no_config):
+        """app_key, app_secret, account를 모두 입력받으면 default profile을 읽지 않습니다."""
+        client = DomesticClient(
+            app_key="app_key", app_secret="app_secret", account="12345678-01"
+        )
+        assert client.profile_name is None
+        assert client.account == "12345678-01"
+
+    def test_credentials_from_env(self, no_config, monkeypatch):
+        """입력받지 않은 값은 환경변수를 사용합니다."""
+        monkeypatch.setattr(base_client, "KIS_APP_SECRET", "app_secret")
+        monkeypatch.setattr(base_client, "KIS_ACCOUNT", "12345678-01")
+        client = DomesticClient(app_key="app_key")
+        assert client.profile_name is None
+
+    def test_fallback(self, no_config):
+        """strict=False이고 app_key, app_secret, account가 없으면 default profile을 사용합니다."""
+        with pytest.raises(KISBadArguments, match="Config file not found"):
+            DomesticClient(app_key="app_key")
+
+    def test_strict(self, no_config):
+        """strict=True이면 default profile을 사용하지 않습니다."""
+        with pytest.raises(KISSecretNotFound):
+            DomesticClient(strict=True)
@@ -0,0 +1,57 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytz
+
+from kis.utils.tool import next_session_boundary
+
+DAY_OR_NIGHT_PATH = "/uapi/overseas-stock/v1/trading/dayornight"
+
+SEOUL = pytz.timezone("Asia/Seoul")
+
+
+class TestIsDay:
+    def test_cached(self, kis_simulator, simulated_overseas_client):
+        """주야간원장 구분은 한 번만 조회하고, 경계 시각이 지나거나 refresh하면 다시 조회합니다."""
+        client = simulated_overseas_client
+
+        assert client.is_day is True
+        assert client.is_day is True
+        assert len(kis_simulator.requests_to(DAY_OR_NIGHT_PATH)) == 1
+        assert client._is_day_expires_at > datetime.now().astimezone()
+
+        client.refresh_is_day()
+        assert len(kis_simulator.requests_to(DAY_OR_NIGHT_PATH)) == 2
+
+        client._is_day_expires_at = datetime.now().astimezone() - timedelta(seconds=1)
+        assert client.is_day is True
+        assert len(kis_simulator.requests_to(DAY_OR_NIGHT_PATH)) == 3
+
+    def test_concurrent(self, kis_simulator, simulated_overseas_client):
+        """여러 thread가 동시에 읽어도 한 번만 조회합니다."""
+        kis_simulator.latency = 0.2
+        threads = [
+            threading.Thread(target=lambda: simulated_overseas_client.is_day)
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(kis_simulator.requests_to(DAY_OR_NIGHT_PATH)) == 1
+
+    def test_next_session_boundary(self):
+        """한국/미국 장 운영시간 경계 중 가장 가까운 시각을 반환하며, 서머타임을 반영합니다."""
+
+        def boundary(value: str) -> str:
+            now = SEOUL.localize(datetime.fromisoformat(value))
+            return next_session_boundary(now).astimezone(SEOUL).strftime("%m-%d %H:%M")
+
+        assert boundary("2024-07-01 08:00") == "07-01 09:00"
+        # 서머타임: 미국 프리마켓 04:00 = 한국 17:00, 정규장 09:30 = 22:30
+        assert boundary("2024-07-01 10:00") == "07-01 17:00"
+        assert boundary("2024-07-01 19:00") == "07-01 22:30"
+        # 서머타임 해제: 정규장 09:30 = 한국 23:30
+        assert boundary("2024-01-15 23:00") == "01-15 23:30"
+        assert boundary("2024-01-16 10:00") == "01-16 18:00"
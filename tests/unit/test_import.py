@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# `import kis` 동안 발생한 audit event 중 소스 import가 아닌 I/O를 기록합니다.
+AUDIT_SCRIPT = """
+import json, sys
+
+events = []
+code_suffixes = (".py", ".pyc", ".so", ".pth")
+# urllib3가 IPv6 지원 여부 확인을 위해 만드는 local socket은 제외
+network_events = ("socket.connect", "socket.getaddrinfo", "socket.sendto", "urllib.Request")
+
+def hook(event, args):
+    if event == "open":
+        path = str(args[0])
+        if not path.endswith(code_suffixes):
+            events.append([event, path])
+    elif event in network_events:
+        events.append([event, repr(args)[:200]])
+
+sys.addaudithook(hook)
+
+import kis
+import kis.core
+from kis.core.overseas.client import OverseasClient
+
+heavy_modules = [name for name in ("pandas", "numpy") if name in sys.modules]
+print(json.dumps({"events": events, "heavy_modules": heavy_modules}))
+"""
+
+
+class TestImport:
+    def test_import_budget(self, tmp_path):
+        """
+        `import kis`는 pandas를 import하지 않고, 마스터 파일 다운로드/읽기 등
+        디스크/네트워크 I/O를 하지 않아야 합니다.
+        """
+        env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=ROOT_DIR)
+        result = subprocess.run(
+            [sys.executable, "-c", AUDIT_SCRIPT],
+            env=env,
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+
+        assert output["heavy_modules"] == []
+        assert output["events"] == []
+        assert not os.path.exists(os.path.join(str(tmp_path), ".kis"))
@@ -1,4 +1,17 @@
-from kis.core.master import MasterBook
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from kis.core.enum import Exchange
+from kis.core.master import MasterBook, SymbolIndex
+from kis.exceptions import KISBadArguments
 
 
 class TestMaster:
@@ -48,3 +61,581 @@ class TestMaster:
         """NASDAQ 전체 종목 리스트를 pandas dataframe으로 가져옵니다"""
         df = MasterBook.get("NAS")
         assert df is not None
+
+
+OVERSEAS_ROWS = {
+    "NAS": [("AAPL", "애플", "APPLE INC"), ("MSFT", "마이크로소프트", "MICROSOFT CORP")],
+    "NYS": [("KO", "코카콜라", "COCA-COLA CO"), ("DUAL", "중복", "DUAL NYS")],
+    "AMS": [("SPY", "SPDR S&P500 ETF", "SPDR S&P 500"), ("DUAL", "중복", "DUAL AMS")],
+}
+
+
+def write_overseas_master(master_dir, exchange: str, rows):
+    """마스터 파일 형식(tab 구분, cp949)의 해외 종목 파일을 만듭니다."""
+    path = os.path.join(master_dir, exchange.lower(), f"{exchange}MST.COD")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = ["\t".join(["header"] * 24)]
+    for symbol, korean_name, english_name in rows:
+        fields = [""] * 24
+        fields[:10] = ["US", "1", exchange, "", symbol, f"D{exchange}{symbol}"]
+        fields[6:10] = [korean_name, english_name, "2", "USD"]
+        lines.append("\t".join(fields))
+    with open(path, "w", encoding="cp949") as f:
+        f.write("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def master_dir(tmp_path, monkeypatch):
+    """임시 디렉토리를 마스터 파일 저장소로 사용합니다."""
+    import kis.core.master as master
+
+    monkeypatch.setattr(master, "MASTER_DIR", str(tmp_path))
+    monkeypatch.setattr(master.SymbolIndex, "_instances", {})
+    monkeypatch.setattr(master.SymbolSearch, "_instances", {})
+    # 갱신 요청은 접속할 수 없는 주소로 보내 기존 파일을 사용
+    refresher = master.MasterRefresher(base_url="http://127.0.0.1:9/")
+    monkeypatch.setattr(master.MasterRefresher, "_instance", refresher)
+    for exchange, rows in OVERSEAS_ROWS.items():
+        write_overseas_master(str(tmp_path), exchange, rows)
+    return str(tmp_path)
+
+
+class TestSymbolIndex:
+    def test_lookup(self, master_dir):
+        """종목코드로 거래소/종목명을 조회합니다."""
+        index = SymbolIndex.get("USA")
+        assert len(index) == 5
+        assert index.exchange_of("AAPL") == Exchange.NAS
+        assert index.exchange_of("KO") == Exchange.NYS
+        assert index.lookup("SPY").english_name == "SPDR S&P 500"
+        assert index.lookup("MSFT").currency == "USD"
+        assert index.exchange_of("NONE") is None
+        assert "AAPL" in index
+
+        # 여러 거래소에 있는 종목은 앞쪽 거래소(NAS > NYS > AMS)를 우선
+        assert index.exchange_of("DUAL") == Exchange.NYS
+
+        # Exchange.find_symbol도 같은 index를 사용
+        assert Exchange.find_symbol("MSFT") == Exchange.NAS
+        assert SymbolIndex.get("usa") is index
+
+    def test_refresh_if_changed(self, master_dir):
+        """마스터 파일이 갱신되면 index를 다시 만듭니다."""
+        index = SymbolIndex("USA", check_interval=3600)
+        assert index.exchange_of("TSLA") is None
+
+        path = write_overseas_master(
+            master_dir, "NAS", OVERSEAS_ROWS["NAS"] + [("TSLA", "테슬라", "TESLA INC")]
+        )
+        os.utime(path, ns=(0, 0))
+
+        # check_interval 이내에는 파일을 다시 확인하지 않음
+        assert index.refresh_if_changed() is False
+        assert index.refresh_if_changed(force=True) is True
+        assert index.exchange_of("TSLA") == Exchange.NAS
+        assert index.refresh_if_changed(force=True) is False
+
+    def test_invalid_group(self):
+        """지원하지 않는 묶음은 KISBadArguments를 발생시킵니다."""
+        with pytest.raises(KISBadArguments):
+            SymbolIndex("EUR")
+
+
+class TestLazyMaster:
+    def test_load_on_first_access(self, master_dir):
+        """마스터 데이터는 class 정의가 아닌 첫 접근 시점에 읽습니다."""
+        from kis.core.master import LazyMaster
+
+        class Client:
+            SYMBOL_MASTER = LazyMaster("USA")
+
+        descriptor = Client.__dict__["SYMBOL_MASTER"]
+        assert descriptor._df is None
+
+        df = Client.SYMBOL_MASTER
+        assert set(df["symbol"]) == {"AAPL", "MSFT", "KO", "SPY", "DUAL"}
+        assert Client().SYMBOL_MASTER is df
+
+        descriptor.reset()
+        assert descriptor._df is None
+
+
+class TestMasterCache:
+    def test_cache_by_fingerprint(self, master_dir, monkeypatch):
+        """파싱된 DataFrame은 원본 파일의 size/mtime/hash가 같으면 cache를 사용합니다."""
+        from kis.core.master.overseas import OverseasMaster
+
+        master = OverseasMaster("NAS")
+        parsed = []
+        parse_dataframe = OverseasMaster.parse_dataframe
+
+        def counting_parse(self):
+            parsed.append(self.name)
+            return parse_dataframe(self)
+
+        monkeypatch.setattr(OverseasMaster, "parse_dataframe", counting_parse)
+
+        df = master.get_dataframe()
+        assert parsed == ["nas"]
+        assert os.path.exists(master.cache_file)
+
+        # 원본이 그대로면 cache 사용
+        cached = master.get_dataframe()
+        assert parsed == ["nas"]
+        assert cached.equals(df)
+
+        # mtime만 바뀌고 내용이 같으면 hash 비교 후 cache 사용
+        os.utime(master.source_file, ns=(0, 0))
+        master.get_dataframe()
+        assert parsed == ["nas"]
+
+        # 내용이 바뀌면 다시 파싱
+        write_overseas_master(
+            master_dir, "NAS", OVERSEAS_ROWS["NAS"] + [("TSLA", "테슬라", "TESLA INC")]
+        )
+        df = master.get_dataframe()
+        assert parsed == ["nas", "nas"]
+        assert "TSLA" in set(df["symbol"])
+
+        # refresh=True이면 cache 무시
+        master.get_dataframe(refresh=True)
+        assert parsed == ["nas", "nas", "nas"]
+
+        master.clear_cache()
+        assert not os.path.exists(master.cache_file)
+
+
+def make_mst_tail(widths, row: int) -> str:
+    """column마다 숫자/문자/빈 값이 섞인 고정 길이 뒷부분을 만듭니다."""
+    fields = []
+    for i, width in enumerate(widths):
+        kind = i % 5
+        if i == 0:
+            value = ["ST", "EF", "RT"][row % 3]
+        elif kind == 0:
+            value = str(row * 7 + i).zfill(width)[-width:]
+        elif kind == 1:
+            value = "YN"[(row + i) % 2]
+        elif kind == 2:
+            value = "" if row % 3 == 0 else str(row + i)[-width:]
+        elif kind == 3:
+            value = ""
+        else:
+            value = ("A" if row % 2 else "0") * width
+        fields.append(value.rjust(width))
+    return "".join(fields)
+
+
+def write_domestic_master(path: str, widths, rows: int = 30, newline: str = "\n"):
+    """KOSPI/KOSDAQ 마스터 파일 형식(cp949)의 파일을 만듭니다."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    names = ["삼성전자", "SK하이닉스 ", "LG에너지솔루션", "현대차 우", "KODEX 200"]
+    with open(path, "w", encoding="cp949", newline="") as f:
+        for row in range(rows):
+            symbol = f"{row:06d}" if row % 4 else f"{row:05d}K"
+            head = (
+                symbol.ljust(9) + f"KR7{row:08d}0".ljust(12) + names[row % len(names)]
+            )
+            f.write(head + "  " + make_mst_tail(widths, row) + newline)
+
+
+def read_domestic_master_legacy(file_name: str, widths, columns) -> pd.DataFrame:
+    """임시 파일 + read_csv + read_fwf를 사용하던 기존 parser"""
+    dirname = os.path.dirname(file_name)
+    part1_file = os.path.join(dirname, "part1.tmp")
+    part2_file = os.path.join(dirname, "part2.tmp")
+    tail_width = sum(widths) + 1
+    with open(part1_file, mode="w", encoding="cp949") as buffer1, open(
+        part2_file, mode="w"
+    ) as buffer2:
+        with open(file_name, mode="r", encoding="cp949") as f:
+            for row in f:
+                rf1 = row[0 : len(row) - tail_width]
+                buffer1.write(
+                    rf1[0:9].rstrip()
+                    + ","
+                    + rf1[9:21].rstrip()
+                    + ","
+                    + rf1[21:].strip()
+                    + "\n"
+                )
+                buffer2.write(row[-tail_width:])
+    df_part1 = pd.read_csv(
+        part1_file, header=None, names=["단축코드", "표준코드", "한글명"], encoding="cp949"
+    )
+    df_part2 = pd.read_fwf(part2_file, widths=widths, names=columns)
+    return pd.merge(df_part1, df_part2, how="outer", left_index=True, right_index=True)
+
+
+class TestFixedWidthParser:
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_same_as_read_fwf(self, tmp_path, newline):
+        """parse_fixed_width는 기존 read_csv + read_fwf 결과와 column 단위로 같아야 합니다."""
+        from kis.core.master.parser import parse_fixed_width
+
+        widths = [2, 1, 4, 4, 1, 9, 5, 12, 21, 3, 1, 1]
+        columns = [f"column_{i}" for i in range(len(widths))]
+        file_name = os.path.join(str(tmp_path), "kospi_code.mst")
+        write_domestic_master(file_name, widths, newline=newline)
+
+        expected = read_domestic_master_legacy(file_name, widths, columns)
+        df = parse_fixed_width(file_name, widths=widths, columns=columns)
+
+        assert list(df.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+    def test_kospi_master(self, master_dir):
+        """KospiMaster는 임시 파일 없이 마스터 파일을 파싱합니다."""
+        from kis.core.master.kospi import KospiMaster
+
+        master = KospiMaster()
+        write_domestic_master(master.source_file, KospiMaster.FIELD_SPECS, rows=10)
+
+        df = MasterBook.get("KOSPI")
+        assert len(df) == 10
+        assert list(df.columns) == ["symbol", "symbol_name", "group"]
+        assert df["symbol_name"].iloc[0] == "삼성전자"
+        assert sorted(os.listdir(master.cache_dir)) == [
+            "kospi.meta.yaml",
+            "kospi.pkl",
+            "kospi_code.mst",
+        ]
+
+
+class MasterServer:
+    """마스터 zip 파일을 ETag와 함께 제공하는 local HTTP server"""
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                name = self.path.rsplit("/", 1)[-1]
+                with server.lock:
+                    server.requests.append((name, self.headers.get("If-None-Match")))
+                if name not in server.files:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = server.files[name]
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/common/master/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def publish(self, exchange: Exchange, rows):
+        """거래소 마스터 파일을 zip으로 만들어 제공합니다."""
+        with tempfile.TemporaryDirectory() as dirname:
+            path = write_overseas_master(dirname, exchange.name, rows)
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as zip_file:
+                zip_file.write(path, arcname=os.path.basename(path))
+        self.files[exchange.master_file_name] = buffer.getvalue()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def master_server(master_dir, monkeypatch):
+    import kis.core.master as master
+
+    server = MasterServer()
+    for exchange, rows in OVERSEAS_ROWS.items():
+        server.publish(Exchange.from_value(exchange), rows)
+    refresher = master.MasterRefresher(base_url=server.url, default_ttl=3600)
+    monkeypatch.setattr(master.MasterRefresher, "_instance", refresher)
+    yield server
+    server.close()
+
+
+class TestMasterRefresher:
+    def test_conditional_refresh(self, master_server):
+        """TTL이 지난 경우에만 ETag 조건부 요청으로 마스터 파일을 갱신합니다."""
+        from kis.core.master import MasterRefresher
+
+        refresher = MasterRefresher.get()
+        source_file = MasterBook.source_path("NAS")
+        os.remove(source_file)
+
+        # 파일이 없으면 다운로드
+        assert refresher.refresh("NAS") is True
+        assert os.path.exists(source_file)
+        assert master_server.requests == [("nasmst.cod.zip", None)]
+        etag = refresher.load_meta(Exchange.NAS)["etag"]
+
+        # TTL 이내이면 요청하지 않음
+        assert refresher.refresh("NAS") is False
+        assert len(master_server.requests) == 1
+
+        # TTL이 지나면 조건부 요청(304)
+        refresher.ttl[Exchange.NAS] = 0
+        assert refresher.refresh("NAS") is False
+        assert master_server.requests[-1] == ("nasmst.cod.zip", etag)
+
+        # 서버 파일이 바뀌면 새로 받고, 임시 디렉토리는 남기지 않음
+        master_server.publish(Exchange.NAS, [("TSLA", "테슬라", "TESLA INC")])
+        assert refresher.refresh("NAS") is True
+        assert set(MasterBook.get("NAS")["symbol"]) == {"TSLA"}
+        assert (
+            sorted(
+                name
+                for name in os.listdir(os.path.dirname(source_file))
+                if name.startswith(".")
+            )
+            == []
+        )
+
+    def test_missing_source_file(self, master_server):
+        """다운로드 정보가 남아 있어도 마스터 파일이 없으면 조건부 요청 없이 다시 받습니다."""
+        from kis.core.master import MasterRefresher
+
+        refresher = MasterRefresher.get()
+        source_file = MasterBook.source_path("NAS")
+        assert refresher.refresh("NAS", force=True) is True
+        assert refresher.load_meta(Exchange.NAS)["etag"]
+
+        # 같은 ETag로 요청하면 서버는 304를 응답
+        os.remove(source_file)
+        assert refresher.refresh("NAS") is True
+        assert master_server.requests[-1] == ("nasmst.cod.zip", None)
+        assert "AAPL" in set(MasterBook.get("NAS")["symbol"])
+
+    def test_refresh_many(self, master_server):
+        """오래된 거래소만 병렬로 갱신합니다."""
+        from kis.core.master import MasterRefresher
+
+        refresher = MasterRefresher.get()
+        for exchange in ("NYS", "AMS"):
+            os.utime(MasterBook.source_path(exchange), (0, 0))
+
+        results = refresher.refresh_many(["NAS", "NYS", "AMS"])
+        assert results == {Exchange.NAS: False, Exchange.NYS: True, Exchange.AMS: True}
+        assert sorted(name for name, _ in master_server.requests) == [
+            "amsmst.cod.zip",
+            "nysmst.cod.zip",
+        ]
+
+    def test_use_cached_file_on_failure(self, master_dir):
+        """갱신에 실패해도 기존 마스터 파일이 있으면 그대로 사용합니다."""
+        from kis.core.master import MasterRefresher
+
+        os.utime(MasterBook.source_path("NAS"), (0, 0))
+        assert MasterRefresher.get().refresh_if_possible("NAS") is False
+        assert "AAPL" in set(MasterBook.get("NAS")["symbol"])
+
+        os.remove(MasterBook.source_path("NAS"))
+        with pytest.raises(OSError):
+            MasterRefresher.get().refresh_if_possible("NAS")
+
+
+@pytest.fixture
+def krx_master_dir(master_dir):
+    """KOSPI/KOSDAQ 마스터 파일을 추가로 만듭니다."""
+    from kis.core.master.kosdaq import KosdaqMaster
+    from kis.core.master.kospi import KospiMaster
+
+    for master in (KospiMaster(), KosdaqMaster()):
+        write_domestic_master(master.source_file, master.FIELD_SPECS, rows=2000)
+    for exchange in ("NAS", "NYS", "AMS"):
+        rows = [
+            (f"{exchange[0]}{i:04d}", f"종목{i}", f"SYMBOL {i} INC") for i in range(2000)
+        ]
+        write_overseas_master(master_dir, exchange, rows)
+    return master_dir
+
+
+class TestCompactMaster:
+    def test_compact_dtypes(self, krx_master_dir):
+        """Y/N 여부는 bool, code는 category, 정수는 작은 정수 dtype으로 변환합니다."""
+        df = MasterBook.get("KOSPI", with_detail=True, compact=True)
+        full = MasterBook.get("KOSPI", with_detail=True)
+
+        assert df.shape == full.shape
+        assert list(df.columns) == list(full.columns)
+        flag_columns = [
+            column
+            for column in full.columns
+            if set(full[column].dropna()) == {"Y", "N"}
+        ]
+        assert flag_columns
+        for column in flag_columns:
+            assert df[column].dtype == bool
+            assert (df[column] == (full[column] == "Y")).all()
+        assert df["그룹코드"].dtype == "category"
+        assert df["단축코드"].dtype == object
+        assert all(
+            df[column].dtype.itemsize < 8
+            for column in full.columns
+            if full[column].dtype == "int64" and full[column].max() < 2**31
+        )
+
+    def test_projection(self, krx_master_dir):
+        """column을 지정하면 해당 column만 가져옵니다."""
+        df = MasterBook.get("KRX", with_detail=True, columns=["단축코드", "한글명", "KOSPI50"])
+        assert list(df.columns) == ["단축코드", "한글명", "KOSPI50"]
+        assert len(df) == 4000
+        # KOSDAQ에는 없는 column은 NaN
+        assert df["KOSPI50"].isna().sum() == 2000
+
+        df = MasterBook.get("USA", columns=["symbol", "exchange"], compact=True)
+        assert list(df.columns) == ["symbol", "exchange"]
+        assert df["exchange"].dtype == "category"
+        assert set(df["exchange"].cat.categories) == {"NAS", "NYS", "AMS"}
+
+    @pytest.mark.parametrize("name", ["KRX", "USA"])
+    def test_memory_benchmark(self, krx_master_dir, name):
+        """compact 마스터는 기존 마스터보다 메모리를 적게 사용합니다."""
+        full = MasterBook.get(name, with_detail=True)
+        compact = MasterBook.get(name, with_detail=True, compact=True)
+
+        full_bytes = full.memory_usage(deep=True).sum()
+        compact_bytes = compact.memory_usage(deep=True).sum()
+        print(
+            f"{name}: {full_bytes / 1024:.0f}KiB -> {compact_bytes / 1024:.0f}KiB "
+            f"({compact_bytes / full_bytes:.0%})"
+        )
+        assert compact_bytes < full_bytes * 0.6
+
+
+class TestSymbolSearch:
+    def test_search(self, master_dir):
+        """종목코드/한글명/영문명/초성으로 검색하고, 일치 > 앞부분 > 부분 일치 순으로 정렬합니다."""
+        from kis.core.master import SymbolSearch
+
+        search = SymbolSearch.get("USA")
+
+        assert [info.symbol for info in search.search("apple")] == ["AAPL"]
+        assert [info.symbol for info in search.search("aap")] == ["AAPL"]
+        assert [info.symbol for info in search.search("마이크로")] == ["MSFT"]
+        assert [info.symbol for info in search.search("ㅋㅋㅋㄹ")] == ["KO"]
+        assert [info.symbol for info in search.search("ㅋㅋ")] == ["KO"]
+        assert search.search("없는종목") == []
+
+        # 'co': COCA-COLA(영문명 앞부분) > MICROSOFT CORP(영문명 부분 일치)
+        assert [info.symbol for info in search.search("co")] == ["KO", "MSFT"]
+        # 'spy': 종목코드 일치 > 영문명/한글명 부분 일치
+        assert search.search("SPY")[0].symbol == "SPY"
+        assert search.search("s&p 500")[0].exchange == Exchange.AMS
+        assert len(search.search("a", limit=2)) == 2
+
+    def test_persist_with_master_cache(self, master_dir, monkeypatch):
+        """마스터 파일이 그대로이면 저장된 index를 불러오고, 바뀌면 다시 만듭니다."""
+        from kis.core.master import SymbolIndex, SymbolSearch
+
+        search = SymbolSearch("USA").build()
+        assert os.path.exists(search.cache_file)
+
+        built = []
+        build = SymbolIndex.build
+        monkeypatch.setattr(
+            SymbolIndex, "build", lambda self: built.append(self.group) or build(self)
+        )
+        monkeypatch.setattr(SymbolIndex, "_instances", {})
+
+        # 마스터 파일을 파싱하지 않고 저장된 index 사용
+        loaded = SymbolSearch("USA")
+        assert loaded.search("msft")[0].symbol == "MSFT"
+        assert built == []
+
+        # 마스터 파일이 바뀌면 다시 만듦
+        write_overseas_master(
+            master_dir, "NAS", OVERSEAS_ROWS["NAS"] + [("TSLA", "테슬라", "TESLA INC")]
+        )
+        os.utime(MasterBook.source_path("NAS"), ns=(0, 0))
+        assert loaded.refresh_if_changed(force=True) is True
+        assert built == ["USA"]
+        assert loaded.search("ㅌㅅㄹ")[0].symbol == "TSLA"
+
+
+class TestMasterScreener:
+    @pytest.fixture
+    def screener(self, krx_master_dir, monkeypatch):
+        from kis.core.master.screener import MasterScreener
+
+        monkeypatch.setattr(MasterScreener, "_instances", {})
+        return MasterScreener.get("KOSPI")
+
+    def test_filter_and_sort(self, screener):
+        """조건/정렬/상위 N개 조회 결과는 pandas로 직접 계산한 결과와 같아야 합니다."""
+        df = MasterBook.get("KOSPI", with_detail=True).reset_index(drop=True)
+
+        query = MasterBook.screen("KOSPI").where("상장주수", ">=", 3000).filter(그룹코드="ST")
+        expected = df[(df["상장주수"] >= 3000) & (df["그룹코드"] == "ST")]
+        assert 0 < query.count() == len(expected) < len(df)
+        assert query.symbols() == expected["단축코드"].tolist()
+
+        top = query.top(5, by="상장주수")
+        expected_top = expected.sort_values(
+            "상장주수", ascending=False, kind="stable"
+        ).head(5)
+        assert top.symbols() == expected_top["단축코드"].tolist()
+        assert list(top.to_frame(columns=["단축코드", "상장주수"]).columns) == ["단축코드", "상장주수"]
+
+        query = MasterBook.screen("KOSPI").where("상장주수", "between", (5000, 10000))
+        assert query.count() == df["상장주수"].between(5000, 10000).sum()
+        query = MasterBook.screen("KOSPI").where("그룹코드", "in", ["EF", "RT"])
+        assert query.count() == df["그룹코드"].isin(["EF", "RT"]).sum()
+
+    def test_index_same_as_scan(self, screener):
+        """index를 사용한 조건과 전체 scan 조건의 결과가 같아야 합니다."""
+        from kis.core.master.screener import MasterStore
+
+        store = screener.store
+        plain = MasterStore(store.frame)
+        assert store.has_index("그룹코드")
+        assert store.has_index("시가총액")
+        assert not store.has_index("매출액")
+
+        for column, op, value in [
+            ("그룹코드", "==", "EF"),
+            ("그룹코드", "!=", "EF"),
+            ("그룹코드", "not in", ["EF", "ST"]),
+            ("시가총액", ">", 100),
+            ("시가총액", "<=", 100),
+            ("시가총액", "==", 72),
+            ("거래정지", "==", True),
+        ]:
+            assert not plain.has_index(column)
+            indexed = store.mask(column, op, value)
+            assert (indexed == plain.mask(column, op, value)).all(), (column, op, value)
+
+    def test_tradable(self, krx_master_dir, monkeypatch):
+        """거래정지/정리매매/관리종목을 제외합니다(KRX는 거래소별 column 사용)."""
+        from kis.core.master.screener import MasterScreener
+
+        monkeypatch.setattr(MasterScreener, "_instances", {})
+        kospi = MasterBook.get("KOSPI", with_detail=True)
+        kosdaq = MasterBook.get("KOSDAQ", with_detail=True)
+        halted = lambda df, columns: (df[columns] == "Y").any(axis=1)  # noqa: E731
+
+        expected = (~halted(kospi, ["거래정지", "정리매매", "관리종목"])).sum() + (
+            ~halted(kosdaq, ["거래정지 여부", "정리매매 여부", "관리 종목 여부"])
+        ).sum()
+        assert 0 < MasterBook.screen("KRX").tradable().count() == expected
+
+    def test_invalid_arguments(self, screener):
+        """없는 column이나 연산자는 KISBadArguments를 발생시킵니다."""
+        with pytest.raises(KISBadArguments):
+            MasterBook.screen("KOSPI").where("없는컬럼", "==", 1)
+        with pytest.raises(KISBadArguments):
+            MasterBook.screen("KOSPI").where("상장주수", "~", 1)
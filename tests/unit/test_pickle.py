@@ -0,0 +1,63 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+
+def fetch_price(client) -> int:
+    return client.quote.fetch_current_price("005930").stck_prpr
+
+
+def run_in_workers(client, workers: int = 4) -> list:
+    # simulator 주소(get_base_url)를 worker에서도 사용하도록 fork
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(fetch_price, [client] * workers))
+
+
+class TestPickle:
+    def test_roundtrip(self, simulated_domestic_client, simulated_overseas_client):
+        """session 등 하위 객체는 제외하고 client 생성 인자만 저장합니다."""
+        client = simulated_domestic_client
+        client.session
+        client.price_check = "round"
+
+        restored = pickle.loads(pickle.dumps(client))
+        assert "session" not in restored.__dict__
+        assert restored.account == client.account
+        assert restored.token_path == client.token_path
+        assert restored.price_check == "round"
+        assert restored.session is not client.session
+
+        overseas = pickle.loads(pickle.dumps(simulated_overseas_client))
+        assert overseas.exchange == "NAS" and overseas.strict
+
+    def test_profile(self, config_path):
+        """profile_name으로 생성한 client는 credential 없이 profile_name만 저장합니다."""
+        from kis import DomesticClient
+
+        client = DomesticClient(profile_name="first")
+        state = client.__getstate__()
+        assert state["kwargs"]["profile_name"] == "first"
+        assert "app_secret" not in state["kwargs"]
+        assert pickle.loads(pickle.dumps(client)).account == "10000001-01"
+
+
+class TestProcessPool:
+    @pytest.fixture
+    def client(self, kis_simulator, simulated_domestic_client):
+        kis_simulator.set_price("005930", 70000)
+        return simulated_domestic_client
+
+    def test_parent_token(self, kis_simulator, client):
+        """worker는 부모 process가 저장한 token을 재사용합니다."""
+        client.session.ensure_token()
+        assert run_in_workers(client) == [70000] * 4
+        assert kis_simulator.tokens == 1
+
+    def test_cold_workers(self, kis_simulator, client):
+        """token이 없는 상태에서 여러 worker가 동시에 시작해도 token은 한 번만 발급받습니다."""
+        assert run_in_workers(client) == [70000] * 4
+        assert kis_simulator.tokens == 1
+        assert client.session.token.access_token == "token-1"
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from kis import ClientPool, DomesticClient
+from kis.exceptions import KISBadArguments
+
+BALANCE_PATH = "/uapi/domestic-stock/v1/trading/inquire-balance"
+
+
+class TestProfile:
+    def test_is_dev(self, config_path):
+        """config.ini에 문자열로 저장된 모의투자 여부를 bool로 읽습니다."""
+        assert DomesticClient(profile_name="first").is_dev is True
+        assert DomesticClient(profile_name="real").is_dev is False
+
+        with pytest.raises(KISBadArguments):
+            DomesticClient(profile_name="unknown")
+
+    def test_overseas_profile(self, config_path):
+        """OverseasClient도 profile_name으로 생성할 수 있습니다."""
+        from kis import OverseasClient
+
+        client = OverseasClient(profile_name="second", exchange="NAS", strict=True)
+        assert client.account == "10000002-01"
+        assert client.strict and client.exchange == "NAS"
+
+
+class TestClientPool:
+    def test_clients(self, config_path):
+        """profile별 client를 한 번씩 생성하고, 계좌별로 요청 간격과 token을 따로 관리합니다."""
+        pool = ClientPool()
+        assert len(pool) == 3 and "real" in pool
+        assert pool["first"].account == "10000001-01"
+        assert pool["first"].session.scheduler is not pool["second"].session.scheduler
+        assert pool["first"].session.token_path != pool["second"].session.token_path
+
+        # 종목 기준정보는 모의투자 여부별로 공유
+        assert pool["first"].references is pool["second"].references
+        assert pool["first"].references is not pool["real"].references
+
+        with pytest.raises(KISBadArguments):
+            pool["unknown"]
+
+    def test_fetch_balances(self, kis_simulator, config_path):
+        """모든 계좌 잔고를 동시에 조회하고, 실패한 계좌는 결과에 오류로 남깁니다."""
+        kis_simulator.holdings = {"005930": (10, 70000.0)}
+        pool = ClientPool(["first", "second"])
+
+        report = pool.fetch_balances()
+        assert [result.item for result in report] == ["first", "second"]
+        assert not report.failed
+        portfolio, _ = report[0].data
+        assert portfolio[0].pdno == "005930"
+
+        requests = kis_simulator.requests_to(BALANCE_PATH)
+        assert sorted(req.params["CANO"] for req in requests) == [
+            "10000001",
+            "10000002",
+        ]
+        assert os.path.exists(pool["first"].session.token_path)
+        assert kis_simulator.tokens == 2
+
+        def fail(client):
+            if client.profile_name == "second":
+                raise KISBadArguments("failed")
+            return client.account
+
+        report = pool.map(fail)
+        assert report[0].data == "10000001-01"
+        assert [result.item for result in report.failed] == ["second"]
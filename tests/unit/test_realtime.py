@@ -0,0 +1,413 @@
+import asyncio
+import json
+from base64 import b64encode
+
+import numpy as np
+import pandas as pd
+import pytest
+import websockets
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from kis.core.domestic import DomesticClient
+from kis.core.domestic.schema import PriceHistoryByMinutes
+from kis.core.enum import Exchange, RealtimeChannel, Sign
+from kis.core.realtime import (
+    BarAggregator,
+    DomesticTrade,
+    ExecutionNotice,
+    OverseasTrade,
+    RealtimeClient,
+    TickRingBuffer,
+    TickStore,
+    decode_records,
+    decrypt,
+    parse_frame,
+)
+
+CIPHER_KEY = "k" * 32
+CIPHER_IV = "i" * 16
+
+
+def make_domestic_trade(symbol: str, price: int, volume: int) -> str:
+    fields = ["0"] * 46
+    fields[0], fields[1], fields[2], fields[3] = symbol, "093354", str(price), "2"
+    fields[12], fields[21], fields[33] = str(volume), "1", "20230801"
+    return "^".join(fields)
+
+
+def make_overseas_trade(symbol: str, price: float) -> str:
+    fields = ["0"] * 26
+    fields[0], fields[1], fields[4], fields[5] = (
+        f"DNAS{symbol}",
+        symbol,
+        "20230801",
+        "093000",
+    )
+    fields[11], fields[12], fields[19] = str(price), "5", "10"
+    return "^".join(fields)
+
+
+def make_domestic_notice(order_no: str, quantity: int, executed: bool) -> str:
+    fields = ["0"] * 23
+    fields[1], fields[2], fields[4], fields[5] = "1234567801", order_no, "02", "0"
+    fields[8], fields[9], fields[10], fields[11] = (
+        "005930",
+        str(quantity),
+        "71900",
+        "093354",
+    )
+    fields[12], fields[13], fields[14] = "0", "2" if executed else "1", "1"
+    fields[16], fields[18] = "10", "삼성전자"
+    return "^".join(fields)
+
+
+def encrypt(text: str) -> str:
+    cipher = AES.new(CIPHER_KEY.encode(), AES.MODE_CBC, CIPHER_IV.encode())
+    return b64encode(cipher.encrypt(pad(text.encode(), AES.block_size))).decode()
+
+
+@pytest.fixture(name="realtime_client")
+def fixture_realtime_client(tmp_path):
+    client = DomesticClient(
+        app_key="app_key",
+        app_secret="app_secret",
+        account="12345678-01",
+        token_path=str(tmp_path / "token.yaml"),
+    )
+    return client
+
+
+class TestRealtimeSchema:
+    def test_decode_domestic_trades(self):
+        """한 frame에 여러 건이 들어있는 국내 체결가를 record로 변환합니다."""
+        payload = "^".join(
+            [
+                make_domestic_trade("005930", 71900, 10),
+                make_domestic_trade("005930", 72000, 5),
+            ]
+        )
+        frame = parse_frame(f"0|H0STCNT0|002|{payload}")
+        assert frame.count == 2
+        assert not frame.encrypted
+
+        trades = decode_records(frame.tr_id, frame.payload, frame.count)
+        assert [trade.price for trade in trades] == [71900, 72000]
+        assert isinstance(trades[0], DomesticTrade)
+        assert trades[0].diff_sign == Sign.INCREASING
+        assert trades[1].volume == 5
+
+    def test_decode_overseas_trade(self):
+        """해외 체결가 record의 거래소를 실시간 종목코드에서 가져옵니다."""
+        frame = parse_frame(f"0|HDFSCNT0|001|{make_overseas_trade('AAPL', 189.5)}")
+        (trade,) = decode_records(frame.tr_id, frame.payload, frame.count)
+        assert isinstance(trade, OverseasTrade)
+        assert trade.exchange == Exchange.NAS
+        assert trade.price == 189.5
+
+    def test_decrypt_notice(self):
+        """암호화된 체결통보를 복호화하여 ExecutionNotice로 변환합니다."""
+        payload = decrypt(
+            CIPHER_KEY, CIPHER_IV, encrypt(make_domestic_notice("0000117057", 3, True))
+        )
+        (notice,) = decode_records("H0STCNI9", payload)
+        assert isinstance(notice, ExecutionNotice)
+        assert notice.order_no == "0000117057"
+        assert notice.order_type == "buy"
+        assert notice.modify_type == "new"
+        assert notice.is_executed and not notice.is_rejected
+        assert notice.quantity == 3
+        assert notice.price == 71900
+
+
+class TestRealtimeClient:
+    def test_stream_with_reconnect(self, realtime_client: DomesticClient):
+        """로컬 WebSocket 서버에서 구독/수신/재접속 후 재구독을 확인합니다."""
+        received_messages = []
+        connections = []
+
+        async def handler(websocket):
+            connections.append(websocket)
+            async for message in websocket:
+                data = json.loads(message)
+                received_messages.append(data)
+                tr_id = data["body"]["input"]["tr_id"]
+                tr_key = data["body"]["input"]["tr_key"]
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "header": {"tr_id": tr_id, "tr_key": tr_key},
+                            "body": {"rt_cd": "0", "msg1": "SUBSCRIBE SUCCESS"},
+                        }
+                    )
+                )
+                await websocket.send(
+                    json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "0"}})
+                )
+                price = 71900 + len(connections)
+                await websocket.send(
+                    f"0|H0STCNT0|001|{make_domestic_trade(tr_key, price, 1)}"
+                )
+                if len(connections) == 1:
+                    # 첫번째 연결은 서버에서 끊음 -> client 재접속
+                    await websocket.close()
+
+        async def main():
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                realtime = RealtimeClient(
+                    realtime_client,
+                    url=f"ws://127.0.0.1:{port}",
+                    approval_key="approval_key",
+                    reconnect_delay=0.01,
+                )
+                callback_records = []
+                realtime.on(RealtimeChannel.DOMESTIC_TRADE, callback_records.append)
+                await realtime.subscribe_trade("005930")
+
+                stream_records = []
+
+                async def consume():
+                    async for record in realtime.stream(RealtimeChannel.DOMESTIC_TRADE):
+                        stream_records.append(record)
+                        if len(stream_records) == 2:
+                            await realtime.close()
+
+                await asyncio.wait_for(
+                    asyncio.gather(realtime.run(), consume()), timeout=5
+                )
+                return callback_records, stream_records
+
+        callback_records, stream_records = asyncio.run(main())
+
+        assert len(connections) == 2
+        assert [m["header"]["tr_type"] for m in received_messages] == ["1", "1"]
+        assert received_messages[0]["header"]["approval_key"] == "approval_key"
+        assert [r.price for r in stream_records] == [71901, 71902]
+        assert callback_records == stream_records
+
+    def test_drop_malformed_frames(self, realtime_client: DomesticClient):
+        """잘못된 frame은 버리고 같은 연결에서 다음 frame을 계속 수신합니다."""
+        connections = []
+
+        async def handler(websocket):
+            connections.append(websocket)
+            async for message in websocket:
+                tr_key = json.loads(message)["body"]["input"]["tr_key"]
+                await websocket.send("0|H0STCNT0")
+                await websocket.send("0|H0STCNT0|001|garbage")
+                await websocket.send(
+                    "0|H0STCNT0|abc|" + make_domestic_trade(tr_key, 1, 1)
+                )
+                await websocket.send("{not json")
+                await websocket.send(
+                    f"0|H0STCNT0|001|{make_domestic_trade(tr_key, 71900, 1)}"
+                )
+
+        async def main():
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                realtime = RealtimeClient(
+                    realtime_client,
+                    url=f"ws://127.0.0.1:{port}",
+                    approval_key="approval_key",
+                    reconnect_delay=0.01,
+                )
+                records = []
+
+                def on_trade(trade: DomesticTrade):
+                    records.append(trade)
+                    asyncio.ensure_future(realtime.close())
+
+                realtime.on(RealtimeChannel.DOMESTIC_TRADE, on_trade)
+                await realtime.subscribe_trade("005930")
+                await asyncio.wait_for(realtime.run(), timeout=5)
+                return records
+
+        records = asyncio.run(main())
+        assert len(connections) == 1
+        assert [record.price for record in records] == [71900]
+
+    def test_overseas_tr_key(self):
+        """해외주식 구독 key는 'D' + 거래소 + 종목코드 형태입니다."""
+        tr_key = RealtimeClient.get_tr_key(
+            RealtimeChannel.OVERSEAS_TRADE, "AAPL", "NAS"
+        )
+        assert tr_key == "DNASAAPL"
+
+    def test_execution_notice(self, realtime_client: DomesticClient):
+        """체결통보 구독 응답의 key/iv로 암호화된 체결통보를 복호화해 callback에 전달합니다."""
+
+        async def handler(websocket):
+            async for message in websocket:
+                data = json.loads(message)
+                tr_id = data["body"]["input"]["tr_id"]
+                await websocket.send(
+                    json.dumps(
+                        {
+                            "header": {"tr_id": tr_id, "tr_key": "hts_id"},
+                            "body": {
+                                "rt_cd": "0",
+                                "msg1": "SUBSCRIBE SUCCESS",
+                                "output": {"iv": CIPHER_IV, "key": CIPHER_KEY},
+                            },
+                        }
+                    )
+                )
+                for executed in (False, True):
+                    notice = make_domestic_notice("0000117057", 10, executed)
+                    await websocket.send(f"1|{tr_id}|001|{encrypt(notice)}")
+
+        async def main():
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                realtime = RealtimeClient(
+                    realtime_client,
+                    url=f"ws://127.0.0.1:{port}",
+                    approval_key="approval_key",
+                )
+                notices = []
+
+                def on_execution(notice: ExecutionNotice):
+                    notices.append(notice)
+                    if len(notices) == 2:
+                        asyncio.ensure_future(realtime.close())
+
+                realtime.on_execution(on_execution)
+                await realtime.subscribe_executions("hts_id")
+                assert realtime.subscriptions == [("H0STCNI9", "hts_id")]
+                await asyncio.wait_for(realtime.run(), timeout=5)
+                return notices
+
+        notices = asyncio.run(main())
+        assert [notice.is_executed for notice in notices] == [False, True]
+        assert all(notice.order_no == "0000117057" for notice in notices)
+
+
+class TestTickStore:
+    def test_ring_buffer_window(self):
+        """capacity를 넘게 기록해도 최근 틱의 window를 zero-copy view로 조회합니다."""
+        buffer = TickRingBuffer(capacity=4)
+        start = np.datetime64("2023-08-01T09:00:00", "ms")
+        for i in range(10):
+            buffer.append(start + np.timedelta64(i, "s"), 100 + i, i, 99 + i, 101 + i)
+
+        assert len(buffer) == 4
+        assert buffer.total == 10
+
+        window = buffer.window(3)
+        assert window["price"].tolist() == [107, 108, 109]
+        assert np.shares_memory(window, buffer.window())
+        assert buffer.last()["volume"] == 9
+
+    def test_store_parquet(self, tmp_path):
+        """실시간 체결가 record를 종목별로 기록하고 parquet으로 저장합니다."""
+        store = TickStore(capacity=8)
+        payload = "^".join(
+            [
+                make_domestic_trade("005930", 71900, 10),
+                make_domestic_trade("000660", 120000, 5),
+            ]
+        )
+        for trade in decode_records("H0STCNT0", payload, 2):
+            store.append_trade(trade)
+
+        assert set(store) == {"005930", "000660"}
+        assert store["005930"].last()["price"] == 71900
+
+        path = store.to_parquet(str(tmp_path / "ticks.parquet"))
+        df = pd.read_parquet(path)
+        assert df["symbol"].tolist() == ["005930", "000660"]
+        assert df["timestamp"].iloc[0] == pd.Timestamp("2023-08-01 09:33:54")
+
+
+class TestBarAggregator:
+    def test_aggregate_bars(self):
+        """체결 틱을 1분/5분봉으로 집계하고 봉 경계를 넘을 때 완성된 봉을 내보냅니다."""
+        emitted = []
+        aggregator = BarAggregator(
+            timeframes=["1m", 5], on_bar=lambda *args: emitted.append(args)
+        )
+        ticks = [
+            ("090000", 100, 1),
+            ("090010", 105, 2),
+            ("090050", 98, 3),
+            ("090101", 101, 4),
+            ("090459", 110, 5),
+            ("090500", 107, 6),
+        ]
+        for time, price, volume in ticks:
+            aggregator.update("005930", "20230801", time, price, volume)
+
+        assert [
+            (tf, bar.execution_time.strftime("%H%M")) for _, tf, bar in emitted
+        ] == [
+            (1, "0900"),
+            (1, "0901"),
+            (1, "0904"),
+            (5, "0900"),
+        ]
+
+        first = aggregator.histories("005930", "1m")[-1]
+        assert isinstance(first, PriceHistoryByMinutes)
+        assert (first.open, first.highest, first.lowest, first.current) == (
+            100,
+            105,
+            98,
+            98,
+        )
+        assert first.volume == 6
+
+        five = aggregator.histories("005930", "5m")[0]
+        assert (five.open, five.highest, five.lowest, five.current) == (
+            100,
+            110,
+            98,
+            110,
+        )
+        assert five.volume == 15
+
+        (last,) = [bar for _, tf, bar in aggregator.flush() if tf == 1]
+        assert last.current == 107 and last.volume == 6
+
+    def test_late_ticks(self):
+        """늦게 도착한 틱은 지난 봉에 반영하지 않고, 집계 중인 봉의 종가도 바꾸지 않습니다."""
+        aggregator = BarAggregator(timeframes=["1m", "5m"])
+        aggregator.update("005930", "20230801", "090000", 100, 1)
+        aggregator.update("005930", "20230801", "090130", 105, 2)
+        # 09:01봉보다 늦게 도착한 09:00봉, 09:01봉의 틱
+        assert aggregator.update("005930", "20230801", "090059", 90, 3) == []
+        aggregator.update("005930", "20230801", "090110", 103, 4)
+        # 이전 영업일의 틱
+        aggregator.update("005930", "20230731", "153000", 200, 5)
+
+        (first,) = aggregator.histories("005930", "1m")
+        assert (first.current, first.volume) == (100, 1)
+
+        bar = aggregator.current("005930", "1m")
+        assert (bar.open, bar.highest, bar.lowest, bar.current) == (105, 105, 103, 105)
+        assert bar.volume == 6
+
+        five = aggregator.current("005930", "5m")
+        assert (five.lowest, five.current, five.volume) == (90, 105, 10)
+
+    def test_amount_by_business_date(self):
+        """체결 틱에 누적거래대금이 없으면 영업일별로 다시 누적합니다."""
+        aggregator = BarAggregator()
+        aggregator.update("005930", "20230731", "153000", 100, 10)
+        aggregator.update("005930", "20230801", "090000", 110, 2)
+        assert aggregator.current("005930").accumulated_amount == 220
+
+        # 누적거래대금이 있는 늦은 틱은 누적거래대금을 줄이지 않음
+        aggregator.update("005930", "20230801", "090010", 111, 1, 5000)
+        aggregator.update("005930", "20230801", "090005", 110, 1, 4000)
+        assert aggregator.current("005930").accumulated_amount == 5000
+
+    def test_accumulated_volume(self):
+        """REST 현재가 조회처럼 누적거래량만 있는 경우 차이를 체결량으로 사용합니다."""
+        aggregator = BarAggregator()
+        aggregator.update_accumulated("005930", "20230801", "090000", 100, 1000)
+        aggregator.update_accumulated("005930", "20230801", "090030", 101, 1500)
+        bar = aggregator.current("005930")
+        assert bar.volume == 500
+        assert bar.current == 101
@@ -0,0 +1,81 @@
+import os
+
+import pandas as pd
+import pytest
+
+from kis.exceptions import KISBadArguments
+from kis.utils.rebalancing import (
+    compute_rebalance,
+    fetch_prices,
+    to_markdown,
+    write_report,
+)
+
+ITEMS = [
+    {"symbol": "AAPL", "weight": 0.5, "count": 10},
+    {"symbol": "MSFT", "weight": 0.3},
+]
+PRICES = pd.Series({"AAPL": 200.0, "MSFT": 400.0})
+
+
+class TestRebalancing:
+    def test_compute(self):
+        """보유종목 평가금액과 예수금으로 전체 예산을 구하고, 목표 비중에 맞는 주수를 계산합니다."""
+        result = compute_rebalance(
+            ITEMS,
+            PRICES,
+            balance_won=1_300_000,
+            balance_usd=1000,
+            currency=1300,
+            as_won=False,
+        )
+        # 2000(AAPL) + 1000(USD) + 1000(KRW)
+        assert result.total_budget == pytest.approx(4000)
+
+        aapl, msft = result.frame.loc["AAPL"], result.frame.loc["MSFT"]
+        assert aapl["amount"] == 2000 and aapl["pct"] == pytest.approx(0.5)
+        assert aapl["expected_amount"] == pytest.approx(4000 * 0.5 * 0.95)
+        assert aapl["real_count"] == 9 and aapl["real_count_diff"] == -1
+        assert msft["count"] == 0 and msft["real_count"] == 2
+        assert result.real_balance == pytest.approx(4000 - 9 * 200 - 2 * 400)
+
+        won = compute_rebalance(
+            ITEMS, PRICES, balance_won=1_300_000, balance_usd=1000, currency=1300
+        )
+        assert won.total_budget == pytest.approx(4000 * 1300)
+        assert won.frame.loc["AAPL", "price"] == 200 * 1300
+        assert won.frame.loc["AAPL", "real_count"] == 9
+        assert list(won.pretty.columns.get_level_values(0).unique()) == [
+            "AS-IS",
+            "EXPECTED",
+            "REAL",
+        ]
+
+    def test_validation(self):
+        with pytest.raises(KeyError):
+            compute_rebalance([{"symbol": "AAPL"}], PRICES, 0, 1000, 1300)
+        with pytest.raises(ValueError):
+            compute_rebalance(
+                [{"symbol": "AAPL", "weight": 1.1}], PRICES, 0, 1000, 1300
+            )
+
+    def test_fetch_prices(self, kis_simulator, simulated_domestic_client):
+        """현재가를 동시에 조회하고, 실패한 종목이 있으면 오류를 발생시킵니다."""
+        kis_simulator.set_price("005930", 70000)
+        kis_simulator.set_price("000660", 120000)
+
+        prices = fetch_prices(simulated_domestic_client, ["005930", "000660"])
+        assert prices.to_dict() == {"005930": 70000, "000660": 120000}
+
+        with pytest.raises(KISBadArguments):
+            fetch_prices(simulated_domestic_client, ["005930", "999999"])
+
+    def test_report(self, tmp_path):
+        """리포트는 계산과 별도로 Markdown/Excel로 저장합니다."""
+        result = compute_rebalance(
+            ITEMS, PRICES, balance_won=0, balance_usd=1000, currency=1300
+        )
+        assert "## 종목별 상세" in to_markdown(result)
+
+        directory = write_report(result, directory=str(tmp_path / "report"))
+        assert sorted(os.listdir(directory)) == ["detail.xlsx", "summary.md"]
@@ -0,0 +1,147 @@
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from kis.core.base.reference import ReferenceCache, ReferenceData, krx_tick_size
+from kis.exceptions import KISBadArguments
+
+DOMESTIC_ORDER_PATH = "/uapi/domestic-stock/v1/trading/order-cash"
+DOMESTIC_PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+class TestPriceCheck:
+    def test_reject(self, kis_simulator, simulated_domestic_client):
+        """호가단위/가격제한폭에 맞지 않는 주문은 주문 요청 없이 오류를 발생시킵니다."""
+        kis_simulator.set_price("005930", 70000)  # 상한가 91000, 하한가 49000
+        client = simulated_domestic_client
+        client.price_check = "reject"
+
+        with pytest.raises(KISBadArguments):
+            client.order.buy("005930", quantity=1, price=70010)
+        with pytest.raises(KISBadArguments):
+            client.order.buy("005930", quantity=1, price=91100)
+        with pytest.raises(KISBadArguments):
+            client.order.sell("005930", quantity=1, price=48950)
+        assert not kis_simulator.requests_to(DOMESTIC_ORDER_PATH)
+
+        client.order.buy("005930", quantity=1, price=70100)
+        client.order.buy("005930", quantity=1, as_market_price=True)
+        assert len(kis_simulator.requests_to(DOMESTIC_ORDER_PATH)) == 2
+        # 기준정보는 종목별로 한 번만 조회
+        assert len(kis_simulator.requests_to(DOMESTIC_PRICE_PATH)) == 1
+
+    def test_round(self, kis_simulator, simulated_domestic_client):
+        """round인 경우 매수는 내림, 매도는 올림으로 주문가격의 호가단위를 맞춥니다."""
+        kis_simulator.set_price("005930", 70000)
+        # ETF 등 가격대와 무관한 호가단위
+        kis_simulator.set_price("069500", 35000, aspr_unit=5, rprs_mrkt_kor_name="ETF")
+        client = simulated_domestic_client
+        client.price_check = "round"
+
+        report = client.order.submit_basket(
+            [
+                {
+                    "order_type": "buy",
+                    "symbol": "005930",
+                    "quantity": 1,
+                    "price": 70050,
+                },
+                {
+                    "order_type": "sell",
+                    "symbol": "005930",
+                    "quantity": 1,
+                    "price": 70010,
+                },
+                {
+                    "order_type": "buy",
+                    "symbol": "005930",
+                    "quantity": 1,
+                    "price": 49990,
+                },
+                {
+                    "order_type": "buy",
+                    "symbol": "069500",
+                    "quantity": 1,
+                    "price": 35003,
+                },
+            ],
+            priority=None,
+            max_workers=1,
+        )
+
+        assert not report.failed
+        assert [
+            req.body["ORD_UNPR"]
+            for req in kis_simulator.requests_to(DOMESTIC_ORDER_PATH)
+        ] == ["70000", "70100", "49950", "35000"]
+        assert len(kis_simulator.requests_to(DOMESTIC_PRICE_PATH)) == 2
+
+    def test_etf_tick_size(self, kis_simulator, simulated_domestic_client):
+        """ETF는 현재가의 호가단위가 주식과 같더라도 가격대와 무관한 호가단위를 사용합니다."""
+        kis_simulator.set_price("114800", 4990, aspr_unit=5, rprs_mrkt_kor_name="ETF")
+        kis_simulator.set_price("005930", 4990)
+        client = simulated_domestic_client
+        client.price_check = "reject"
+
+        client.order.buy("114800", quantity=1, price=5005)
+        with pytest.raises(KISBadArguments):
+            client.order.buy("005930", quantity=1, price=5005)
+
+        # 대표시장을 알 수 없으면 조회한 호가단위 사용
+        kis_simulator.set_price("000000", 4990, aspr_unit=5, rprs_mrkt_kor_name="")
+        client.order.buy("000000", quantity=1, price=5005)
+        assert len(kis_simulator.requests_to(DOMESTIC_ORDER_PATH)) == 2
+
+    def test_reference_data(self):
+        """해외 주식처럼 소수점 호가단위와 매매단위, 거래가능여부를 검증합니다."""
+        reference = ReferenceData(
+            symbol="AAPL", tick_size=0.01, upper_bound=0, lower_bound=0, lot_size=10
+        )
+        assert reference.check_order("buy", 187.257, 10, rounding=True) == 187.25
+        assert reference.check_order("sell", 187.251, 10, rounding=True) == 187.26
+        assert reference.check_order("buy", 187.25, 20) == 187.25
+        with pytest.raises(KISBadArguments):
+            reference.check_order("buy", 187.257, 10)
+        with pytest.raises(KISBadArguments):
+            reference.check_order("buy", 187.25, 15)
+        with pytest.raises(KISBadArguments):
+            reference._replace(tradable=False).check_order("buy", 187.25, 10)
+
+        assert [krx_tick_size(p) for p in (1999, 2000, 49950, 50000, 500000)] == [
+            1,
+            5,
+            50,
+            100,
+            1000,
+        ]
+
+    def test_cache(self):
+        """동시에 조회해도 종목별로 한 번만 조회하고, 거래일이 바뀌면 다시 조회합니다."""
+        calls = []
+        today = {"date": date(2024, 1, 2)}
+
+        def loader(symbol: str) -> ReferenceData:
+            calls.append(symbol)
+            time.sleep(0.05)
+            return ReferenceData(symbol, tick_size=1, upper_bound=0, lower_bound=0)
+
+        cache = ReferenceCache(loader, session=lambda: today["date"])
+        threads = [
+            threading.Thread(target=cache.get, args=("005930",)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == ["005930"]
+        assert cache.peek("005930").session == date(2024, 1, 2)
+
+        today["date"] = date(2024, 1, 3)
+        assert cache.peek("005930") is None
+        cache.get("005930")
+        assert calls == ["005930", "005930"]
+
+        cache.invalidate("005930")
+        assert len(cache) == 0
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+from kis.core.base.scheduler import RequestScheduler, classify_request
+from kis.core.enum import RequestPriority
+from kis.exceptions import KISBadArguments
+
+
+def run_queued(scheduler: RequestScheduler, priorities) -> list:
+    """전송 순서를 하나 점유한 상태에서 요청을 순서대로 줄 세운 뒤, 실제 전송 순서를 반환합니다."""
+    sent = []
+    lock = threading.Lock()
+
+    def send(priority):
+        scheduler.acquire(priority)
+        with lock:
+            sent.append(priority)
+
+    scheduler.acquire(RequestPriority.CANCEL)
+    threads = []
+    for priority in priorities:
+        thread = threading.Thread(target=send, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.005)  # 줄 서는 순서 고정
+    for thread in threads:
+        thread.join(timeout=10)
+    return sent
+
+
+class TestRequestScheduler:
+    def test_classify(self):
+        """url로 요청 우선순위를 정합니다."""
+        assert classify_request("POST", "/oauth2/tokenP") == RequestPriority.CANCEL
+        assert (
+            classify_request(
+                "POST", "https://host/uapi/domestic-stock/v1/trading/order-rvsecncl"
+            )
+            == RequestPriority.CANCEL
+        )
+        assert (
+            classify_request("POST", "/uapi/domestic-stock/v1/trading/order-cash")
+            == RequestPriority.ORDER
+        )
+        assert (
+            classify_request("GET", "/uapi/overseas-stock/v1/trading/inquire-nccs")
+            == RequestPriority.BALANCE
+        )
+        assert (
+            classify_request("GET", "/uapi/domestic-stock/v1/quotations/inquire-price")
+            == RequestPriority.QUOTE
+        )
+        assert (
+            classify_request("GET", "/uapi/overseas-price/v1/quotations/dailyprice")
+            == RequestPriority.BULK
+        )
+
+    def test_priority(self):
+        """나중에 들어온 취소 요청이 먼저 전송되고, 대량 조회는 다른 요청이 모두 전송된 뒤 전송됩니다."""
+        scheduler = RequestScheduler(interval=0.1)
+        sent = run_queued(
+            scheduler,
+            ["bulk", "bulk", "quote", "bulk", "quote", "order", "cancel"],
+        )
+
+        assert sent == ["cancel", "order", "quote", "quote", "bulk", "bulk", "bulk"]
+        assert scheduler.stats[RequestPriority.BULK] == 3
+        assert scheduler.waiting == 0
+
+    def test_fair_share(self):
+        """같은 가중치의 요청은 먼저 줄 선 순서가 아니라 번갈아 전송됩니다."""
+        scheduler = RequestScheduler(interval=0.05, weights={"quote": 4, "balance": 4})
+        sent = run_queued(scheduler, ["balance"] * 3 + ["quote"] * 3)
+
+        assert sent == ["balance", "quote"] * 3
+
+    def test_interval(self):
+        """우선순위와 관계없이 전송 간격을 유지합니다."""
+        scheduler = RequestScheduler(interval=0.05)
+        started = time.monotonic()
+        for priority in ["cancel", "bulk", "order", "quote"]:
+            scheduler.acquire(priority)
+        assert time.monotonic() - started >= 0.05 * 3 * 0.9
+
+    def test_aborted_waiter(self, monkeypatch):
+        """기다리던 요청이 중단되면 순서를 반납하고, 뒤에 있는 요청은 계속 전송됩니다."""
+        scheduler = RequestScheduler(interval=0.05)
+        scheduler.acquire(RequestPriority.QUOTE)
+
+        wait = scheduler._cond.wait
+
+        def interrupted(timeout=None):
+            monkeypatch.setattr(scheduler._cond, "wait", wait)
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(scheduler._cond, "wait", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            scheduler.acquire(RequestPriority.CANCEL)
+        assert scheduler.waiting == 0
+
+        thread = threading.Thread(target=scheduler.acquire, args=("quote",))
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert scheduler.stats == {RequestPriority.QUOTE: 2}
+
+    def test_priority_context(self):
+        """priority()로 현재 thread의 요청 우선순위를 지정하고, app_key별로 scheduler를 공유합니다."""
+        scheduler = RequestScheduler(interval=0)
+        with scheduler.priority("bulk"):
+            assert scheduler.resolve(RequestPriority.QUOTE) == RequestPriority.BULK
+            scheduler.acquire(RequestPriority.QUOTE)
+        assert scheduler.resolve("order") == RequestPriority.ORDER
+        assert scheduler.stats == {RequestPriority.BULK: 1}
+
+        with pytest.raises(KISBadArguments):
+            scheduler.resolve("urgent")
+
+        assert RequestScheduler.get("app-key") is RequestScheduler.get("app-key")
+        assert RequestScheduler.get("app-key") is not RequestScheduler.get("other-key")
@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kis.core.base.session import REQUEST_MIN_INTERVAL
+from kis.utils.tool import locked_cached_property
+
+PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+THREADS = 16
+
+
+def hammer(client, calls: int = 2) -> list:
+    """THREADS개의 thread에서 동시에 client를 사용합니다."""
+    barrier = threading.Barrier(THREADS)
+
+    def work(_):
+        barrier.wait()
+        sessions = set()
+        for _ in range(calls):
+            sessions.add(id(client.session))
+            client.quote.fetch_current_price("005930")
+        return sessions, id(client.tracker)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(work, range(THREADS)))
+
+
+class TestThreadSafety:
+    @pytest.fixture
+    def client(self, kis_simulator, simulated_domestic_client):
+        kis_simulator.set_price("005930", 70000)
+        return simulated_domestic_client
+
+    def test_single_client(self, kis_simulator, client):
+        """하나의 client를 여러 thread에서 사용해도 session과 token은 하나만 생성합니다."""
+        results = hammer(client)
+
+        assert {session for sessions, _ in results for session in sessions} == {
+            id(client.session)
+        }
+        assert {tracker for _, tracker in results} == {id(client.tracker)}
+        assert kis_simulator.tokens == 1
+
+        requests = kis_simulator.requests_to(PRICE_PATH)
+        assert len(requests) == THREADS * 2
+        received = sorted(req.received_at for req in requests)
+        gaps = [b - a for a, b in zip(received, received[1:])]
+        assert min(gaps) >= REQUEST_MIN_INTERVAL * 0.8
+
+    def test_expired_token(self, kis_simulator, client):
+        """서버에서 token이 만료되면 동시에 실패한 요청이 있어도 한 번만 갱신합니다."""
+        client.quote.fetch_current_price("005930")
+        kis_simulator.expire_token()
+
+        hammer(client, calls=1)
+
+        assert kis_simulator.tokens == 2
+        assert client.session.token.access_token == "token-2"
+        rejected = [
+            req
+            for req in kis_simulator.requests_to(PRICE_PATH)
+            if req.authorization == "Bearer token-1"
+        ]
+        # 첫 요청 + 만료 이후 token-1로 전송된 요청만 실패하고, 모두 token-2로 다시 요청
+        assert (
+            len(kis_simulator.requests_to(PRICE_PATH))
+            == 1 + THREADS + len(rejected) - 1
+        )
+
+    def test_locked_cached_property(self):
+        """처음 접근하는 thread가 여러 개여도 한 번만 생성합니다."""
+
+        class Resource:
+            created = 0
+
+            @locked_cached_property
+            def value(self):
+                Resource.created += 1
+                threading.Event().wait(0.05)
+                return object()
+
+        resource = Resource()
+        barrier = threading.Barrier(8)
+
+        def get(_):
+            barrier.wait()
+            return resource.value
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = set(map(id, executor.map(get, range(8))))
+
+        assert Resource.created == 1
+        assert values == {id(resource.value)}
@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+
+from kis.core.base.session import REQUEST_MIN_INTERVAL
+from kis.core.enum import OrderStatus
+from kis.core.realtime.schema import ExecutionNotice
+from kis.exceptions import KISBadArguments
+
+DOMESTIC_EXECUTED_PATH = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+
+
+def notice(order_no: str, **kwargs) -> ExecutionNotice:
+    fields = dict(
+        account="5000000001",
+        order_no=order_no,
+        original_order_no="",
+        order_type="buy",
+        modify_type="new",
+        symbol="005930",
+        quantity=10,
+        price=70000.0,
+        time="090000",
+        is_rejected=False,
+        is_executed=False,
+        accept_type="1",
+        order_quantity=10,
+        symbol_name="삼성전자",
+        is_overseas=False,
+    )
+    fields.update(kwargs)
+    return ExecutionNotice(**fields)
+
+
+class TestOrderTracker:
+    @pytest.fixture
+    def tracker(self, kis_simulator, simulated_domestic_client):
+        # 미체결 내역 조회는 실거래 모드에서만 가능
+        simulated_domestic_client.is_dev = False
+        tracker = simulated_domestic_client.tracker
+        tracker.market_open = lambda: True
+        return tracker
+
+    def test_poll(self, kis_simulator, tracker):
+        """미체결 내역으로 일부 체결을, 사라진 주문은 당일 체결 내역으로 최종 상태를 판단합니다."""
+        partial = tracker.submit(
+            {"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000}
+        )
+        filled = tracker.submit(
+            {"order_type": "sell", "symbol": "000660", "quantity": 5, "price": 120000}
+        )
+        rejected = tracker.submit(
+            {"order_type": "buy", "symbol": "035720", "quantity": 3, "price": 50000}
+        )
+        assert {order.status for order in tracker.orders()} == {OrderStatus.ACCEPTED}
+
+        kis_simulator.fill(partial.order_no, 4)
+        assert tracker.poll()
+        assert partial.status == OrderStatus.PARTIALLY_FILLED
+        assert partial.filled_quantity == 4
+        # 사라진 주문이 없으면 체결 내역은 조회하지 않음
+        assert not kis_simulator.requests_to(DOMESTIC_EXECUTED_PATH)
+
+        kis_simulator.fill(filled.order_no, 5, price=120500)
+        kis_simulator.reject(rejected.order_no)
+        assert tracker.poll()
+        assert filled.status == OrderStatus.FILLED
+        assert filled.average_price == 120500
+        assert rejected.status == OrderStatus.REJECTED
+        assert len(kis_simulator.requests_to(DOMESTIC_EXECUTED_PATH)) == 1
+
+        # 변화가 없으면 조회 간격을 늘림
+        before = tracker.next_interval()
+        assert not tracker.poll()
+        assert tracker.next_interval() > before
+        assert tracker.open_orders() == [partial]
+
+    def test_cancel_and_update(self, kis_simulator, tracker):
+        """취소된 주문은 CANCELLED, 정정된 주문은 새 주문번호로 이어서 추적합니다."""
+        cancelled = tracker.submit(
+            {"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000}
+        )
+        updated = tracker.submit(
+            {"order_type": "sell", "symbol": "000660", "quantity": 5, "price": 120000}
+        )
+        order = tracker.client.order
+        order.cancel(org_no="91252", order_no=cancelled.order_no, total=True)
+        order.update(
+            org_no="91252", order_no=updated.order_no, price=121000, total=True
+        )
+
+        tracker.poll()
+
+        assert cancelled.status == OrderStatus.CANCELLED
+        assert updated.status == OrderStatus.CANCELLED
+        replaced = tracker[updated.replaced_by]
+        assert replaced.status == OrderStatus.ACCEPTED
+        assert replaced.quantity == 5 and replaced.order_type == "sell"
+
+    def test_notice(self, tracker):
+        """체결통보만으로 상태를 갱신하고, 주문 완료를 기다리는 thread를 깨웁니다."""
+        order = tracker.track("0000000001", "005930", "buy", 10, price=70000)
+        done = []
+        waiter = threading.Thread(target=lambda: done.append(order.wait(timeout=5)))
+        waiter.start()
+
+        tracker.apply_notice(notice("0000000001"))
+        tracker.apply_notice(
+            notice("0000000001", is_executed=True, quantity=4, price=69900)
+        )
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert not done
+
+        tracker.apply_notice(
+            notice("0000000001", is_executed=True, quantity=6, price=70000)
+        )
+        waiter.join(timeout=5)
+        assert done == [True]
+        assert order.status == OrderStatus.FILLED
+        assert order.average_price == pytest.approx(69960)
+
+        # 추적하지 않던 주문의 접수 통보는 추적 목록에 추가
+        other = tracker.apply_notice(
+            notice("0000000002", symbol="000660", order_type="sell")
+        )
+        assert tracker["0000000002"] is other and other.order_type == "sell"
+
+        tracker.apply_notice(
+            notice("0000000003", original_order_no="0000000002", modify_type="cancel")
+        )
+        assert other.status == OrderStatus.CANCELLED
+        assert tracker.wait_all(timeout=0)
+
+        with pytest.raises(KISBadArguments):
+            tracker["9999999999"]
+
+    def test_next_interval(self, tracker):
+        """미체결 주문 수와 장 운영시간에 따라 조회 간격을 정합니다."""
+        market = {"open": True}
+        tracker.market_open = lambda: market["open"]
+        assert tracker.next_interval() is None
+
+        tracker.track("0000000001", "005930", "buy", 10)
+        assert tracker.next_interval() == tracker.min_interval
+
+        for i in range(2, 201):
+            tracker.track(f"{i:010d}", "005930", "buy", 10)
+        # 200건: 4회 연속조회, 요청 한도의 request_share만 사용
+        assert tracker.next_interval() == pytest.approx(
+            4 * REQUEST_MIN_INTERVAL / tracker.request_share
+        )
+
+        market["open"] = False
+        assert tracker.next_interval() == tracker.closed_interval
+
+    def test_background(self, kis_simulator, tracker):
+        """background thread가 미체결 주문을 조회해 완료 상태를 반영합니다."""
+        tracker.min_interval = 0.05
+        order = tracker.submit(
+            {"order_type": "buy", "symbol": "005930", "quantity": 10, "price": 70000}
+        )
+        kis_simulator.fill(order.order_no, 10)
+
+        with tracker:
+            assert order.wait(timeout=5)
+        assert not tracker.is_running
+        assert order.status == OrderStatus.FILLED